@@ -0,0 +1,130 @@
+"""
+Compares the memory retained by the entities of a network when stored as nested feature dicts (the default)
+and as the compact, slotted entities of networkinfotranslator.entities, and the peak memory allocated while building
+them, each entity being converted as soon as it is built as the importers do. The same is then measured on the import
+of a synthetic model carrying layout and render information, with and without compact_entities.
+
+usage: python benchmarks/benchmark_entity_memory.py [number of reactions] [sbml reader]
+"""
+import sys
+import time
+import tracemalloc
+from networkinfotranslator.entities import compact_graphical_object
+from networkinfotranslator.imports.sbml_readers import create_sbml_importer, default_sbml_reader
+from synthetic_models import create_synthetic_model
+
+
+def create_species(index):
+    return {'referenceId': "S" + str(index), 'id': "S" + str(index) + "_glyph", 'index': 0, 'compartment': "c",
+            'features': {'boundingBox': {'x': 10.0 * index, 'y': 20.0, 'width': 60.0, 'height': 36.0},
+                         'graphicalShape': {'strokeColor': "black", 'strokeWidth': 2.0, 'fillColor': "white",
+                                            'geometricShapes': [{'shape': "rectangle", 'strokeColor': "black",
+                                                                 'strokeWidth': 2.0, 'fillColor': "white",
+                                                                 'x': {'abs': 0.0, 'rel': 0.0},
+                                                                 'y': {'abs': 0.0, 'rel': 0.0},
+                                                                 'width': {'abs': 0.0, 'rel': 100.0},
+                                                                 'height': {'abs': 0.0, 'rel': 100.0},
+                                                                 'rx': {'abs': 6.0, 'rel': 0.0},
+                                                                 'ry': {'abs': 6.0, 'rel': 0.0}}]}},
+            'texts': [{'features': {'plainText': "S" + str(index),
+                                    'boundingBox': {'x': 10.0 * index, 'y': 20.0, 'width': 60.0, 'height': 36.0},
+                                    'graphicalText': {'strokeColor': "black", 'fontFamily': "sans-serif",
+                                                      'fontSize': {'abs': 12.0, 'rel': 0.0},
+                                                      'hTextAnchor': "middle", 'vTextAnchor': "middle"}}}]}
+
+
+def create_species_reference(reaction_id, index, role):
+    return {'reaction': reaction_id, 'reaction_glyph_index': 0, 'species': "S" + str(index),
+            'species_glyph_id': "S" + str(index) + "_glyph", 'species_reference_glyph_index': 0,
+            'id': reaction_id + "_S" + str(index), 'referenceId': reaction_id + "_S" + str(index), 'role': role,
+            'features': {'startPoint': {'x': 10.0, 'y': 20.0}, 'startSlope': 0.0,
+                         'endPoint': {'x': 50.0, 'y': 60.0}, 'endSlope': 3.14,
+                         'curve': [{'startX': 10.0, 'startY': 20.0, 'endX': 50.0, 'endY': 60.0,
+                                    'basePoint1X': 20.0, 'basePoint1Y': 30.0,
+                                    'basePoint2X': 40.0, 'basePoint2Y': 50.0}],
+                         'graphicalCurve': {'strokeColor': "black", 'strokeWidth': 2.0,
+                                            'heads': {'end': "productHead"}}}}
+
+
+def create_reaction(index):
+    reaction_id = "R" + str(index)
+    return {'referenceId': reaction_id, 'id': reaction_id + "_glyph", 'index': 0, 'compartment': "c",
+            'features': {'boundingBox': {'x': 10.0 * index, 'y': 80.0, 'width': 10.0, 'height': 10.0},
+                         'graphicalShape': {'strokeColor': "black", 'strokeWidth': 2.0,
+                                            'geometricShapes': [{'shape': "ellipse", 'fillColor': "black",
+                                                                 'cx': {'abs': 0.0, 'rel': 50.0},
+                                                                 'cy': {'abs': 0.0, 'rel': 50.0},
+                                                                 'rx': {'abs': 0.0, 'rel': 50.0},
+                                                                 'ry': {'abs': 0.0, 'rel': 50.0}}]},
+                         'curve': [{'startX': 10.0, 'startY': 80.0, 'endX': 20.0, 'endY': 80.0}],
+                         'graphicalCurve': {'strokeColor': "black", 'strokeWidth': 2.0, 'heads': {}}},
+            'speciesReferences': [create_species_reference(reaction_id, index, "substrate"),
+                                  create_species_reference(reaction_id, index + 1, "product")]}
+
+
+def iterate_entities(number_of_reactions):
+    for index in range(number_of_reactions + 1):
+        yield create_species(index)
+    for index in range(number_of_reactions):
+        yield create_reaction(index)
+
+
+def measure(create):
+    tracemalloc.start()
+    start = time.perf_counter()
+    entities = create()
+    elapsed = time.perf_counter() - start
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return entities, size, peak, elapsed
+
+
+def import_model(sbml, sbml_reader, compact_entities):
+    import_from_sbml = create_sbml_importer(sbml_reader, compact_entities=compact_entities)
+    import_from_sbml.extract_info(sbml)
+    import_from_sbml.extract_entity_features()
+    return import_from_sbml
+
+
+def measure_access(entities):
+    start = time.perf_counter()
+    total = 0.0
+    for entity in entities:
+        if 'features' in entity and 'boundingBox' in entity['features']:
+            total += entity['features']['boundingBox']['x'] + entity['features']['boundingBox']['width']
+        if 'speciesReferences' in entity:
+            for species_reference in entity['speciesReferences']:
+                for segment in species_reference['features']['curve']:
+                    total += segment['startX'] + segment['endX']
+    return time.perf_counter() - start
+
+
+def main(number_of_reactions, sbml_reader):
+    dict_entities, dict_size, dict_peak, dict_time = measure(lambda: list(iterate_entities(number_of_reactions)))
+    compact_entities, compact_size, compact_peak, compact_time = \
+        measure(lambda: [compact_graphical_object(entity) for entity in iterate_entities(number_of_reactions)])
+    assert [entity.to_dict() for entity in compact_entities] == dict_entities
+    print("entities:", len(dict_entities), "(" + str(number_of_reactions) + " reactions)")
+    print("dict form:    {:10.2f} MB, peak {:10.2f} MB, built in {:.3f} s, accessed in {:.3f} s".format(
+        dict_size / 1e6, dict_peak / 1e6, dict_time, measure_access(dict_entities)))
+    print("compact form: {:10.2f} MB, peak {:10.2f} MB, built in {:.3f} s, accessed in {:.3f} s".format(
+        compact_size / 1e6, compact_peak / 1e6, compact_time, measure_access(compact_entities)))
+    print("ratio:        {:10.2f}, peak {:10.2f}".format(compact_size / dict_size, compact_peak / dict_peak))
+    del dict_entities, compact_entities
+
+    sbml = create_synthetic_model(number_of_reactions)
+    dict_import, dict_size, dict_peak, dict_time = measure(lambda: import_model(sbml, sbml_reader, False))
+    del dict_import
+    compact_import, compact_size, compact_peak, compact_time = measure(lambda: import_model(sbml, sbml_reader, True))
+    del compact_import
+    print("import of the synthetic model with {}:".format(sbml_reader))
+    print("dict form:    {:10.2f} MB, peak {:10.2f} MB, imported in {:.3f} s".format(
+        dict_size / 1e6, dict_peak / 1e6, dict_time))
+    print("compact form: {:10.2f} MB, peak {:10.2f} MB, imported in {:.3f} s".format(
+        compact_size / 1e6, compact_peak / 1e6, compact_time))
+    print("ratio:        {:10.2f}, peak {:10.2f}".format(compact_size / dict_size, compact_peak / dict_peak))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+         sys.argv[2] if len(sys.argv) > 2 else default_sbml_reader)
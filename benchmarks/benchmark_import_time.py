@@ -0,0 +1,42 @@
+"""
+Times `import networkinfotranslator` in fresh interpreters, and checks that it stays under a target and loads none of
+the native backends, which are only imported with the importer or exporter classes using them.
+
+usage: python benchmarks/benchmark_import_time.py [target in seconds] [number of interpreters]
+"""
+import json
+import subprocess
+import sys
+
+backend_modules = ["libsbml", "libsbmlnetwork", "skia", "PIL", "matplotlib", "sbne"]
+
+import_script = """
+import json
+import sys
+import time
+start = time.perf_counter()
+import networkinfotranslator
+elapsed = time.perf_counter() - start
+print(json.dumps({'time': elapsed, 'backends': [name for name in %r if name in sys.modules]}))
+""" % backend_modules
+
+
+def time_package_import():
+    output = subprocess.run([sys.executable, "-c", import_script], check=True, capture_output=True, text=True).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(target, number_of_interpreters):
+    results = [time_package_import() for interpreter in range(number_of_interpreters)]
+    best_time = min(result['time'] for result in results)
+    loaded_backends = sorted(set(backend for result in results for backend in result['backends']))
+    print("import networkinfotranslator: best {:.3f} s, median {:.3f} s over {} interpreters".format(
+        best_time, sorted(result['time'] for result in results)[len(results) // 2], len(results)))
+    print("native backends loaded: {}".format(", ".join(loaded_backends) if loaded_backends else "none"))
+    assert not loaded_backends
+    assert best_time < target
+
+
+if __name__ == '__main__':
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.1, int(sys.argv[2]) if len(sys.argv) > 2 else 5)
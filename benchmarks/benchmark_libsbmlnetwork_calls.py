@@ -0,0 +1,56 @@
+"""
+Counts the libsbmlnetwork calls made by the SBML importer to extract the features of a model,
+in total, per method and per glyph, and checks that the model-wide and per-glyph properties are read once.
+
+usage: python benchmarks/benchmark_libsbmlnetwork_calls.py <sbml file> [number of methods to list]
+"""
+import sys
+import time
+from collections import Counter
+import libsbmlnetwork
+from networkinfotranslator.imports.import_sbml import NetworkInfoImportFromSBMLModel
+
+calls = Counter()
+
+
+class CountingLibSBMLNetwork(libsbmlnetwork.LibSBMLNetwork):
+    def __getattribute__(self, name):
+        attribute = super().__getattribute__(name)
+        if not name.startswith('_') and callable(attribute):
+            calls[name] += 1
+        return attribute
+
+
+def count_glyphs(import_from_sbml):
+    number_of_glyphs = len(import_from_sbml.compartments) + len(import_from_sbml.species) + \
+                       len(import_from_sbml.reactions) + len(import_from_sbml.additional_graphical_objects)
+    number_of_species_references = sum(len(reaction['speciesReferences']) for reaction in import_from_sbml.reactions)
+    return number_of_glyphs, number_of_species_references
+
+
+def main(sbml_file_name, number_of_methods):
+    import_from_sbml = NetworkInfoImportFromSBMLModel()
+    import_from_sbml.extract_info(CountingLibSBMLNetwork(sbml_file_name))
+    calls.clear()
+    start = time.perf_counter()
+    import_from_sbml.extract_entity_features()
+    elapsed = time.perf_counter() - start
+    number_of_glyphs, number_of_species_references = count_glyphs(import_from_sbml)
+    total_calls = sum(calls.values())
+
+    print("glyphs:", number_of_glyphs, "species references:", number_of_species_references)
+    print("libsbmlnetwork calls: {} ({:.1f} per glyph), extracted in {:.3f} s".format(
+        total_calls, total_calls / max(number_of_glyphs + number_of_species_references, 1), elapsed))
+    for name, count in calls.most_common(number_of_methods):
+        print("  {:60s} {:8d}".format(name, count))
+
+    # canvas values are read once per model
+    assert calls['getCanvasWidth'] <= 1 and calls['getCanvasHeight'] <= 1
+    # the bounding box of a glyph is read once
+    assert calls['getX'] <= number_of_glyphs
+    # the number of curve segments of a species reference is read once
+    assert calls['getNumSpeciesReferenceCurveSegments'] <= number_of_species_references
+
+
+if __name__ == '__main__':
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 20)
@@ -0,0 +1,70 @@
+"""
+Times the import of synthetic network editor graphs of growing size, and checks that the time per edge stays
+about the same, i.e. that finding the species references of the reactions scales linearly with the number of edges.
+
+usage: python benchmarks/benchmark_network_editor_import.py [number of reactions of the smallest graph] [number of sizes]
+"""
+import gc
+import sys
+import time
+from networkinfotranslator.imports.import_network_editor import NetworkInfoImportFromNetworkEditor
+
+
+def create_node(node_id, category, x, y, width, height):
+    return {'id': node_id, 'position': {'x': x, 'y': y}, 'dimensions': {'width': width, 'height': height},
+            'style': {'category': category, 'name': node_id + "_style",
+                      'shapes': [{'shape': "rectangle", 'border-color': "#000080", 'border-width': 2.0,
+                                  'fill-color': "#ffffff", 'x': -0.5 * width, 'y': -0.5 * height,
+                                  'width': width, 'height': height},
+                                 {'plain-text': node_id, 'font-family': "sans-serif", 'font-size': 12.0,
+                                  'font-color': "#000000", 'x': -0.5 * width, 'y': -0.5 * height,
+                                  'width': width, 'height': height}]}}
+
+
+def create_edge(edge_id, source_node, target_node, role):
+    return {'id': edge_id, 'source': {'node': source_node, 'position': {'x': 0.0, 'y': 0.0}},
+            'target': {'node': target_node, 'position': {'x': 100.0, 'y': 100.0}},
+            'style': {'category': "SpeciesReference", 'sub-category': role, 'name': edge_id + "_style",
+                      'shapes': [{'shape': "line", 'border-color': "#000080", 'border-width': 2.0,
+                                  'p1': {'x': 0.0, 'y': 0.0}, 'p2': {'x': 100.0, 'y': 100.0}}]}}
+
+
+def create_graph(number_of_reactions):
+    nodes = []
+    edges = []
+    for index in range(number_of_reactions + 1):
+        nodes.append(create_node("S" + str(index), "Species", 100.0 * index, 0.0, 60.0, 36.0))
+    for index in range(number_of_reactions):
+        reaction_id = "R" + str(index)
+        nodes.append(create_node(reaction_id, "Reaction", 100.0 * index + 50.0, 100.0, 20.0, 20.0))
+        edges.append(create_edge(reaction_id + "_S" + str(index), "S" + str(index), reaction_id, "substrate"))
+        edges.append(create_edge(reaction_id + "_S" + str(index + 1), reaction_id, "S" + str(index + 1), "product"))
+    return {'position': {'x': 0.0, 'y': 0.0}, 'dimensions': {'width': 100.0 * (number_of_reactions + 1),
+                                                             'height': 200.0},
+            'background-color': "#ffffff", 'nodes': nodes, 'edges': edges}
+
+
+def main(number_of_reactions, number_of_sizes):
+    times_per_edge = []
+    for size_index in range(number_of_sizes):
+        graph = create_graph(number_of_reactions * 2 ** size_index)
+        import_from_network_editor = NetworkInfoImportFromNetworkEditor()
+        # as in timeit, the cyclic garbage collector, whose passes grow with the heap, is kept out of the timing
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        import_from_network_editor.extract_info(graph)
+        import_from_network_editor.extract_entity_features()
+        elapsed = time.perf_counter() - start
+        gc.enable()
+        times_per_edge.append(elapsed / len(graph['edges']))
+        print("nodes: {:7d} edges: {:7d} imported in {:.3f} s ({:.1f} us per edge)".format(
+            len(graph['nodes']), len(graph['edges']), elapsed, 1e6 * times_per_edge[-1]))
+
+    # a quadratic discovery of the species references doubles the time per edge at each size
+    print("time per edge growth: {:.2f}x".format(times_per_edge[-1] / times_per_edge[0]))
+    assert times_per_edge[-1] < 1.5 * times_per_edge[0]
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1250, int(sys.argv[2]) if len(sys.argv) > 2 else 4)
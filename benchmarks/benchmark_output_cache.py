@@ -0,0 +1,65 @@
+"""
+Times the export of a synthetic model carrying layout and render information to a format, in fresh interpreters, with
+an empty output cache and then with the one filled by the first export, and checks that the outputs are the same and
+that the cache hit loads none of the native backends. An export with the default, empty, file name is run first, which
+is to complete with the cache as it does without it, writing nothing to either.
+
+usage: python benchmarks/benchmark_output_cache.py [number of reactions of the model] [format: png, jpg, pdf or svg]
+       [sbml reader]
+"""
+import filecmp
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from networkinfotranslator.imports.sbml_readers import default_sbml_reader
+from synthetic_models import create_synthetic_model
+
+backend_modules = ["libsbml", "libsbmlnetwork", "skia", "PIL", "matplotlib", "sbne"]
+
+export_script = """
+import json
+import sys
+import time
+start = time.perf_counter()
+import networkinfotranslator
+networkinfotranslator.import_sbml_export_figure(sys.argv[1], sys.argv[2], sbml_reader=sys.argv[3], cache=sys.argv[4])
+elapsed = time.perf_counter() - start
+print(json.dumps({'time': elapsed, 'backends': [name for name in %r if name in sys.modules]}))
+""" % backend_modules
+
+
+def time_export(model_file_name, output_file_name, sbml_reader, cache_dir):
+    output = subprocess.run([sys.executable, "-c", export_script, model_file_name, output_file_name, sbml_reader,
+                             cache_dir], check=True, capture_output=True, text=True).stdout
+
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(number_of_reactions, file_format, sbml_reader):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        model_file_name = os.path.join(temp_dir, "model.xml")
+        with open(model_file_name, 'w', encoding='utf8') as model_file:
+            model_file.write(create_synthetic_model(number_of_reactions))
+        cache_dir = os.path.join(temp_dir, "cache")
+        time_export(model_file_name, "", sbml_reader, cache_dir)
+        cached_files_without_name = os.listdir(cache_dir)
+        # the exporters cut the file name at its first dot
+        miss = time_export(model_file_name, os.path.join(temp_dir, "miss." + file_format), sbml_reader, cache_dir)
+        hit = time_export(model_file_name, os.path.join(temp_dir, "hit." + file_format), sbml_reader, cache_dir)
+        same_outputs = filecmp.cmp(os.path.join(temp_dir, "miss." + file_format),
+                                   os.path.join(temp_dir, "hit." + file_format), shallow=False)
+    print("{} reactions to {}: miss {:.3f} s, hit {:.3f} s ({:.0f}x)".format(
+        number_of_reactions, file_format, miss['time'], hit['time'], miss['time'] / hit['time']))
+    print("native backends loaded on a hit: {}".format(", ".join(hit['backends']) if hit['backends'] else "none"))
+    print("files cached by the export with no file name: {}".format(len(cached_files_without_name)))
+    assert not cached_files_without_name
+    assert same_outputs
+    assert not hit['backends']
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         sys.argv[2] if len(sys.argv) > 2 else "png",
+         sys.argv[3] if len(sys.argv) > 3 else default_sbml_reader)
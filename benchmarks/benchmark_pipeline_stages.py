@@ -0,0 +1,189 @@
+"""
+Times each stage of the pipeline on synthetic models carrying layout and render information, of growing size:
+the import of the model, the extraction of the features of its entities, the building of the Skia scene, its
+rasterization, the encoding of the image as png and each of the other exports. The memory used by each stage, and by
+the stages of the importer and exporters nested in it, is then measured on a separate run, as tracing the Python
+allocations slows them down. The results are written as JSON, along with the commit they were measured at, and
+compared with the ones of an earlier run if given.
+
+usage: python benchmarks/benchmark_pipeline_stages.py <output json file>
+       [json file of an earlier run to compare with, or - for none] [number of reactions of the models, comma separated]
+       [number of repeats] [sbml reader]
+"""
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import traceback
+from networkinfotranslator.imports.sbml_readers import create_sbml_importer, default_sbml_reader
+from networkinfotranslator.tracing import span, set_tracer
+from networkinfotranslator.memory_usage import MemoryStageCollector, get_peak_rss, reset_peak_rss
+from synthetic_models import create_synthetic_model
+
+# the exporters timed after the figure, by the name of their stage, as (module, class, format of the export)
+exporter_stages = {
+    "export_pdf": ("networkinfotranslator.exports.export_figure_skia", "NetworkInfoExportToSkia", "pdf"),
+    "export_svg": ("networkinfotranslator.exports.export_figure_skia", "NetworkInfoExportToSkia", "svg"),
+    "export_network_editor": ("networkinfotranslator.exports.export_network_editor",
+                              "NetworkInfoExportToNetworkEditor", "json"),
+    "export_cytoscapejs": ("networkinfotranslator.exports.export_cytoscapejs", "NetworkInfoExportToCytoscapeJs",
+                           "js"),
+    "export_escher": ("networkinfotranslator.exports.export_escher", "NetworkInfoExportToEscher", "json"),
+    "export_sbml": ("networkinfotranslator.exports.export_sbml", "NetworkInfoExportToSBMLModel", "xml"),
+}
+
+
+def get_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def get_exporter_class(module_name, class_name):
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def time_stages(sbml, sbml_reader, output_file_base):
+    """returns the time each stage took in seconds on the model, or the formatted traceback of the error it raised"""
+    times = {}
+    start = time.perf_counter()
+    with span("import"):
+        import_from_sbml = create_sbml_importer(sbml_reader)
+        import_from_sbml.extract_info(sbml)
+    times['import'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with span("extract_entity_features"):
+        import_from_sbml.extract_entity_features()
+    times['extract_entity_features'] = time.perf_counter() - start
+
+    skia_exporter_class = get_exporter_class("networkinfotranslator.exports.export_figure_skia",
+                                             "NetworkInfoExportToSkia")
+    start = time.perf_counter()
+    with span("build_scene"):
+        export_to_skia = skia_exporter_class()
+        export_to_skia.extract_graph_info(import_from_sbml)
+    times['build_scene'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with span("rasterize"):
+        image = export_to_skia._get_image()
+    times['rasterize'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with span("encode_png"):
+        image.encodeToData()
+    times['encode_png'] = time.perf_counter() - start
+
+    for stage, (module_name, class_name, file_format) in exporter_stages.items():
+        start = time.perf_counter()
+        try:
+            with span(stage):
+                exporter = get_exporter_class(module_name, class_name)()
+                exporter.extract_graph_info(import_from_sbml)
+                exporter.export(output_file_base + "_" + stage + "." + file_format)
+            times[stage] = time.perf_counter() - start
+        except Exception:
+            times[stage] = traceback.format_exc()
+
+    return times
+
+
+def benchmark_model(number_of_reactions, number_of_repeats, sbml_reader, output_file_base):
+    sbml = create_synthetic_model(number_of_reactions)
+    best_times = {}
+    for repeat in range(number_of_repeats):
+        for stage, stage_time in time_stages(sbml, sbml_reader, output_file_base).items():
+            if isinstance(stage_time, str) or isinstance(best_times.get(stage), str):
+                best_times[stage] = best_times.get(stage, stage_time)
+            elif stage not in best_times or stage_time < best_times[stage]:
+                best_times[stage] = stage_time
+
+    return best_times
+
+
+def measure_memory(sbml, sbml_reader, output_file_base):
+    """
+    Returns, by the path of the stages, the memory they allocated and still held at their end ("allocated"), their
+    peak allocated memory ("peak_allocated"), the growth of the resident set size ("rss") and the peak resident set
+    size ("peak_rss") in bytes, plus the bytes of the Skia surfaces ("surface_bytes"), and the peak resident set size
+    of the whole run ("peak_rss").
+    """
+    memory_collector = MemoryStageCollector()
+    previous_tracer = set_tracer(memory_collector)
+    reset_peak_rss()
+    try:
+        time_stages(sbml, sbml_reader, output_file_base)
+    finally:
+        set_tracer(previous_tracer)
+        memory_collector.close()
+    stages = {path: {name: stage[name] for name in ["allocated", "peak_allocated", "rss", "peak_rss", "surface_bytes"]
+                     if name in stage}
+              for path, stage in memory_collector.get_breakdown().items()}
+
+    return {'peak_rss': get_peak_rss(), 'stages': stages}
+
+
+def compare_results(results, earlier_results):
+    print("compared with commit {}:".format(earlier_results.get('commit')))
+    for model_name, times in results['models'].items():
+        earlier_times = earlier_results['models'].get(model_name, {})
+        for stage, stage_time in times.items():
+            earlier_time = earlier_times.get(stage)
+            if isinstance(stage_time, float) and isinstance(earlier_time, float) and earlier_time > 0.0:
+                print("  {:12s} {:24s} {:8.3f} s -> {:8.3f} s ({:+.0f}%)".format(
+                    model_name, stage, earlier_time, stage_time, 100.0 * (stage_time / earlier_time - 1.0)))
+        memory = results['memory'][model_name]
+        earlier_memory = earlier_results.get('memory', {}).get(model_name)
+        if earlier_memory and memory['peak_rss'] and earlier_memory['peak_rss']:
+            print("  {:12s} {:24s} {:8.1f} MB -> {:8.1f} MB".format(
+                model_name, "peak_rss", earlier_memory['peak_rss'] / 2 ** 20, memory['peak_rss'] / 2 ** 20))
+        for path, stage in memory['stages'].items():
+            earlier_stage = earlier_memory['stages'].get(path) if earlier_memory else None
+            if earlier_stage and "/" not in path:
+                print("  {:12s} {:24s} {:8.1f} MB -> {:8.1f} MB peak allocated".format(
+                    model_name, path, earlier_stage.get('peak_allocated', 0) / 2 ** 20,
+                    stage.get('peak_allocated', 0) / 2 ** 20))
+
+
+def main(output_file_name, earlier_file_name, model_sizes, number_of_repeats, sbml_reader):
+    results = {'commit': get_commit(), 'python': platform.python_version(), 'sbml_reader': sbml_reader,
+               'number_of_repeats': number_of_repeats, 'models': {}, 'memory': {}}
+    for number_of_reactions in model_sizes:
+        model_name = "reactions_" + str(number_of_reactions)
+        times = benchmark_model(number_of_reactions, number_of_repeats, sbml_reader,
+                                # the exporters cut the file name at its first dot
+                                os.path.abspath(os.path.splitext(output_file_name)[0]) + "_" + model_name)
+        results['models'][model_name] = times
+        for stage, stage_time in times.items():
+            if isinstance(stage_time, str):
+                print("{:12s} {:24s}   failed: {}".format(model_name, stage, stage_time.strip().splitlines()[-1]))
+            else:
+                print("{:12s} {:24s} {:8.3f} s".format(model_name, stage, stage_time))
+        memory = measure_memory(create_synthetic_model(number_of_reactions), sbml_reader,
+                                os.path.abspath(os.path.splitext(output_file_name)[0]) + "_" + model_name)
+        results['memory'][model_name] = memory
+        for path, stage in memory['stages'].items():
+            if "/" not in path:
+                print("{:12s} {:24s} {:8.1f} MB peak allocated, {:8.1f} MB resident set growth".format(
+                    model_name, path, stage.get('peak_allocated', 0) / 2 ** 20, stage.get('rss', 0) / 2 ** 20))
+        if memory['peak_rss']:
+            print("{:12s} {:24s} {:8.1f} MB".format(model_name, "peak_rss", memory['peak_rss'] / 2 ** 20))
+    with open(output_file_name, 'w', encoding='utf8') as output_file:
+        json.dump(results, output_file, indent=1)
+    if earlier_file_name:
+        with open(earlier_file_name, encoding='utf8') as earlier_file:
+            compare_results(results, json.load(earlier_file))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1],
+         sys.argv[2] if len(sys.argv) > 2 and sys.argv[2] != "-" else None,
+         [int(size) for size in sys.argv[3].split(",")] if len(sys.argv) > 3 else [10, 100, 1000],
+         int(sys.argv[4]) if len(sys.argv) > 4 else 3,
+         sys.argv[5] if len(sys.argv) > 5 else default_sbml_reader)
@@ -0,0 +1,73 @@
+"""
+Compares the SBML readers on the same corpus of models: for each reader whose library is installed, times the import
+and feature extraction of every model, and checks that it finds as many entities as the default reader.
+
+usage: python benchmarks/benchmark_sbml_readers.py <sbml file or directory of sbml files> [number of repeats]
+"""
+import os
+import sys
+import time
+from networkinfotranslator.imports.sbml_readers import sbml_readers, default_sbml_reader, get_sbml_reader
+
+
+def list_sbml_files(path):
+    if os.path.isdir(path):
+        return sorted(os.path.join(path, file_name) for file_name in os.listdir(path)
+                      if file_name.endswith(".xml") or file_name.endswith(".sbml"))
+
+    return [path]
+
+
+def count_entities(import_from_sbml):
+    return (len(import_from_sbml.compartments), len(import_from_sbml.species), len(import_from_sbml.reactions),
+            sum(len(reaction['speciesReferences']) for reaction in import_from_sbml.reactions))
+
+
+def import_sbml_file(importer_class, sbml_file_name, number_of_repeats):
+    best_time = None
+    for repeat in range(number_of_repeats):
+        start = time.perf_counter()
+        import_from_sbml = importer_class()
+        import_from_sbml.extract_info(sbml_file_name)
+        import_from_sbml.extract_entity_features()
+        elapsed = time.perf_counter() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+
+    return best_time, count_entities(import_from_sbml)
+
+
+def main(path, number_of_repeats):
+    sbml_file_names = list_sbml_files(path)
+    reference_counts = {}
+    reader_names = [default_sbml_reader] + [name for name in sbml_readers if name != default_sbml_reader]
+    for reader_name in reader_names:
+        try:
+            importer_class = get_sbml_reader(reader_name)
+        except ImportError as error:
+            print("{:16s} unavailable ({})".format(reader_name, error))
+            continue
+        total_time = 0.0
+        number_of_failures = 0
+        number_of_mismatches = 0
+        for sbml_file_name in sbml_file_names:
+            try:
+                elapsed, counts = import_sbml_file(importer_class, sbml_file_name, number_of_repeats)
+            except Exception as error:
+                print("  {}: {} failed: {}".format(reader_name, sbml_file_name, error))
+                number_of_failures += 1
+                continue
+            total_time += elapsed
+            # the entities found by the default reader are the reference of the others
+            reference_counts.setdefault(sbml_file_name, counts)
+            if counts != reference_counts[sbml_file_name]:
+                print("  {}: {} has (compartments, species, reactions, species references) {}, expected {}".format(
+                    reader_name, sbml_file_name, counts, reference_counts[sbml_file_name]))
+                number_of_mismatches += 1
+        print("{:16s} {:8.3f} s for {} models ({} failed, {} mismatched)".format(
+            reader_name, total_time, len(sbml_file_names) - number_of_failures, number_of_failures,
+            number_of_mismatches))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 3)
@@ -0,0 +1,274 @@
+"""
+Generates synthetic SBML models carrying layout and render information, of configurable size, for the benchmarks:
+a chain of reactions, each converting a species into the next one under a modifier, laid out on a grid, with the
+curves of the species references split into cubic bezier segments, labels of a given length and species filled with
+gradients.
+
+usage: python benchmarks/synthetic_models.py <output sbml file> [number of reactions] [number of curve segments]
+       [label length] [number of gradients]
+"""
+import sys
+import libsbml
+
+species_width = 80.0
+species_height = 40.0
+reaction_spacing = 200.0
+row_spacing = 160.0
+reactions_per_row = 20
+
+
+def create_synthetic_model(number_of_reactions=100, number_of_curve_segments=1, label_length=8,
+                           number_of_gradients=4):
+    """
+    Returns the SBML string of a model with number_of_reactions reactions and number_of_reactions + 1 species, plus
+    one modifier species every other reaction, whose species reference curves have number_of_curve_segments cubic
+    bezier segments, whose species names (the text of their labels) are label_length characters long, and whose
+    species are filled with one of number_of_gradients linear gradients, or a plain color if there are none.
+    """
+    document = libsbml.SBMLDocument(3, 1)
+    document.enablePackage(libsbml.LayoutExtension.getXmlnsL3V1V1(), "layout", True)
+    document.setPackageRequired("layout", False)
+    document.enablePackage(libsbml.RenderExtension.getXmlnsL3V1V1(), "render", True)
+    document.setPackageRequired("render", False)
+    model = document.createModel()
+    model.setId("synthetic_model")
+    compartment = model.createCompartment()
+    compartment.setId("cell")
+    compartment.setConstant(True)
+    compartment.setSize(1.0)
+
+    number_of_species = number_of_reactions + 1
+    # every other reaction has a modifier
+    modifier_indices = set(range(0, number_of_reactions, 2))
+    for species_index in range(number_of_species):
+        create_species(model, "S" + str(species_index), label_length)
+    for modifier_index in sorted(modifier_indices):
+        create_species(model, "M" + str(modifier_index), label_length)
+    for reaction_index in range(number_of_reactions):
+        reaction = model.createReaction()
+        reaction.setId("R" + str(reaction_index))
+        reaction.setReversible(False)
+        reaction.setFast(False)
+        create_species_reference(reaction.createReactant(), "S" + str(reaction_index))
+        create_species_reference(reaction.createProduct(), "S" + str(reaction_index + 1))
+        if reaction_index in modifier_indices:
+            reaction.createModifier().setSpecies("M" + str(reaction_index))
+
+    number_of_rows = number_of_species // reactions_per_row + 1
+    layout = model.getPlugin("layout").createLayout()
+    layout.setId("synthetic_layout")
+    layout.getDimensions().setWidth(reaction_spacing * (reactions_per_row + 1))
+    layout.getDimensions().setHeight(row_spacing * number_of_rows)
+    compartment_glyph = layout.createCompartmentGlyph()
+    compartment_glyph.setId("cell_glyph")
+    compartment_glyph.setCompartmentId("cell")
+    set_bounding_box(compartment_glyph, 0.0, 0.0, reaction_spacing * (reactions_per_row + 1),
+                     row_spacing * number_of_rows)
+    for species_index in range(number_of_species):
+        x, y = get_species_position(species_index)
+        create_species_glyph(layout, "S" + str(species_index), x, y)
+    for modifier_index in sorted(modifier_indices):
+        x, y = get_species_position(modifier_index)
+        create_species_glyph(layout, "M" + str(modifier_index), x + 0.5 * reaction_spacing, y - 0.4 * row_spacing)
+    for reaction_index in range(number_of_reactions):
+        x, y = get_reaction_position(reaction_index)
+        reaction_glyph = layout.createReactionGlyph()
+        reaction_glyph.setId("R" + str(reaction_index) + "_glyph")
+        reaction_glyph.setReactionId("R" + str(reaction_index))
+        set_bounding_box(reaction_glyph, x - 5.0, y - 5.0, 10.0, 10.0)
+        species_references = [("S" + str(reaction_index), "substrate",
+                               get_species_center(*get_species_position(reaction_index))),
+                              ("S" + str(reaction_index + 1), "product",
+                               get_species_center(*get_species_position(reaction_index + 1)))]
+        if reaction_index in modifier_indices:
+            modifier_x, modifier_y = get_species_position(reaction_index)
+            species_references.append(("M" + str(reaction_index), "modifier",
+                                       get_species_center(modifier_x + 0.5 * reaction_spacing,
+                                                          modifier_y - 0.4 * row_spacing)))
+        for species_id, role, species_center in species_references:
+            species_reference_glyph = reaction_glyph.createSpeciesReferenceGlyph()
+            species_reference_glyph.setId(reaction_glyph.getId() + "_" + species_id)
+            species_reference_glyph.setSpeciesGlyphId(species_id + "_glyph")
+            species_reference_glyph.setRole(role)
+            create_curve(species_reference_glyph.getCurve(), (x, y), species_center, number_of_curve_segments)
+
+    create_render_information(layout, number_of_gradients)
+
+    return libsbml.writeSBMLToString(document)
+
+
+def create_species(model, species_id, label_length):
+    species = model.createSpecies()
+    species.setId(species_id)
+    species.setName((species_id + "_" + "x" * label_length)[:label_length])
+    species.setCompartment("cell")
+    species.setInitialConcentration(1.0)
+    species.setHasOnlySubstanceUnits(False)
+    species.setBoundaryCondition(False)
+    species.setConstant(False)
+
+
+def create_species_reference(species_reference, species_id):
+    species_reference.setSpecies(species_id)
+    species_reference.setConstant(True)
+    species_reference.setStoichiometry(1.0)
+
+
+def get_species_position(species_index):
+    row, column = divmod(species_index, reactions_per_row)
+    return reaction_spacing * column + 20.0, row_spacing * row + 0.5 * row_spacing
+
+
+def get_species_center(x, y):
+    return x + 0.5 * species_width, y + 0.5 * species_height
+
+
+def get_reaction_position(reaction_index):
+    start_x, start_y = get_species_center(*get_species_position(reaction_index))
+    end_x, end_y = get_species_center(*get_species_position(reaction_index + 1))
+    return 0.5 * (start_x + end_x), 0.5 * (start_y + end_y)
+
+
+def create_species_glyph(layout, species_id, x, y):
+    species_glyph = layout.createSpeciesGlyph()
+    species_glyph.setId(species_id + "_glyph")
+    species_glyph.setSpeciesId(species_id)
+    set_bounding_box(species_glyph, x, y, species_width, species_height)
+    text_glyph = layout.createTextGlyph()
+    text_glyph.setId(species_id + "_text")
+    text_glyph.setGraphicalObjectId(species_id + "_glyph")
+    text_glyph.setOriginOfTextId(species_id)
+    set_bounding_box(text_glyph, x, y, species_width, species_height)
+
+
+def set_bounding_box(glyph, x, y, width, height):
+    bounding_box = glyph.getBoundingBox()
+    bounding_box.setX(x)
+    bounding_box.setY(y)
+    bounding_box.setWidth(width)
+    bounding_box.setHeight(height)
+
+
+def create_curve(curve, start, end, number_of_segments):
+    # splits the straight path from the start to the end into segments bulging alternately on each side of it
+    for segment_index in range(number_of_segments):
+        segment_start = interpolate(start, end, segment_index / number_of_segments)
+        segment_end = interpolate(start, end, (segment_index + 1) / number_of_segments)
+        bulge = 10.0 if segment_index % 2 == 0 else -10.0
+        segment = curve.createCubicBezier()
+        set_point(segment.getStart(), segment_start)
+        set_point(segment.getEnd(), segment_end)
+        set_point(segment.getBasePoint1(), (segment_start[0] + (segment_end[0] - segment_start[0]) / 3.0,
+                                            segment_start[1] + bulge))
+        set_point(segment.getBasePoint2(), (segment_start[0] + 2.0 * (segment_end[0] - segment_start[0]) / 3.0,
+                                            segment_end[1] + bulge))
+
+
+def interpolate(start, end, ratio):
+    return start[0] + ratio * (end[0] - start[0]), start[1] + ratio * (end[1] - start[1])
+
+
+def set_point(point, coordinates):
+    point.setX(coordinates[0])
+    point.setY(coordinates[1])
+
+
+def create_render_information(layout, number_of_gradients):
+    render_information = layout.getPlugin("render").createLocalRenderInformation()
+    render_information.setId("synthetic_render")
+    render_information.setBackgroundColor("#FFFFFF")
+    for color_id, color_value in [("black", "#000000"), ("white", "#FFFFFF"), ("compartment_fill", "#F5F5DC"),
+                                  ("species_fill", "#E0FFFF"), ("species_stroke", "#000080"),
+                                  ("reaction_stroke", "#2F4F4F")]:
+        color_definition = render_information.createColorDefinition()
+        color_definition.setId(color_id)
+        color_definition.setColorValue(color_value)
+    for gradient_index in range(number_of_gradients):
+        gradient = render_information.createLinearGradientDefinition()
+        gradient.setId("gradient_" + str(gradient_index))
+        gradient.setPoint1(libsbml.RelAbsVector(0.0, 0.0), libsbml.RelAbsVector(0.0, 0.0))
+        gradient.setPoint2(libsbml.RelAbsVector(0.0, 100.0), libsbml.RelAbsVector(0.0, 100.0))
+        for offset, stop_color in [(0.0, "#FFFFFF"), (100.0, "#{:02X}{:02X}FF".format(
+                (40 * gradient_index) % 256, (80 * gradient_index) % 256))]:
+            gradient_stop = gradient.createGradientStop()
+            gradient_stop.setOffset(libsbml.RelAbsVector(0.0, offset))
+            gradient_stop.setStopColor(stop_color)
+    line_ending = render_information.createLineEnding()
+    line_ending.setId("arrow_head")
+    line_ending.setEnableRotationalMapping(True)
+    set_bounding_box(line_ending, -10.0, -5.0, 10.0, 10.0)
+    line_ending.getGroup().setStroke("reaction_stroke")
+    line_ending.getGroup().setFillColor("reaction_stroke")
+    arrow = line_ending.getGroup().createPolygon()
+    for x, y in [(0.0, 0.0), (100.0, 50.0), (0.0, 100.0)]:
+        arrow.createPoint().setCoordinates(libsbml.RelAbsVector(0.0, x), libsbml.RelAbsVector(0.0, y))
+
+    create_style(render_information, "compartment_style", "COMPARTMENTGLYPH", "black", 2.0, "compartment_fill",
+                 "rectangle")
+    create_style(render_information, "species_style", "SPECIESGLYPH", "species_stroke", 2.0, "species_fill",
+                 "rectangle")
+    create_style(render_information, "reaction_style", "REACTIONGLYPH", "reaction_stroke", 2.0, "reaction_stroke",
+                 "ellipse")
+    create_style(render_information, "species_reference_style", "SPECIESREFERENCEGLYPH", "reaction_stroke", 2.0)
+    product_style = create_style(render_information, "product_style", None, "reaction_stroke", 2.0)
+    product_style.addRole("product")
+    product_style.getGroup().setEndHead("arrow_head")
+    text_style = create_style(render_information, "text_style", "TEXTGLYPH", "black", 1.0)
+    text_style.getGroup().setFontFamily("sans-serif")
+    text_style.getGroup().setFontSize(libsbml.RelAbsVector(12.0, 0.0))
+    text_style.getGroup().setTextAnchor("middle")
+    text_style.getGroup().setVTextAnchor("middle")
+    # the species filled with a gradient are listed by id, the other ones keep the style of their type
+    if number_of_gradients:
+        gradient_styles = [render_information.createLocalStyle() for gradient_index in range(number_of_gradients)]
+        for gradient_index, gradient_style in enumerate(gradient_styles):
+            gradient_style.setId("gradient_style_" + str(gradient_index))
+            set_style_group(gradient_style.getGroup(), "species_stroke", 2.0, "gradient_" + str(gradient_index),
+                            "rectangle")
+        species_glyph_ids = [species_glyph.getId() for species_glyph in layout.getListOfSpeciesGlyphs()]
+        for species_index, species_glyph_id in enumerate(species_glyph_ids):
+            gradient_styles[species_index % number_of_gradients].addId(species_glyph_id)
+
+
+def create_style(render_information, style_id, glyph_type, stroke, stroke_width, fill=None, shape=None):
+    style = render_information.createLocalStyle()
+    style.setId(style_id)
+    if glyph_type:
+        style.addType(glyph_type)
+    set_style_group(style.getGroup(), stroke, stroke_width, fill, shape)
+
+    return style
+
+
+def set_style_group(render_group, stroke, stroke_width, fill=None, shape=None):
+    render_group.setStroke(stroke)
+    render_group.setStrokeWidth(stroke_width)
+    if fill:
+        render_group.setFillColor(fill)
+    if shape == "rectangle":
+        rectangle = render_group.createRectangle()
+        rectangle.setCoordinatesAndSize(libsbml.RelAbsVector(0.0, 0.0), libsbml.RelAbsVector(0.0, 0.0),
+                                        libsbml.RelAbsVector(0.0, 0.0), libsbml.RelAbsVector(0.0, 100.0),
+                                        libsbml.RelAbsVector(0.0, 100.0))
+        rectangle.setRX(libsbml.RelAbsVector(6.0, 0.0))
+        rectangle.setRY(libsbml.RelAbsVector(6.0, 0.0))
+    elif shape == "ellipse":
+        ellipse = render_group.createEllipse()
+        ellipse.setCX(libsbml.RelAbsVector(0.0, 50.0))
+        ellipse.setCY(libsbml.RelAbsVector(0.0, 50.0))
+        ellipse.setRX(libsbml.RelAbsVector(0.0, 50.0))
+        ellipse.setRY(libsbml.RelAbsVector(0.0, 50.0))
+
+
+def main(output_file_name, number_of_reactions, number_of_curve_segments, label_length, number_of_gradients):
+    with open(output_file_name, 'w', encoding='utf8') as sbml_file:
+        sbml_file.write(create_synthetic_model(number_of_reactions, number_of_curve_segments, label_length,
+                                               number_of_gradients))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1],
+         int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 1,
+         int(sys.argv[4]) if len(sys.argv) > 4 else 8,
+         int(sys.argv[5]) if len(sys.argv) > 5 else 4)
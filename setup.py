@@ -27,6 +27,8 @@ setup(
         "Operating System :: OS Independent",
     ],
     scripts=["testcases/test1.py"],
+    entry_points={"console_scripts": ["networkinfotranslator=networkinfotranslator.batch_convert:main",
+                                      "networkinfotranslator-service=networkinfotranslator.render_service:main"]},
     package_dir={"": "src"},
     packages=find_packages(where="src"),
     install_requires=requirements,
@@ -1 +1,19 @@
 from .network_info_translator import *
+from . import network_info_translator
+import types
+
+
+# the importer and exporter classes are loaded on first use (see network_info_translator.lazy_attributes)
+def __getattr__(name):
+    if name in network_info_translator.lazy_attributes:
+        return getattr(network_info_translator, name)
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(network_info_translator.lazy_attributes))
+
+
+# "from networkinfotranslator import *" still provides the classes, loading all their backends
+__all__ = [name for name, value in globals().items() if not name.startswith("_") and
+           not isinstance(value, types.ModuleType)] + list(network_info_translator.lazy_attributes)
@@ -0,0 +1,312 @@
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from multiprocessing.connection import wait
+from .imports.sbml_readers import create_sbml_importer, sbml_readers
+from .exports.fan_out_export import export_targets, export_graph_info, get_target_file_name
+from .tracing import set_tracer
+from .memory_usage import MemoryStageCollector, get_peak_rss, reset_peak_rss
+
+# the extensions of the input files by the format they are imported from
+input_formats = {
+    ".xml": "sbml",
+    ".sbml": "sbml",
+    ".json": "network_editor",
+}
+
+
+def list_input_files(paths, output_directory=None, targets=()):
+    """
+    Returns the (input file, output name) pairs of the files found in the paths, which are files, directories
+    searched recursively or glob patterns, where the output name is the path of the file relative to the directory it
+    was found in, without its extension.
+
+    The output directory is not searched when it is within a directory searched, and the files found in the
+    directories or by the patterns are skipped if they are the files one of the targets would write for another
+    input, so that the outputs of an earlier run are not converted again. The inputs with the same output name, like a.xml and
+    a.json, keep their extension in it (a_xml and a_json), so that they do not overwrite the outputs of each other.
+    """
+    input_files = {}
+    found_files = set()
+    if output_directory is not None:
+        output_directory = os.path.abspath(output_directory)
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, directory_names, file_names in os.walk(path):
+                directory_names[:] = sorted(directory_name for directory_name in directory_names
+                                            if os.path.abspath(os.path.join(directory, directory_name)) !=
+                                            output_directory)
+                for file_name in sorted(file_names):
+                    if os.path.splitext(file_name)[1].lower() in input_formats:
+                        input_file = os.path.join(directory, file_name)
+                        found_files.add(input_file)
+                        input_files.setdefault(input_file,
+                                               os.path.splitext(os.path.relpath(input_file, path))[0])
+        elif glob.has_magic(path):
+            for input_file in sorted(glob.glob(path, recursive=True)):
+                if os.path.isfile(input_file) and os.path.splitext(input_file)[1].lower() in input_formats:
+                    found_files.add(input_file)
+                    input_files.setdefault(input_file, os.path.splitext(os.path.basename(input_file))[0])
+        else:
+            input_files.setdefault(path, os.path.splitext(os.path.basename(path))[0])
+    if output_directory is not None and targets:
+        output_files = set(output_file for output_name in input_files.values()
+                           for output_file in get_output_files(get_output_file_base(output_directory, output_name),
+                                                               targets))
+        input_files = {input_file: output_name for input_file, output_name in input_files.items()
+                       if input_file not in found_files or os.path.abspath(input_file) not in output_files}
+    output_name_counts = {}
+    for output_name in input_files.values():
+        output_name_counts[output_name] = output_name_counts.get(output_name, 0) + 1
+
+    return [(input_file, output_name if output_name_counts[output_name] == 1 else
+             output_name + "_" + os.path.splitext(input_file)[1][1:].lower()) for input_file, output_name in
+            input_files.items()]
+
+
+def get_output_file_base(output_directory, output_name):
+    # the exporters cut the file name at its first dot, so it is made absolute not to start with one
+    return os.path.abspath(os.path.join(output_directory, output_name))
+
+
+def get_input_format(input_file):
+    return input_formats.get(os.path.splitext(input_file)[1].lower(), "sbml")
+
+
+def get_output_files(output_file_base, targets):
+    return [get_target_file_name(output_file_base, target) for target in targets]
+
+
+def is_up_to_date(input_file, output_files):
+    """returns whether all the output files exist and none of them is older than the input file"""
+    try:
+        input_time = os.path.getmtime(input_file)
+        return all(os.path.getmtime(output_file) >= input_time for output_file in output_files)
+    except OSError:
+        return False
+
+
+def convert_file(input_file, output_file_base, targets, sbml_reader=None, **import_options):
+    """
+    Imports a model and exports it to each of the targets, writing the files named after output_file_base.
+
+    Returns the time the import took in seconds ("import_time") and the result of each target ("targets"),
+    as returned by export_graph_info.
+    """
+    start = time.perf_counter()
+    if get_input_format(input_file) == "network_editor":
+        from .imports.import_network_editor import NetworkInfoImportFromNetworkEditor
+        graph_info = NetworkInfoImportFromNetworkEditor()
+    else:
+        graph_info = create_sbml_importer(sbml_reader, **import_options)
+    graph_info.extract_info(input_file)
+    import_time = time.perf_counter() - start
+    directory = os.path.dirname(output_file_base)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    return {'import_time': import_time, 'targets': export_graph_info(graph_info, targets, output_file_base, 1)}
+
+
+def run_conversion(input_file, output_file_base, targets, options, trace_memory=False):
+    start = time.perf_counter()
+    result = {'input_file': input_file, 'status': "converted", 'error': None}
+    # the peak resident set size of the worker is reset to measure the one of each file, where supported
+    reset_peak_rss()
+    if trace_memory:
+        memory_collector = MemoryStageCollector()
+        previous_tracer = set_tracer(memory_collector)
+    try:
+        result.update(convert_file(input_file, output_file_base, targets, **options))
+        if any(target_result['error'] for target_result in result['targets'].values()):
+            result['status'] = "failed"
+    except Exception:
+        result['status'] = "failed"
+        result['error'] = traceback.format_exc()
+    finally:
+        if trace_memory:
+            set_tracer(previous_tracer)
+            memory_collector.close()
+    result['time'] = time.perf_counter() - start
+    result['peak_rss'] = get_peak_rss()
+    if trace_memory:
+        result['memory'] = {path: {name: stage[name] for name in ["allocated", "peak_allocated", "rss",
+                                                                   "surface_bytes"] if name in stage}
+                            for path, stage in memory_collector.get_breakdown().items()}
+
+    return result
+
+
+def run_worker(connection, options, trace_memory):
+    # converts the files sent by the parent process one at a time, until it is sent None
+    while True:
+        task = connection.recv()
+        if task is None:
+            return
+        connection.send(run_conversion(*task, options, trace_memory))
+
+
+class ConversionWorker:
+
+    def __init__(self, options, trace_memory=False):
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=run_worker, args=(worker_connection, options, trace_memory),
+                                               daemon=True)
+        self.process.start()
+        worker_connection.close()
+        self.index = None
+        self.task = None
+        self.start_time = None
+
+    def submit(self, index, task):
+        self.index = index
+        self.task = task
+        self.start_time = time.perf_counter()
+        self.connection.send(task)
+
+    def receive(self):
+        result = self.connection.recv()
+        self.task = None
+        return result
+
+    def elapsed_time(self):
+        return time.perf_counter() - self.start_time
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(5)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+def convert_files(input_files, targets, output_directory, jobs=None, timeout=None, force=False, trace_memory=False,
+                  **options):
+    """
+    Converts the files listed by list_input_files to each of the targets on a pool of jobs worker processes, writing
+    the files of each of them to output_directory under its output name.
+
+    The files whose outputs are all newer than them are skipped unless force is set, so an interrupted run resumes
+    where it stopped. A file taking more than timeout seconds has its worker process killed, and a new one started
+    in its place, as a model may hang a native backend beyond the reach of an exception.
+
+    Returns, in the order of input_files, a dict per file with its "input_file", its "status" ("converted",
+    "skipped", "failed" or "timed_out"), the formatted traceback of the error raised while importing it ("error"),
+    the time its conversion took in seconds ("time") and, once imported, its "import_time", the result of each
+    target ("targets") as returned by export_graph_info and the peak resident set size of the worker while converting
+    it in bytes ("peak_rss", since the worker started on the platforms other than Linux). With trace_memory, the
+    memory used by each stage of its conversion is given too ("memory", see MemoryStageCollector), at the cost of
+    slowing it down.
+    """
+    targets = list(dict.fromkeys(targets))
+    results = [None] * len(input_files)
+    pending_tasks = []
+    for index, (input_file, output_name) in enumerate(input_files):
+        output_file_base = get_output_file_base(output_directory, output_name)
+        if not force and is_up_to_date(input_file, get_output_files(output_file_base, targets)):
+            results[index] = {'input_file': input_file, 'status': "skipped", 'error': None, 'time': 0.0}
+        else:
+            pending_tasks.append((index, (input_file, output_file_base, targets)))
+    pending_tasks.reverse()
+    workers = [ConversionWorker(options, trace_memory)
+               for worker_index in range(min(jobs or os.cpu_count() or 1, len(pending_tasks)))]
+    try:
+        while pending_tasks or any(worker.task for worker in workers):
+            for worker in workers:
+                if worker.task is None and pending_tasks:
+                    worker.submit(*pending_tasks.pop())
+            busy_workers = [worker for worker in workers if worker.task]
+            wait_time = None
+            if timeout is not None:
+                wait_time = max(0.0, min(timeout - worker.elapsed_time() for worker in busy_workers))
+            ready_connections = wait([worker.connection for worker in busy_workers], wait_time)
+            for worker_index, worker in enumerate(workers):
+                if worker.task is None:
+                    continue
+                if worker.connection in ready_connections:
+                    try:
+                        results[worker.index] = worker.receive()
+                        continue
+                    except EOFError:
+                        worker.process.join()
+                        # a worker killed by the system running out of memory exits with the code -9 (SIGKILL)
+                        result = {'status': "failed",
+                                  'error': "The worker process exited with code {}".format(worker.process.exitcode)}
+                elif timeout is not None and worker.elapsed_time() >= timeout:
+                    result = {'status': "timed_out", 'error': "Timed out after {} s".format(timeout)}
+                else:
+                    continue
+                result.update({'input_file': worker.task[0], 'time': worker.elapsed_time()})
+                results[worker.index] = result
+                worker.kill()
+                workers[worker_index] = ConversionWorker(options, trace_memory)
+    finally:
+        for worker in workers:
+            worker.stop()
+
+    return results
+
+
+def summarize_results(results, total_time):
+    summary = {'total_time': total_time, 'files': results}
+    for status in ["converted", "skipped", "failed", "timed_out"]:
+        summary[status] = sum(result['status'] == status for result in results)
+    peak_rss_results = [result for result in results if result.get('peak_rss')]
+    if peak_rss_results:
+        largest_result = max(peak_rss_results, key=lambda result: result['peak_rss'])
+        summary['max_peak_rss'] = {'input_file': largest_result['input_file'], 'peak_rss': largest_result['peak_rss']}
+
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="networkinfotranslator",
+        description="Converts SBML (.xml, .sbml) and network editor (.json) files to one or more formats.")
+    parser.add_argument("inputs", nargs="+", help="files, directories searched recursively or glob patterns")
+    parser.add_argument("-t", "--target", dest="targets", action="append", choices=list(export_targets.keys()),
+                        help="format to export to, may be repeated (default: png)")
+    parser.add_argument("-o", "--output-directory", default=".", help="directory to write the files to")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes (default: number of cores)")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds after which a file is given up on")
+    parser.add_argument("-f", "--force", action="store_true", help="convert the files whose outputs are up to date")
+    parser.add_argument("--sbml-reader", choices=list(sbml_readers.keys()), default=None,
+                        help="library to read the SBML files with")
+    parser.add_argument("--summary", default=None, help="file to write the JSON summary to (default: stdout)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="add the memory used by each stage of the conversion of each file to the summary")
+    arguments = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    targets = arguments.targets or ["png"]
+    results = convert_files(list_input_files(arguments.inputs, arguments.output_directory, targets), targets,
+                            arguments.output_directory, arguments.jobs, arguments.timeout, arguments.force,
+                            arguments.trace_memory, sbml_reader=arguments.sbml_reader)
+    summary = summarize_results(results, time.perf_counter() - start)
+    if arguments.summary:
+        with open(arguments.summary, 'w', encoding='utf8') as summary_file:
+            json.dump(summary, summary_file, indent=1)
+    else:
+        json.dump(summary, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+    sys.stderr.write("{} converted, {} skipped, {} failed, {} timed out in {:.3f} s\n".format(
+        summary['converted'], summary['skipped'], summary['failed'], summary['timed_out'], summary['total_time']))
+
+    return 1 if summary['failed'] or summary['timed_out'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_color(color):
+    """
+    Returns the canonical hex string ("#rrggbb", or "#rrggbbaa" if not opaque) and RGBA tuple of a color name,
+    hex string or rgb/rgba/hsl function string, or None if it is not a valid color.
+
+    The importers and exporters meet the same few color strings on thousands of entities, so each of them is
+    parsed once per process.
+    """
+    if not isinstance(color, str):
+        return None
+    # imported on first use, so that importing the importers and exporters using the colors does not load PIL
+    from PIL import ImageColor
+    try:
+        rgba = ImageColor.getcolor(color, "RGBA")
+    except ValueError:
+        return None
+    if rgba[3] == 255:
+        return "#{:02x}{:02x}{:02x}".format(*rgba[:3]), rgba
+
+    return "#{:02x}{:02x}{:02x}{:02x}".format(*rgba), rgba
+
+
+def color_to_hex(color, default=None):
+    normalized_color = normalize_color(color)
+    if normalized_color:
+        return normalized_color[0]
+
+    return default
+
+
+def color_to_rgba(color, default=None):
+    normalized_color = normalize_color(color)
+    if normalized_color:
+        return normalized_color[1]
+
+    return default
@@ -0,0 +1,188 @@
+from collections.abc import MutableMapping
+
+
+class CompactEntity(MutableMapping):
+    """
+    Slotted, dict-compatible container of the features of a network entity.
+
+    The keys used by the importers are stored in __slots__ named after them (an unset slot is a missing key),
+    so each instance costs a fraction of the equivalent dict. Keys that are not part of the schema of the class
+    are kept in a lazily created 'extras' dict, which keeps the importers free to attach any other info.
+    """
+    __slots__ = ('extras',)
+    fields = frozenset()
+    # key -> (class of the nested value, whether the nested value is a list of those)
+    nested = {}
+
+    def __init__(self, features=None):
+        self.extras = None
+        if features:
+            for key, value in features.items():
+                self[key] = value
+
+    @classmethod
+    def from_features(cls, features):
+        entity = features if isinstance(features, cls) else cls()
+        for key, value in list(features.items()):
+            if key in cls.nested:
+                nested_class, is_list = cls.nested[key]
+                # views over a GeometryStore are left as they are
+                if is_list and isinstance(value, list):
+                    value = [nested_class.from_features(item) if isinstance(item, (dict, CompactEntity)) else item
+                             for item in value]
+                elif isinstance(value, (dict, CompactEntity)):
+                    value = nested_class.from_features(value)
+            elif entity is features:
+                continue
+            if key in cls.fields:
+                setattr(entity, key, value)
+            else:
+                entity[key] = value
+
+        return entity
+
+    def to_dict(self):
+        features = {}
+        for key in self:
+            value = self[key]
+            if isinstance(value, CompactEntity):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [item.to_dict() if isinstance(item, CompactEntity) else item for item in value]
+            features[key] = value
+
+        return features
+
+    def __getitem__(self, key):
+        if key in self.fields:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self.extras is not None:
+            return self.extras[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self.fields:
+            setattr(self, key, value)
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+
+    def __delitem__(self, key):
+        if key in self.fields:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        elif self.extras is not None:
+            del self.extras[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in self.fields:
+            return hasattr(self, key)
+        return self.extras is not None and key in self.extras
+
+    def get(self, key, default=None):
+        if key in self.fields:
+            return getattr(self, key, default)
+        if self.extras is not None:
+            return self.extras.get(key, default)
+        return default
+
+    def __iter__(self):
+        for key in self.__slots__:
+            if hasattr(self, key):
+                yield key
+        if self.extras is not None:
+            yield from self.extras
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return type(self).__name__ + "(" + repr(self.to_dict()) + ")"
+
+
+class RelAbsVector(CompactEntity):
+    __slots__ = ('abs', 'rel')
+    fields = frozenset(__slots__)
+
+
+class Point(CompactEntity):
+    __slots__ = ('x', 'y')
+    fields = frozenset(__slots__)
+
+
+class BoundingBox(CompactEntity):
+    __slots__ = ('x', 'y', 'width', 'height')
+    fields = frozenset(__slots__)
+
+
+class CurveSegment(CompactEntity):
+    __slots__ = ('startX', 'startY', 'endX', 'endY', 'basePoint1X', 'basePoint1Y', 'basePoint2X', 'basePoint2Y')
+    fields = frozenset(__slots__)
+
+
+class RenderPoint(CompactEntity):
+    __slots__ = ('renderPointX', 'renderPointY', 'basePoint1X', 'basePoint1Y', 'basePoint2X', 'basePoint2Y')
+    fields = frozenset(__slots__)
+    nested = {key: (RelAbsVector, False) for key in __slots__}
+
+
+class GeometricShape(CompactEntity):
+    __slots__ = ('shape', 'strokeColor', 'strokeWidth', 'strokeDashArray', 'fillColor', 'fillRule',
+                 'x', 'y', 'width', 'height', 'rx', 'ry', 'cx', 'cy', 'ratio', 'href', 'vertices',
+                 'fontFamily', 'fontSize', 'fontWeight', 'fontStyle', 'hTextAnchor', 'vTextAnchor')
+    fields = frozenset(__slots__)
+    nested = {'x': (RelAbsVector, False), 'y': (RelAbsVector, False),
+              'width': (RelAbsVector, False), 'height': (RelAbsVector, False),
+              'rx': (RelAbsVector, False), 'ry': (RelAbsVector, False),
+              'cx': (RelAbsVector, False), 'cy': (RelAbsVector, False),
+              'fontSize': (RelAbsVector, False), 'vertices': (RenderPoint, True)}
+
+
+class GraphicalStyle(CompactEntity):
+    """the features of a graphicalShape, graphicalCurve or graphicalText"""
+    __slots__ = ('strokeColor', 'strokeWidth', 'strokeDashArray', 'fillColor', 'fillRule', 'heads',
+                 'fontFamily', 'fontSize', 'fontWeight', 'fontStyle', 'hTextAnchor', 'vTextAnchor',
+                 'geometricShapes')
+    fields = frozenset(__slots__)
+    nested = {'fontSize': (RelAbsVector, False), 'geometricShapes': (GeometricShape, True)}
+
+
+class Features(CompactEntity):
+    __slots__ = ('boundingBox', 'graphicalShape', 'graphicalCurve', 'graphicalText', 'curve',
+                 'startPoint', 'startSlope', 'endPoint', 'endSlope', 'plainText', 'styleName', 'enableRotation')
+    fields = frozenset(__slots__)
+    nested = {'boundingBox': (BoundingBox, False), 'graphicalShape': (GraphicalStyle, False),
+              'graphicalCurve': (GraphicalStyle, False), 'graphicalText': (GraphicalStyle, False),
+              'curve': (CurveSegment, True), 'startPoint': (Point, False), 'endPoint': (Point, False)}
+
+
+class Text(CompactEntity):
+    __slots__ = ('id', 'features')
+    fields = frozenset(__slots__)
+    nested = {'features': (Features, False)}
+
+
+class SpeciesReference(CompactEntity):
+    __slots__ = ('id', 'referenceId', 'metaId', 'reaction', 'reaction_glyph_index', 'species', 'species_glyph_id',
+                 'species_reference_glyph_index', 'speciesGlyph', 'reactionGlyph', 'role', 'features')
+    fields = frozenset(__slots__)
+    nested = {'features': (Features, False)}
+
+
+class GraphicalObject(CompactEntity):
+    """a compartment, species, reaction or additional graphical object"""
+    __slots__ = ('id', 'referenceId', 'metaId', 'index', 'compartment', 'features', 'texts', 'speciesReferences')
+    fields = frozenset(__slots__)
+    nested = {'features': (Features, False), 'texts': (Text, True), 'speciesReferences': (SpeciesReference, True)}
+
+
+def compact_graphical_object(graphical_object):
+    return GraphicalObject.from_features(graphical_object)
@@ -1,4 +1,10 @@
+from ..tracing import traced, span, count_exported_entities
+
+
 class NetworkInfoExportBase:
+    # the import profile providing the features this exporter reads (see NetworkInfoImportBase.profiles)
+    required_profile = "full"
+
     def __init__(self):
         self.graph_info = None
         self.reset()
@@ -6,31 +12,37 @@ class NetworkInfoExportBase:
     def reset(self):
         self.graph_info = None
 
+    @traced("export.extract_graph_info", count_exported_entities)
     def extract_graph_info(self, graph_info):
         self.reset()
         self.graph_info = graph_info
 
         # update the features of the entities
-        graph_info.extract_entity_features()
+        graph_info.extract_entity_features(self.required_profile)
 
         # background canvas
         self.set_background(graph_info)
 
         # compartments
-        for c in graph_info.compartments:
-            self.add_compartment(c)
+        with span("export.add_compartment", {'compartments': len(graph_info.compartments)}):
+            for c in graph_info.compartments:
+                self.add_compartment(c)
 
         # species
-        for s in graph_info.species:
-            self.add_species(s)
+        with span("export.add_species", {'species': len(graph_info.species)}):
+            for s in graph_info.species:
+                self.add_species(s)
 
         # reactions
-        for r in graph_info.reactions:
-            self.add_reaction(r)
+        with span("export.add_reaction", {'reactions': len(graph_info.reactions)}):
+            for r in graph_info.reactions:
+                self.add_reaction(r)
 
         # additional graphical objects
-        for go in graph_info.additional_graphical_objects:
-            self.add_additional_graphical_object(go)
+        with span("export.add_additional_graphical_object",
+                  {'additional_graphical_objects': len(graph_info.additional_graphical_objects)}):
+            for go in graph_info.additional_graphical_objects:
+                self.add_additional_graphical_object(go)
 
     def set_background(self, graph_info):
         pass
@@ -1,4 +1,5 @@
 from .export_json_base import NetworkInfoExportToJsonBase
+from ..tracing import traced, count_exported_entities
 import json
 from pathlib import Path as pathlib
 
@@ -42,15 +43,14 @@ class NetworkInfoExportToCytoscapeJs(NetworkInfoExportToJsonBase):
 
     @staticmethod
     def set_entity_metaid(entity, go):
-        if 'metaId' in list(go.keys()):
+        if 'metaId' in go:
             entity['data']['metaId'] = go['metaId']
 
     def set_entity_compartment(self, entity, go):
-        if 'compartment' in list(go.keys()):
-            for c in self.graph_info.compartments:
-                if c['referenceId'] == go['compartment']:
-                    entity['data']['parent'] = c['id']
-                    break
+        if 'compartment' in go:
+            compartment = self.graph_info.find_compartment(go['compartment'])
+            if compartment:
+                entity['data']['parent'] = compartment['id']
 
     @staticmethod
     def set_entity_selected(entity, selected):
@@ -78,12 +78,8 @@ class NetworkInfoExportToCytoscapeJs(NetworkInfoExportToJsonBase):
                         'target-arrow-color': '#4169e1'}}
 
     def set_edge_nodes(self, edge, species_reference, reaction):
-        species = None
-        for s in self.graph_info.species:
-            if s['referenceId'] == species_reference['species']:
-                species = s
-                break
-        if species and 'role' in list(species_reference.keys()):
+        species = self.graph_info.find_species(species_reference['species'])
+        if species and 'role' in species_reference:
             if species_reference['role'].lower() == "product" or species_reference['role'].lower() == "sideproduct"\
                     or species_reference['role'].lower() == "side product":
                 edge['data']['source'] = reaction['id']
@@ -93,23 +89,23 @@ class NetworkInfoExportToCytoscapeJs(NetworkInfoExportToJsonBase):
                 edge['data']['target'] = reaction['id']
 
     def extract_node_features(self, go, node, style):
-        if 'features' in list(go.keys()):
-            if 'boundingBox' in list(go['features'].keys()):
+        if 'features' in go:
+            if 'boundingBox' in go['features']:
                 node['position'] = self.get_node_position(go)
                 style['css'].update(self.get_node_dimensions(go))
-            if 'graphicalShape' in list(go['features'].keys()):
+            if 'graphicalShape' in go['features']:
                 style['css'].update(self.set_shape_style(go))
-        if 'texts' in list(go.keys()) and len(go['texts']):
+        if 'texts' in go and len(go['texts']):
             text = go['texts'][0]
-            if 'features' in list(text.keys()):
-                if 'plainText' in list(text['features'].keys()):
+            if 'features' in text:
+                if 'plainText' in text['features']:
                     node['data']['name'] = text['features']['plainText']
-                if 'graphicalText' in list(text['features'].keys()):
+                if 'graphicalText' in text['features']:
                     style['css'].update(self.set_node_text_style(text))
 
     def extract_edge_features(self, go, style):
-        if 'features' in list(go.keys()):
-            if 'graphicalCurve' in list(go['features'].keys()):
+        if 'features' in go:
+            if 'graphicalCurve' in go['features']:
                 style['css'].update(self.set_curve_style(go))
 
     @staticmethod
@@ -126,27 +122,27 @@ class NetworkInfoExportToCytoscapeJs(NetworkInfoExportToJsonBase):
 
     def set_shape_style(self, go):
         shape_style = {}
-        if 'strokeColor' in list(go['features']['graphicalShape'].keys()):
+        if 'strokeColor' in go['features']['graphicalShape']:
             shape_style['border-color'] = \
                 self.graph_info.find_color_value(go['features']['graphicalShape']['strokeColor'])
-        if 'strokeWidth' in list(go['features']['graphicalShape'].keys()):
+        if 'strokeWidth' in go['features']['graphicalShape']:
             shape_style['border-width'] = go['features']['graphicalShape']['strokeWidth']
-        if 'fillColor' in list(go['features']['graphicalShape'].keys()):
+        if 'fillColor' in go['features']['graphicalShape']:
             shape_style['background-color'] = \
                 self.graph_info.find_color_value(go['features']['graphicalShape']['fillColor'])
-        if 'geometricShapes' in list(go['features']['graphicalShape'].keys()):
-            if 'strokeColor' in list(go['features']['graphicalShape']['geometricShapes'][0].keys()):
+        if 'geometricShapes' in go['features']['graphicalShape']:
+            if 'strokeColor' in go['features']['graphicalShape']['geometricShapes'][0]:
                 shape_style['border-color'] = \
                     self.graph_info.find_color_value(go['features']['graphicalShape']
                                                      ['geometricShapes'][0]['strokeColor'])
-            if 'strokeWidth' in list(go['features']['graphicalShape']['geometricShapes'][0].keys()):
+            if 'strokeWidth' in go['features']['graphicalShape']['geometricShapes'][0]:
                 shape_style['border-width'] = \
                     go['features']['graphicalShape']['geometricShapes'][0]['strokeWidth']
-            if 'fillColor' in list(go['features']['graphicalShape']['geometricShapes'][0].keys()):
+            if 'fillColor' in go['features']['graphicalShape']['geometricShapes'][0]:
                 shape_style['background-color'] = \
                     self.graph_info.find_color_value(
                         go['features']['graphicalShape']['geometricShapes'][0]['fillColor'])
-            if 'shape' in list(go['features']['graphicalShape']['geometricShapes'][0].keys()):
+            if 'shape' in go['features']['graphicalShape']['geometricShapes'][0]:
                 if go['features']['graphicalShape']['geometricShapes'][0]['shape'].lower() == "rectangle":
                     shape_style['shape'] = 'roundrectangle'
                 elif go['features']['graphicalShape']['geometricShapes'][0]['shape'].lower() == "ellipse":
@@ -155,41 +151,41 @@ class NetworkInfoExportToCytoscapeJs(NetworkInfoExportToJsonBase):
 
     def set_curve_style(self, go):
         curve_style = {}
-        if 'strokeColor' in list(go['features']['graphicalCurve'].keys()):
+        if 'strokeColor' in go['features']['graphicalCurve']:
             curve_style['line-color'] = \
                 self.graph_info.find_color_value(go['features']['graphicalCurve']['strokeColor'])
             curve_style['source-arrow-color'] = \
                 self.graph_info.find_color_value(go['features']['graphicalCurve']['strokeColor'])
             curve_style['target-arrow-color'] = \
                 self.graph_info.find_color_value(go['features']['graphicalCurve']['strokeColor'])
-        if 'strokeWidth' in list(go['features']['graphicalCurve'].keys()):
+        if 'strokeWidth' in go['features']['graphicalCurve']:
             curve_style['width'] = go['features']['graphicalCurve']['strokeWidth']
-        if 'role' in list(go.keys()):
+        if 'role' in go:
             curve_style['target-arrow-shape'] = self.set_edge_target_arrow_shape(go)
         return curve_style
 
     def set_node_text_style(self, text):
         text_style = {}
-        if 'strokeColor' in list(text['features']['graphicalText'].keys()):
+        if 'strokeColor' in text['features']['graphicalText']:
             text_style['color'] = \
                 self.graph_info.find_color_value(text['features']['graphicalText']['strokeColor'])
-        if 'fontFamily' in list(text['features']['graphicalText'].keys()):
+        if 'fontFamily' in text['features']['graphicalText']:
             text_style['font-family'] = text['features']['graphicalText']['fontFamily']
-        if 'fontWeight' in list(text['features']['graphicalText'].keys()):
+        if 'fontWeight' in text['features']['graphicalText']:
             text_style['font-weight'] = text['features']['graphicalText']['fontWeight']
-        if 'fontStyle' in list(text['features']['graphicalText'].keys()):
+        if 'fontStyle' in text['features']['graphicalText']:
             text_style['font-style'] = text['features']['graphicalText']['fontStyle']
-        if 'fontSize' in list(text['features']['graphicalText'].keys()) and \
-                'boundingBox' in list(text['features'].keys()):
+        if 'fontSize' in text['features']['graphicalText'] and \
+                'boundingBox' in text['features']:
             text_style['font-size'] = text['features']['graphicalText']['fontSize']['abs'] +\
                                       text['features']['boundingBox']['width'] *\
                                       text['features']['graphicalText']['fontSize']['rel']
-        if 'vTextAnchor' in list(text['features']['graphicalText'].keys()):
+        if 'vTextAnchor' in text['features']['graphicalText']:
             if text['features']['graphicalText']['vTextAnchor'] == 'middle':
                 text_style['text-valign'] = 'center'
             else:
                 text_style['text-valign'] = text['features']['graphicalText']['vTextAnchor']
-        if 'hTextAnchor' in list(text['features']['graphicalText'].keys()):
+        if 'hTextAnchor' in text['features']['graphicalText']:
             if text['features']['graphicalText']['hTextAnchor'] == 'start':
                 text_style['text-halign'] = 'left'
             elif text['features']['graphicalText']['hTextAnchor'] == 'middle':
@@ -210,12 +206,18 @@ class NetworkInfoExportToCytoscapeJs(NetworkInfoExportToJsonBase):
             return "tee"
         return ""
 
+    @traced("export.export", count_exported_entities)
     def export(self, file_name):
-        graph_info = dict(data={'generated_by': "NetworkInfoTranslator", 'name': pathlib(file_name).stem,
-                                'shared_name': pathlib(file_name).stem, 'selected': True})
-        graph_info['elements'] = {'nodes': self.nodes, 'edges': self.edges}
-        graph_info['style'] = self.styles
+        graph_info = self.export_as_dict(pathlib(file_name).stem)
         with open(file_name.split('.')[0] + ".js", 'w', encoding='utf8') as js_file:
             js_file.write("graph_info = ")
             json.dump(graph_info, js_file, indent=1)
             js_file.write(";")
+
+    def export_as_dict(self, name=""):
+        graph_info = dict(data={'generated_by': "NetworkInfoTranslator", 'name': name, 'shared_name': name,
+                                'selected': True})
+        graph_info['elements'] = {'nodes': self.nodes, 'edges': self.edges}
+        graph_info['style'] = self.styles
+
+        return graph_info
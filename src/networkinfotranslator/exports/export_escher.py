@@ -1,10 +1,14 @@
 import libsbmlnetwork
 from .export_base import NetworkInfoExportBase
+from ..tracing import traced, count_exported_entities
 import json
 from pathlib import Path as pathlib
 
 
 class NetworkInfoExportToEscher(NetworkInfoExportBase):
+    # only the positions, sizes, connectivity and labels of the entities are exported
+    required_profile = "layout"
+
     def __init__(self):
         self.nodes = {}
         super().__init__()
@@ -15,23 +19,23 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
         self.reactions = {}
 
     def add_species(self, species):
-        if 'id' in list(species.keys()) and 'referenceId' in list(species.keys()):
+        if 'id' in species and 'referenceId' in species:
             node = self.create_node_from_species(species)
             self.nodes.update(node)
 
     def add_reaction(self, reaction):
-        if 'id' in list(reaction.keys()) and 'referenceId' in list(reaction.keys()):
+        if 'id' in reaction and 'referenceId' in reaction:
             self.nodes.update(self.create_node_from_reaction(reaction))
             self.reactions.update(self.create_escher_reaction(reaction))
 
-            if 'speciesReferences' in list(reaction.keys()):
+            if 'speciesReferences' in reaction:
                 for species_reference in reaction['speciesReferences']:
                     self.add_species_reference(reaction, species_reference)
 
     def add_species_reference(self, reaction, species_reference):
-        if 'id' in list(species_reference.keys()) and 'referenceId' in list(species_reference.keys()) \
-                and 'species' in list(species_reference.keys()) and 'features' in list(species_reference.keys())\
-                and 'curve' in list(species_reference['features'].keys()):
+        if 'id' in species_reference and 'referenceId' in species_reference \
+                and 'species' in species_reference and 'features' in species_reference\
+                and 'curve' in species_reference['features']:
             sr_index = len(species_reference['features']['curve']) - 1
             while sr_index > 0:
                 self.nodes.update(self.create_node_from_species_reference(reaction, species_reference, sr_index))
@@ -78,7 +82,7 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
 
     @staticmethod
     def set_item_biggid(item, go):
-        if 'referenceId' in list(go.keys()):
+        if 'referenceId' in go:
             item[go['id']]['bigg_id'] = go['referenceId']
 
     @staticmethod
@@ -86,12 +90,12 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
         node[go['id']]['node_is_primary'] = True
 
     def extract_node_features(self, node, go):
-        if 'features' in list(go.keys()):
+        if 'features' in go:
             node[go['id']]['x'], node[go['id']]['y'] = self.get_position(go['features'])
 
-            if 'texts' in list(go.keys()):
+            if 'texts' in go:
                 for text in go['texts']:
-                    if 'features' in list(text.keys()):
+                    if 'features' in text:
                         node[go['id']]['name'] = self.get_name(text['features'])
                         node[go['id']]['label_x'], node[go['id']]['label_y'] = self.get_position(text['features'])
                         horizontal_padding = 20
@@ -102,7 +106,7 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
 
     def extract_escher_reaction_features(self, escher_recaction, reaction):
         escher_recaction[reaction['id']]['reversibility'] = self.get_reaction_reversibility(reaction)
-        if 'features' in list(reaction.keys()):
+        if 'features' in reaction:
             escher_recaction[reaction['id']]['name'] = escher_recaction[reaction['id']]['bigg_id']
             escher_recaction[reaction['id']]['label_x'], escher_recaction[reaction['id']]['label_y'] =\
                 self.get_position(reaction['features'])
@@ -112,11 +116,11 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
             escher_recaction[reaction['id']]['label_y'] += vertical_padding
 
 
-        if 'speciesReferences' in list(reaction.keys()):
+        if 'speciesReferences' in reaction:
             segments = {}
             metabolites = []
             for species_reference in reaction['speciesReferences']:
-                if 'role' in list(species_reference.keys()):
+                if 'role' in species_reference:
                     if species_reference['role'].lower() == "product":
                         metabolites.append(self.create_metabolite_from_product(species_reference))
                     elif species_reference['role'].lower() == "reactant" or species_reference['role'].lower() == "substrate":
@@ -146,7 +150,7 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
         segments = {}
         segment_id = species_reference['id'] + ".S" + "0"
         segment_features = {}
-        if 'curve' in list(species_reference['features'].keys()):
+        if 'curve' in species_reference['features']:
             segment_features['from_node_id'] = reaction['id']
             for cs_index in range(libsbmlnetwork.getNumCurveSegments(species_reference['glyphObject']) - 1):
                 segment_features['to_node_id'] = reaction['id'] + "." + species_reference['id'] + ".M" + str(cs_index + 1)
@@ -160,9 +164,9 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
         return segments
 
     def get_position(self, features):
-        if 'boundingBox' in list(features.keys()):
+        if 'boundingBox' in features:
             return self.get_bb_center_x(features['boundingBox']), self.get_bb_center_y(features['boundingBox'])
-        elif 'curve' in list(go['features'].keys()):
+        elif 'curve' in go['features']:
             return [self.get_curve_center_x(features['curve']), self.get_curve_center_y(features['curve'])]
         return 0.0, 0.0
 
@@ -188,19 +192,20 @@ class NetworkInfoExportToEscher(NetworkInfoExportBase):
 
     @staticmethod
     def get_name(features):
-        if 'plainText' in list(features.keys()):
+        if 'plainText' in features:
             return features['plainText']
         return ""
 
     @staticmethod
     def get_segment_base_point_features(curve, cs_index):
-        if 'basePoint1X' in list(curve[cs_index].keys()) and 'basePoint2X' in list(curve[cs_index].keys()):
+        if 'basePoint1X' in curve[cs_index] and 'basePoint2X' in curve[cs_index]:
             return {'b1': {'x': curve[cs_index]['basePoint1X'], 'y': curve[cs_index]['basePoint1Y']},
                     'b2': {'x': curve[cs_index]['basePoint2X'], 'y': curve[cs_index]['basePoint2Y']}}
         else:
             return {'b1': {'x': curve[cs_index]['startX'], 'y': curve[cs_index]['startY']},
                     'b2': {'x': curve[cs_index]['endX'], 'y': curve[cs_index]['endY']}}
 
+    @traced("export.export", count_exported_entities)
     def export(self, file_name="file"):
         horizontal_margin = 75
         vertical_margin = 75
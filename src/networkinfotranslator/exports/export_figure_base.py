@@ -26,46 +26,46 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
 
     def add_compartment(self, compartment):
         # compartment
-        if 'features' in list(compartment.keys()):
+        if 'features' in compartment:
             self.add_graphical_shape_to_scene(compartment['features'], layer=self.compartment_layer)
         # compartment text
-        if 'texts' in list(compartment.keys()):
+        if 'texts' in compartment:
             for text in compartment['texts']:
-                if 'features' in list(text.keys()):
+                if 'features' in text:
                     self.add_text_to_scene(text['features'], layer=self.compartment_text_layer)
 
     def add_species(self, species):
         # species
-        if 'features' in list(species.keys()):
+        if 'features' in species:
             self.add_graphical_shape_to_scene(species['features'], layer=self.species_layer)
         # species text
-        if 'texts' in list(species.keys()):
+        if 'texts' in species:
             for text in species['texts']:
-                if 'features' in list(text.keys()):
+                if 'features' in text:
                     self.add_text_to_scene(text['features'], layer=self.species_text_layer)
 
     def add_reaction(self, reaction):
         # reaction
-        if 'features' in list(reaction.keys()):
+        if 'features' in reaction:
             # reaction curve
-            if 'curve' in list(reaction['features']):
+            if 'curve' in reaction['features']:
                 self.add_curve_to_scene(reaction['features'], offset_x=0.0, offset_y=0.0, slope=0.0, layer=self.reaction_layer, sublayer=0)
             # reaction graphical shape
-            elif 'boundingBox' in list(reaction['features']):
+            elif 'boundingBox' in reaction['features']:
                 self.add_graphical_shape_to_scene(reaction['features'], layer=self.reaction_layer)
         # reaction text
-        if 'texts' in list(reaction.keys()):
+        if 'texts' in reaction:
             for text in reaction['texts']:
-                if 'features' in list(text.keys()):
+                if 'features' in text:
                     self.add_text_to_scene(text['features'], layer=self.reaction_text_layer)
 
         # species references
-        if 'speciesReferences' in list(reaction.keys()):
+        if 'speciesReferences' in reaction:
             for sr in reaction['speciesReferences']:
                 self.add_species_reference(sr)
 
     def add_species_reference(self, species_reference):
-        if 'features' in list(species_reference.keys()):
+        if 'features' in species_reference:
             # species reference
             self.add_curve_to_scene(species_reference['features'], offset_x=0.0, offset_y=0.0, slope=0.0, layer=self.species_reference_layer, sublayer=0)
 
@@ -74,16 +74,16 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
 
     def add_additional_graphical_object(self, additional_graphical_object):
         # additional graphical object
-        if 'features' in list(additional_graphical_object.keys()):
+        if 'features' in additional_graphical_object:
             self.add_graphical_shape_to_scene(additional_graphical_object['features'], layer=self.additional_graphical_object_layer)
         # additional graphical object text
-        if 'texts' in list(additional_graphical_object.keys()):
+        if 'texts' in additional_graphical_object:
             for text in additional_graphical_object['texts']:
-                if 'features' in list(text.keys()):
+                if 'features' in text:
                     self.add_text_to_scene(text['features'], layer=self.additional_graphical_object_text_layer)
 
     def add_graphical_shape_to_scene(self, features, offset_x=0.0, offset_y=0.0, slope=0.0, layer=0):
-        if 'boundingBox' in list(features.keys()):
+        if 'boundingBox' in features:
             if (offset_x or offset_y) and slope:
                 offset_x += 1.5 * math.cos(slope)
                 offset_y += 1.5 * math.sin(slope)
@@ -97,25 +97,25 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
             stroke_width = 1.0
             stroke_dash_array = tuple()
             fill_color = 'white'
-            if 'graphicalShape' in list(features.keys()):
-                if 'strokeColor' in list(features['graphicalShape'].keys()):
+            if 'graphicalShape' in features:
+                if 'strokeColor' in features['graphicalShape']:
                     stroke_color = features['graphicalShape']['strokeColor']
-                if 'strokeWidth' in list(features['graphicalShape'].keys()):
+                if 'strokeWidth' in features['graphicalShape']:
                     stroke_width = features['graphicalShape']['strokeWidth']
-                if 'strokeDashArray' in list(features['graphicalShape'].keys()):
+                if 'strokeDashArray' in features['graphicalShape']:
                     stroke_dash_array = features['graphicalShape']['strokeDashArray']
-                if 'fillColor' in list(features['graphicalShape'].keys()):
+                if 'fillColor' in features['graphicalShape']:
                     fill_color = features['graphicalShape']['fillColor']
 
-                if 'geometricShapes' in list(features['graphicalShape'].keys()):
+                if 'geometricShapes' in features['graphicalShape']:
                     for gs_index in range(len(features['graphicalShape']['geometricShapes'])):
-                        if 'strokeColor' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                        if 'strokeColor' in features['graphicalShape']['geometricShapes'][gs_index]:
                             stroke_color = features['graphicalShape']['geometricShapes'][gs_index]['strokeColor']
-                        if 'strokeWidth' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                        if 'strokeWidth' in features['graphicalShape']['geometricShapes'][gs_index]:
                             stroke_width = features['graphicalShape']['geometricShapes'][gs_index]['strokeWidth']
-                        if 'strokeDashArray' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                        if 'strokeDashArray' in features['graphicalShape']['geometricShapes'][gs_index]:
                             stroke_dash_array = features['graphicalShape']['geometricShapes'][gs_index]['strokeDashArray']
-                        if 'fillColor' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                        if 'fillColor' in features['graphicalShape']['geometricShapes'][gs_index]:
                             fill_color = features['graphicalShape']['geometricShapes'][gs_index]['fillColor']
 
                         # draw an image
@@ -124,19 +124,19 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                             image_y = bbox_y
                             image_width = bbox_width
                             image_height = bbox_height
-                            if 'x' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'x' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 image_x += features['graphicalShape']['geometricShapes'][gs_index]['x']['abs'] + \
                                               0.01 * features['graphicalShape']['geometricShapes'][gs_index]['x']['rel'] * image_width
-                            if 'y' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'y' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 image_y += features['graphicalShape']['geometricShapes'][gs_index]['y']['abs'] + \
                                               0.01 * features['graphicalShape']['geometricShapes'][gs_index]['y']['rel'] * image_height
-                            if 'width' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'width' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 image_width = features['graphicalShape']['geometricShapes'][gs_index]['width']['abs'] + \
                                                   0.01 * features['graphicalShape']['geometricShapes'][gs_index]['width']['rel'] * image_width
-                            if 'height' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'height' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 image_height = features['graphicalShape']['geometricShapes'][gs_index]['height']['abs'] + \
                                                0.01 * features['graphicalShape']['geometricShapes'][gs_index]['height']['rel'] * image_height
-                            if 'href' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'href' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 self.draw_image(href, image_x, image_y, image_width, image_height,
                                             offset_x, offset_y, slope, layer, gs_index)
 
@@ -147,7 +147,7 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                                                                  'strokeDashArray': stroke_dash_array}}
 
                             # add a render curve to plot
-                            if 'vertices' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'vertices' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 curve_features['curve'] = []
                                 for v_index in range(len(features['graphicalShape']['geometricShapes'][gs_index]['vertices']) - 1):
                                     element_ = {'startX': features['graphicalShape']['geometricShapes'][gs_index]['vertices'][v_index]['renderPointX']['abs'] +
@@ -163,7 +163,7 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                                                         0.01 * features['graphicalShape']['geometricShapes'][gs_index]['vertices'][v_index + 1]['renderPointY'][
                                                             'rel'] * bbox_height + bbox_y}
 
-                                    if 'basePoint1X' in list(features['graphicalShape']['geometricShapes'][gs_index]['vertices'][v_index].keys()):
+                                    if 'basePoint1X' in features['graphicalShape']['geometricShapes'][gs_index]['vertices'][v_index]:
                                         element_ = {
                                             'basePoint1X': features['graphicalShape']['geometricShapes'][gs_index]['vertices'][v_index]['basePoint1X']['abs'] +
                                                            0.01 * features['graphicalShape']['geometricShapes'][gs_index]['vertices'][v_index]['basePoint1X'][
@@ -189,19 +189,19 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                             corner_radius_x = 0.0
                             corner_radius_y = 0.0
 
-                            if 'x' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'x' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 position_x += features['graphicalShape']['geometricShapes'][gs_index]['x']['abs'] + \
                                               0.01 * features['graphicalShape']['geometricShapes'][gs_index]['x']['rel'] * bbox_width
-                            if 'y' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'y' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 position_y += features['graphicalShape']['geometricShapes'][gs_index]['y']['abs'] + \
                                               0.01 * features['graphicalShape']['geometricShapes'][gs_index]['y']['rel'] * bbox_height
-                            if 'width' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'width' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 dimension_width = features['graphicalShape']['geometricShapes'][gs_index]['width']['abs'] + \
                                                   0.01 * features['graphicalShape']['geometricShapes'][gs_index]['width']['rel'] * bbox_width
-                            if 'height' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'height' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 dimension_height = features['graphicalShape']['geometricShapes'][gs_index]['height']['abs'] + \
                                                    0.01 * features['graphicalShape']['geometricShapes'][gs_index]['height']['rel'] * bbox_height
-                            if 'ratio' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()) and \
+                            if 'ratio' in features['graphicalShape']['geometricShapes'][gs_index] and \
                                     features['graphicalShape']['geometricShapes'][gs_index]['ratio'] > 0.0:
                                 if (bbox_width / bbox_height) <= features['graphicalShape']['geometricShapes'][gs_index]['ratio']:
                                     dimension_width = bbox_width
@@ -211,10 +211,10 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                                     dimension_height = bbox_height
                                     dimension_width = features['graphicalShape']['geometricShapes'][gs_index]['ratio'] * bbox_height
                                     position_x += 0.5 * (bbox_width - dimension_width)
-                            if 'rx' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'rx' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 corner_radius_x = features['graphicalShape']['geometricShapes'][gs_index]['rx']['abs'] + \
                                                 0.01 * features['graphicalShape']['geometricShapes'][gs_index]['rx']['rel'] * 0.5 * (bbox_width + bbox_height)
-                            elif 'ry' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            elif 'ry' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 corner_radius_y = features['graphicalShape']['geometricShapes'][gs_index]['ry']['abs'] + \
                                                 0.01 * features['graphicalShape']['geometricShapes'][gs_index]['ry']['rel'] * 0.5 * (bbox_width + bbox_height)
 
@@ -229,19 +229,19 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                             dimension_rx = 0.5 * bbox_width
                             dimension_ry = 0.5 * bbox_height
 
-                            if 'cx' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'cx' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 position_cx += features['graphicalShape']['geometricShapes'][gs_index]['cx']['abs'] +\
                                                0.01 * features['graphicalShape']['geometricShapes'][gs_index]['cx']['rel'] * bbox_width
-                            if 'cy' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'cy' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 position_cy += features['graphicalShape']['geometricShapes'][gs_index]['cy']['abs'] +\
                                                0.01 * features['graphicalShape']['geometricShapes'][gs_index]['cy']['rel'] * bbox_height
-                            if 'rx' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'rx' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 dimension_rx = features['graphicalShape']['geometricShapes'][gs_index]['rx']['abs'] +\
                                                0.01 * features['graphicalShape']['geometricShapes'][gs_index]['rx']['rel'] * bbox_width
-                            if 'ry' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'ry' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 dimension_ry = features['graphicalShape']['geometricShapes'][gs_index]['ry']['abs'] + \
                                                0.01 * features['graphicalShape']['geometricShapes'][gs_index]['ry']['rel'] * bbox_height
-                            if 'ratio' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()) and features['graphicalShape']['geometricShapes'][gs_index]['ratio'] > 0.0:
+                            if 'ratio' in features['graphicalShape']['geometricShapes'][gs_index] and features['graphicalShape']['geometricShapes'][gs_index]['ratio'] > 0.0:
                                 if (bbox_width / bbox_height) <= features['graphicalShape']['geometricShapes'][gs_index]['ratio']:
                                     dimension_rx = 0.5 * bbox_width
                                     dimension_ry = (0.5 * bbox_width / features['graphicalShape']['geometricShapes'][gs_index]['ratio'])
@@ -254,7 +254,7 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
 
                         # draw a polygon
                         elif features['graphicalShape']['geometricShapes'][gs_index]['shape'] == 'polygon':
-                            if 'vertices' in list(features['graphicalShape']['geometricShapes'][gs_index].keys()):
+                            if 'vertices' in features['graphicalShape']['geometricShapes'][gs_index]:
                                 vertices = np.empty((0, 2))
                                 origin_x = bbox_x
                                 origin_y = bbox_y
@@ -279,25 +279,25 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                                                offset_x, offset_y, slope, layer, 0)
 
     def add_curve_to_scene(self, features, offset_x, offset_y, slope, layer, sublayer):
-        if 'curve' in list(features.keys()):
+        if 'curve' in features:
             # default features
             stroke_color = 'black'
             stroke_width = 1.0
             stroke_dash_array = 'solid'
 
-            if 'graphicalCurve' in list(features.keys()):
-                if 'strokeColor' in list(features['graphicalCurve'].keys()):
+            if 'graphicalCurve' in features:
+                if 'strokeColor' in features['graphicalCurve']:
                     stroke_color = features['graphicalCurve']['strokeColor']
-                if 'strokeWidth' in list(features['graphicalCurve'].keys()):
+                if 'strokeWidth' in features['graphicalCurve']:
                     stroke_width = features['graphicalCurve']['strokeWidth']
-                if 'strokeDashArray' in list(features['graphicalCurve'].keys()) \
+                if 'strokeDashArray' in features['graphicalCurve'] \
                         and not features['graphicalCurve']['strokeDashArray'] == 'solid':
                     stroke_dash_array = features['graphicalCurve']['strokeDashArray']
 
             self.draw_curve(features['curve'], stroke_color, stroke_width, stroke_dash_array, offset_x, offset_y, slope, layer, sublayer)
 
     def add_text_to_scene(self, features, layer, sublayer = 0):
-        if 'plainText' in list(features.keys()) and 'boundingBox' in list(features.keys()):
+        if 'plainText' in features and 'boundingBox' in features:
             plain_text = features['plainText']
             bbox_x = features['boundingBox']['x']
             bbox_y = features['boundingBox']['y']
@@ -313,67 +313,67 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
             h_text_anchor = 'center'
             v_text_anchor = 'center'
 
-            if 'graphicalText' in list(features.keys()):
-                if 'strokeColor' in list(features['graphicalText'].keys()):
+            if 'graphicalText' in features:
+                if 'strokeColor' in features['graphicalText']:
                     font_color = self.graph_info.find_color_value(features['graphicalText']['strokeColor'], False)
-                if 'fontFamily' in list(features['graphicalText'].keys()):
+                if 'fontFamily' in features['graphicalText']:
                     font_family = features['graphicalText']['fontFamily']
-                if 'fontSize' in list(features['graphicalText'].keys()):
+                if 'fontSize' in features['graphicalText']:
                     font_size = features['graphicalText']['fontSize']['abs'] + \
                                 0.01 * features['graphicalText']['fontSize']['rel'] * bbox_width
-                if 'fontStyle' in list(features['graphicalText'].keys()):
+                if 'fontStyle' in features['graphicalText']:
                     font_style = features['graphicalText']['fontStyle']
-                if 'fontWeight' in list(features['graphicalText'].keys()):
+                if 'fontWeight' in features['graphicalText']:
                     font_weight = features['graphicalText']['fontWeight']
-                if 'hTextAnchor' in list(features['graphicalText'].keys()):
+                if 'hTextAnchor' in features['graphicalText']:
                     if features['graphicalText']['hTextAnchor'] == 'start':
                         h_text_anchor = 'left'
                     elif features['graphicalText']['hTextAnchor'] == 'middle':
                         h_text_anchor = 'center'
                     elif features['graphicalText']['hTextAnchor'] == 'end':
                         h_text_anchor = 'right'
-                if 'vTextAnchor' in list(features['graphicalText'].keys()):
+                if 'vTextAnchor' in features['graphicalText']:
                     if features['graphicalText']['vTextAnchor'] == 'middle':
                         v_text_anchor = 'center'
                     else:
                         v_text_anchor = features['graphicalText']['vTextAnchor']
 
                 # get geometric shape features
-                if 'geometricShapes' in list(features['graphicalText'].keys()):
+                if 'geometricShapes' in features['graphicalText']:
                     for gs_index in range(len(features['graphicalText']['geometricShapes'])):
                         position_x = bbox_x
                         position_y = bbox_y
 
-                        if 'x' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'x' in features['graphicalText']['geometricShapes'][gs_index]:
                             position_x += features['graphicalText']['geometricShapes'][gs_index]['x']['abs'] + \
                                           0.01 * features['graphicalText']['geometricShapes'][gs_index]['x']['rel'] \
                                           * bbox_width
-                        if 'y' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'y' in features['graphicalText']['geometricShapes'][gs_index]:
                             position_y += features['graphicalText']['geometricShapes'][gs_index]['y']['abs'] + \
                                           0.01 * features['graphicalText']['geometricShapes'][gs_index]['y']['rel'] \
                                           * bbox_height
-                        if 'strokeColor' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'strokeColor' in features['graphicalText']['geometricShapes'][gs_index]:
                             font_color = self.graph_info.find_color_value(features['graphicalText']
                                                                           ['geometricShapes'][gs_index]['strokeColor'],
                                                                           False)
-                        if 'fontFamily' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'fontFamily' in features['graphicalText']['geometricShapes'][gs_index]:
                             font_family = features['graphicalText']['geometricShapes'][gs_index]['fontFamily']
-                        if 'fontSize' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'fontSize' in features['graphicalText']['geometricShapes'][gs_index]:
                             font_size = features['graphicalText']['geometricShapes'][gs_index]['fontSize']['abs'] + \
                                         0.01 * features['graphicalText']['geometricShapes'][gs_index]['fontSize']['rel'] \
                                         * bbox_width
-                        if 'fontStyle' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'fontStyle' in features['graphicalText']['geometricShapes'][gs_index]:
                             font_style = features['graphicalText']['geometricShapes'][gs_index]['fontStyle']
-                        if 'fontWeight' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'fontWeight' in features['graphicalText']['geometricShapes'][gs_index]:
                             font_weight = features['graphicalText']['geometricShapes'][gs_index]['fontWeight']
-                        if 'hTextAnchor' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'hTextAnchor' in features['graphicalText']['geometricShapes'][gs_index]:
                             if features['graphicalText']['geometricShapes'][gs_index]['hTextAnchor'] == 'start':
                                 h_text_anchor = 'left'
                             elif features['graphicalText']['geometricShapes'][gs_index]['hTextAnchor'] == 'middle':
                                 h_text_anchor = 'center'
                             elif features['graphicalText']['geometricShapes'][gs_index]['hTextAnchor'] == 'end':
                                 h_text_anchor = 'right'
-                        if 'vTextAnchor' in list(features['graphicalText']['geometricShapes'][gs_index].keys()):
+                        if 'vTextAnchor' in features['graphicalText']['geometricShapes'][gs_index]:
                             if features['graphicalText']['geometricShapes'][gs_index]['vTextAnchor'] == 'middle':
                                 v_text_anchor = 'center'
                             else:
@@ -388,12 +388,12 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                                    v_text_anchor, h_text_anchor, layer, sublayer)
 
     def add_line_endings_to_scene(self, features):
-        if 'graphicalCurve' in list(features.keys()) and 'heads' in list(features['graphicalCurve'].keys()):
+        if 'graphicalCurve' in features and 'heads' in features['graphicalCurve']:
             # draw start head
-            if 'start' in list(features['graphicalCurve']['heads'].keys()):
+            if 'start' in features['graphicalCurve']['heads']:
                 line_ending = self.graph_info.find_line_ending(features['graphicalCurve']['heads']['start'])
-                if line_ending and 'features' in list(line_ending.keys()):
-                    if 'enableRotation' in list(line_ending['features'].keys()) \
+                if line_ending and 'features' in line_ending:
+                    if 'enableRotation' in line_ending['features'] \
                             and not line_ending['features']['enableRotation']:
                         self.add_graphical_shape_to_scene(line_ending['features'],
                                                           offset_x=features['startPoint']['x'],
@@ -405,10 +405,10 @@ class NetworkInfoExportToFigureBase(NetworkInfoExportBase):
                                                           slope=features['startSlope'], layer=self.line_ending_layer)
 
             # draw end head
-            if 'end' in list(features['graphicalCurve']['heads'].keys()):
+            if 'end' in features['graphicalCurve']['heads']:
                 line_ending = self.graph_info.find_line_ending(features['graphicalCurve']['heads']['end'])
-                if line_ending and 'features' in list(line_ending.keys()):
-                    if 'enableRotation' in list(line_ending['features'].keys()) \
+                if line_ending and 'features' in line_ending:
+                    if 'enableRotation' in line_ending['features'] \
                             and not line_ending['features']['enableRotation']:
                         self.add_graphical_shape_to_scene(ax, line_ending['features'],
                                                           offset_x=features['endPoint']['x'],
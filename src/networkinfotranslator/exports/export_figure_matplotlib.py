@@ -1,4 +1,5 @@
 from .export_figure_base import NetworkInfoExportToFigureBase
+from ..tracing import traced, count_exported_entities
 import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyBboxPatch, Rectangle, Ellipse, Polygon, Path, PathPatch
@@ -134,7 +135,7 @@ class NetworkInfoExportToMatPlotLib(NetworkInfoExportToFigureBase):
         for v_index in range(len(curve_points)):
             vertices = [(curve_points[v_index]['startX'], self.graph_info.extents['maxY'] - curve_points[v_index]['startY'])]
             codes = [Path.MOVETO]
-            if 'basePoint1X' in list(curve_points[v_index].keys()):
+            if 'basePoint1X' in curve_points[v_index]:
                 vertices.append(
                     (curve_points[v_index]['basePoint1X'], self.graph_info.extents['maxY'] - curve_points[v_index]['basePoint1Y']))
                 vertices.append(
@@ -162,6 +163,7 @@ class NetworkInfoExportToMatPlotLib(NetworkInfoExportToFigureBase):
                      fontstyle=font_style, fontweight=font_weight,
                      va=v_text_anchor, ha=h_text_anchor, zorder=layer)
 
+    @traced("export.export", count_exported_entities)
     def export(self, file_name=""):
         if len(self.sbml_axes.patches):
             self.sbml_axes.set_aspect('equal')
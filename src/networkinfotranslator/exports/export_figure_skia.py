@@ -1,8 +1,49 @@
 from .export_figure_base import NetworkInfoExportToFigureBase
+from ..colors import color_to_rgba
+from ..tracing import traced, span, count_exported_entities
 import skia
+import functools
 import math
 from PIL import Image as PIL_Image
-from PIL import ImageColor
+
+
+@functools.lru_cache(maxsize=64)
+def get_typeface(font_family, font_weight, font_style):
+    if font_weight == "bold":
+        if font_style == "italic":
+            return skia.Typeface(font_family, skia.FontStyle().BoldItalic())
+        return skia.Typeface(font_family, skia.FontStyle().Bold())
+    if font_style == "italic":
+        return skia.Typeface(font_family, skia.FontStyle.Italic())
+
+    return skia.Typeface(font_family, skia.FontStyle.Normal())
+
+
+@functools.lru_cache(maxsize=16384)
+def fit_font_size(plain_text, font_size, width):
+    """
+    Returns the largest of font_size, font_size - 1, font_size - 2, ... at which the text, measured with the default
+    typeface, fits in the width.
+
+    The text width grows with the font size, so the number of points to shrink the font by is binary searched
+    instead of stepped through, and the size fitted to each label and box width is kept, as the same labels
+    come back on many glyphs.
+    """
+    text_font = skia.Font(None, font_size)
+    if text_font.measureText(plain_text) <= width:
+        return font_size
+    # no text is wider than the width once the font size is down to zero
+    fitting_decrement = max(1, math.ceil(font_size))
+    non_fitting_decrement = 0
+    while fitting_decrement - non_fitting_decrement > 1:
+        decrement = (non_fitting_decrement + fitting_decrement) // 2
+        text_font.setSize(font_size - decrement)
+        if text_font.measureText(plain_text) <= width:
+            fitting_decrement = decrement
+        else:
+            non_fitting_decrement = decrement
+
+    return font_size - fitting_decrement
 
 
 class NetworkInfoExportToSkia(NetworkInfoExportToFigureBase):
@@ -150,19 +191,19 @@ class NetworkInfoExportToSkia(NetworkInfoExportToFigureBase):
             for i in range(len(curve_points)):
                 vertex = {'startX': curve_points[i]['startX'] + horziontal_offset, 'startY': curve_points[i]['startY'] + vertical_offset,
                             'endX': curve_points[i]['endX'] + horziontal_offset, 'endY': curve_points[i]['endY'] + vertical_offset}
-                if 'basePoint1X' in list(curve_points[i].keys()):
+                if 'basePoint1X' in curve_points[i]:
                     vertex['basePoint1X'] = curve_points[i]['basePoint1X'] + horziontal_offset
                 else:
                     vertex['basePoint1X'] = curve_points[i]['startX'] + horziontal_offset
-                if 'basePoint1Y' in list(curve_points[i].keys()):
+                if 'basePoint1Y' in curve_points[i]:
                     vertex['basePoint1Y'] = curve_points[i]['basePoint1Y'] + vertical_offset
                 else:
                     vertex['basePoint1Y'] = curve_points[i]['startY'] + vertical_offset
-                if 'basePoint2X' in list(curve_points[i].keys()):
+                if 'basePoint2X' in curve_points[i]:
                     vertex['basePoint2X'] = curve_points[i]['basePoint2X'] + horziontal_offset
                 else:
                     vertex['basePoint2X'] = curve_points[i]['endX'] + horziontal_offset
-                if 'basePoint2Y' in list(curve_points[i].keys()):
+                if 'basePoint2Y' in curve_points[i]:
                     vertex['basePoint2Y'] = curve_points[i]['basePoint2Y'] + vertical_offset
                 else:
                     vertex['basePoint2Y'] = curve_points[i]['endY'] + vertical_offset
@@ -175,20 +216,8 @@ class NetworkInfoExportToSkia(NetworkInfoExportToFigureBase):
                    plain_text, font_color, font_family, font_size, font_style, font_weight,
                    v_text_anchor, h_text_anchor, layer, sublayer):
         text = {}
-        text_font = skia.Font(None, font_size)
-        while text_font.measureText(plain_text) > abs(width):
-            font_size = font_size - 1
-            text_font = skia.Font(None, font_size)
-        if font_weight == "bold":
-            if font_style == "italic":
-                text_font = skia.Font(skia.Typeface(font_family, skia.FontStyle().BoldItalic()), font_size)
-            else:
-                text_font = skia.Font(skia.Typeface(font_family, skia.FontStyle().Bold()), font_size)
-        else:
-            if font_style == "italic":
-                text_font = skia.Font(skia.Typeface(font_family, skia.FontStyle.Italic()), font_size)
-            else:
-                text_font = skia.Font(skia.Typeface(font_family, skia.FontStyle.Normal()), font_size)
+        font_size = fit_font_size(plain_text, font_size, abs(width))
+        text_font = skia.Font(get_typeface(font_family, font_weight, font_style), font_size)
         text_width = text_font.measureText(plain_text)
         text_height = text_font.getSize()
         text['text-paint'] = self._create_text_paint(font_color)
@@ -218,12 +247,16 @@ class NetworkInfoExportToSkia(NetworkInfoExportToFigureBase):
 
         return 0.0
 
+    @traced("export.export", count_exported_entities)
     def export(self, file_name=""):
         if file_name.split(".")[-1] == "pdf":
             self._export_as_pdf(file_name)
+        elif file_name.split(".")[-1] == "svg":
+            self._export_as_svg(file_name)
         else:
             self._export_as(file_name)
 
+    @traced("export.export", count_exported_entities)
     def export_as_pil_image(self):
         return PIL_Image.fromarray(self._get_image().convert(alphaType=skia.kUnpremul_AlphaType, colorType=skia.kRGB_888x_ColorType))
 
@@ -250,11 +283,11 @@ class NetworkInfoExportToSkia(NetworkInfoExportToFigureBase):
         stop_colors = []
         stop_positions = []
         for stop in gradient['features']['stops']:
-            if 'color' in list(stop.keys()):
+            if 'color' in stop:
                 stop_colors.append(self._get_skia_color((stop['color'])))
             else:
                 stop_colors.append("#ffffff")
-            if 'offset' in list(stop.keys()):
+            if 'offset' in stop:
                 stop_positions.append(0.01 * stop['offset']['rel'])
             else:
                 stop_positions.append(0.0)
@@ -273,156 +306,134 @@ class NetworkInfoExportToSkia(NetworkInfoExportToFigureBase):
                                                   positions=stop_positions)
 
     def _get_skia_color(self, color_name):
-        rgb_color = ImageColor.getcolor(self.graph_info.find_color_value(color_name, False), mode="RGBA")
+        rgb_color = color_to_rgba(self.graph_info.find_color_value(color_name, False), (255, 255, 255, 255))
         return skia.Color(rgb_color[0], rgb_color[1], rgb_color[2], rgb_color[3])
 
     def _export_as_pdf(self, file_name):
         stream = skia.FILEWStream(file_name)
+        self._write_pdf(stream)
+
+    def _write_pdf(self, stream):
         with skia.PDF.MakeDocument(stream) as document:
             with document.page(int(self.graph_info.extents['maxX'] - self.graph_info.extents['minX']) + + 2 * self.padding,
                                int(self.graph_info.extents['maxY'] - self.graph_info.extents['minY']) + + 2 * self.padding) as canvas:
-                canvas.drawRect(self.background_canvas['rectangle'], self.background_canvas['fill'])
-                self.sort_layers(self.layers)
-                for layer in self.layers:
-                    for sublayer in layer.sub_layers:
-                        for simple_rectangle in sublayer.simple_rectangles:
-                            if 'translate' in list(simple_rectangle.keys()):
-                                canvas.translate(simple_rectangle['translate']['x'], simple_rectangle['translate']['y'])
-                                canvas.rotate(simple_rectangle['rotate'])
-                            canvas.drawRect(simple_rectangle["rectangle"], simple_rectangle["border"])
-                            canvas.drawRect(simple_rectangle["rectangle"], simple_rectangle["fill"])
-                            if 'translate' in list(simple_rectangle.keys()):
-                                canvas.rotate(-simple_rectangle['rotate'])
-                                canvas.translate(-simple_rectangle['translate']['x'], -simple_rectangle['translate']['y'])
-                        for rounded_rectangle in sublayer.rounded_rectangles:
-                            if 'translate' in list(rounded_rectangle.keys()):
-                                canvas.translate(rounded_rectangle['translate']['x'], rounded_rectangle['translate']['y'])
-                                canvas.rotate(rounded_rectangle['rotate'])
-                            canvas.drawRoundRect(rounded_rectangle["rectangle"], rounded_rectangle["border-radius"],
-                                                 rounded_rectangle["border-radius"], rounded_rectangle["border"])
-                            canvas.drawRoundRect(rounded_rectangle["rectangle"], rounded_rectangle["border-radius"],
-                                                 rounded_rectangle["border-radius"], rounded_rectangle["fill"])
-                            if 'translate' in list(rounded_rectangle.keys()):
-                                canvas.rotate(-rounded_rectangle['rotate'])
-                                canvas.translate(-rounded_rectangle['translate']['x'], -rounded_rectangle['translate']['y'])
-                        for ellipse in sublayer.ellipses:
-                            if 'translate' in list(ellipse.keys()):
-                                canvas.translate(ellipse['translate']['x'], ellipse['translate']['y'])
-                                canvas.rotate(ellipse['rotate'])
-                            canvas.drawOval(ellipse["rectangle"], ellipse["border"])
-                            canvas.drawOval(ellipse["rectangle"], ellipse["fill"])
-                            if 'translate' in list(ellipse.keys()):
-                                canvas.rotate(-ellipse['rotate'])
-                                canvas.translate(-ellipse['translate']['x'], -ellipse['translate']['y'])
-                        for polygon in sublayer.polygons:
-                            if 'translate' in list(polygon.keys()):
-                                canvas.translate(polygon['translate']['x'], polygon['translate']['y'])
-                                canvas.rotate(polygon['rotate'])
-                            path = skia.Path()
-                            path.moveTo(polygon['move-to-vertex']['x'], polygon['move-to-vertex']['y'])
-                            for vertex in polygon['line-to-vertices']:
-                                path.lineTo(vertex['x'], vertex['y'])
-                            path.close()
-                            canvas.drawPath(path, polygon["border"])
-                            canvas.drawPath(path, polygon["fill"])
-                            if 'translate' in list(polygon.keys()):
-                                canvas.rotate(-polygon['rotate'])
-                                canvas.translate(-polygon['translate']['x'], -polygon['translate']['y'])
-                        for curve in sublayer.curves:
-                            if 'translate' in list(curve.keys()):
-                                canvas.translate(curve['translate']['x'], curve['translate']['y'])
-                                canvas.rotate(curve['rotate'])
-                            for vertex in curve['vertices']:
-                                path = skia.Path()
-                                path.moveTo(vertex['startX'], vertex['startY'])
-                                path.cubicTo(vertex['basePoint1X'], vertex['basePoint1Y'],
-                                             vertex['basePoint2X'], vertex['basePoint2Y'],
-                                             vertex['endX'], vertex['endY'])
-                                canvas.drawPath(path, curve["border"])
-                            if 'translate' in list(curve.keys()):
-                                canvas.rotate(-curve['rotate'])
-                                canvas.translate(-curve['translate']['x'], -curve['translate']['y'])
-                        for text in sublayer.texts:
-                            canvas.drawTextBlob(text['text'], text['x'], text['y'], text['text-paint'])
+                self._draw(canvas)
+
+    def _export_as_svg(self, file_name):
+        stream = skia.FILEWStream(file_name)
+        self._write_svg(stream)
+        stream.flush()
+
+    def _write_svg(self, stream):
+        canvas = skia.SVGCanvas.Make(
+            (int(self.graph_info.extents['maxX'] - self.graph_info.extents['minX'] + 2 * self.padding),
+             int(self.graph_info.extents['maxY'] - self.graph_info.extents['minY'] + 2 * self.padding)), stream)
+        self._draw(canvas)
+        # the svg canvas completes the document only once deleted
+        del canvas
 
     def _export_as(self, file_name):
         image = self._get_image()
-        if file_name.split(".")[-1] == "jpg":
-            image.save(file_name, skia.kJPEG)
-        else:
-            image.save(file_name, skia.kPNG)
+        with span("export.encode"):
+            if file_name.split(".")[-1] == "jpg":
+                image.save(file_name, skia.kJPEG)
+            else:
+                image.save(file_name, skia.kPNG)
+
+    @traced("export.export", count_exported_entities)
+    def export_as_bytes(self, file_format="png"):
+        """returns the content of the file the figure would be exported to in the format (png, jpg, pdf or svg)"""
+        if file_format in ["pdf", "svg"]:
+            stream = skia.DynamicMemoryWStream()
+            if file_format == "pdf":
+                self._write_pdf(stream)
+            else:
+                self._write_svg(stream)
+            return bytes(stream.detachAsData())
+        image = self._get_image()
+        with span("export.encode"):
+            if file_format == "jpg":
+                return bytes(image.encodeToData(skia.kJPEG, 100))
+
+            return bytes(image.encodeToData(skia.kPNG, 100))
 
     def _get_image(self):
-        surface = skia.Surface(
-            int(self.graph_info.extents['maxX'] - self.graph_info.extents['minX'] + 2 * self.padding),
-            int(self.graph_info.extents['maxY'] - self.graph_info.extents['minY'] + 2 * self.padding))
-        with surface as canvas:
-            canvas.drawRect(self.background_canvas['rectangle'], self.background_canvas['fill'])
-            self.sort_layers(self.layers)
-            for layer in self.layers:
-                for sublayer in layer.sub_layers:
-                    for simple_rectangle in sublayer.simple_rectangles:
-                        if 'translate' in list(simple_rectangle.keys()):
-                            canvas.translate(simple_rectangle['translate']['x'], simple_rectangle['translate']['y'])
-                            canvas.rotate(simple_rectangle['rotate'])
-                        canvas.drawRect(simple_rectangle["rectangle"], simple_rectangle["border"])
-                        canvas.drawRect(simple_rectangle["rectangle"], simple_rectangle["fill"])
-                        if 'translate' in list(simple_rectangle.keys()):
-                            canvas.rotate(-simple_rectangle['rotate'])
-                            canvas.translate(-simple_rectangle['translate']['x'], -simple_rectangle['translate']['y'])
-                    for rounded_rectangle in sublayer.rounded_rectangles:
-                        if 'translate' in list(rounded_rectangle.keys()):
-                            canvas.translate(rounded_rectangle['translate']['x'], rounded_rectangle['translate']['y'])
-                            canvas.rotate(rounded_rectangle['rotate'])
-                        canvas.drawRoundRect(rounded_rectangle["rectangle"], rounded_rectangle["border-radius"],
-                                             rounded_rectangle["border-radius"], rounded_rectangle["border"])
-                        canvas.drawRoundRect(rounded_rectangle["rectangle"], rounded_rectangle["border-radius"],
-                                             rounded_rectangle["border-radius"], rounded_rectangle["fill"])
-                        if 'translate' in list(rounded_rectangle.keys()):
-                            canvas.rotate(-rounded_rectangle['rotate'])
-                            canvas.translate(-rounded_rectangle['translate']['x'], -rounded_rectangle['translate']['y'])
-                    for ellipse in sublayer.ellipses:
-                        if 'translate' in list(ellipse.keys()):
-                            canvas.translate(ellipse['translate']['x'], ellipse['translate']['y'])
-                            canvas.rotate(ellipse['rotate'])
-                        canvas.drawOval(ellipse["rectangle"], ellipse["border"])
-                        canvas.drawOval(ellipse["rectangle"], ellipse["fill"])
-                        if 'translate' in list(ellipse.keys()):
-                            canvas.rotate(-ellipse['rotate'])
-                            canvas.translate(-ellipse['translate']['x'], -ellipse['translate']['y'])
-                    for polygon in sublayer.polygons:
-                        if 'translate' in list(polygon.keys()):
-                            canvas.translate(polygon['translate']['x'], polygon['translate']['y'])
-                            canvas.rotate(polygon['rotate'])
-                        path = skia.Path()
-                        path.moveTo(polygon['move-to-vertex']['x'], polygon['move-to-vertex']['y'])
-                        for vertex in polygon['line-to-vertices']:
-                            path.lineTo(vertex['x'], vertex['y'])
-                        path.close()
-                        canvas.drawPath(path, polygon["border"])
-                        canvas.drawPath(path, polygon["fill"])
-                        if 'translate' in list(polygon.keys()):
-                            canvas.rotate(-polygon['rotate'])
-                            canvas.translate(-polygon['translate']['x'], -polygon['translate']['y'])
-                    for curve in sublayer.curves:
-                        if 'translate' in list(curve.keys()):
-                            canvas.translate(curve['translate']['x'], curve['translate']['y'])
-                            canvas.rotate(curve['rotate'])
-                        for vertex in curve['vertices']:
-                            path = skia.Path()
-                            path.moveTo(vertex['startX'], vertex['startY'])
-                            path.cubicTo(vertex['basePoint1X'], vertex['basePoint1Y'],
-                                         vertex['basePoint2X'], vertex['basePoint2Y'],
-                                         vertex['endX'], vertex['endY'])
-                            canvas.drawPath(path, curve["border"])
-                        if 'translate' in list(curve.keys()):
-                            canvas.rotate(-curve['rotate'])
-                            canvas.translate(-curve['translate']['x'], -curve['translate']['y'])
-                    for text in sublayer.texts:
-                        canvas.drawTextBlob(text['text'], text['x'], text['y'], text['text-paint'])
+        width = int(self.graph_info.extents['maxX'] - self.graph_info.extents['minX'] + 2 * self.padding)
+        height = int(self.graph_info.extents['maxY'] - self.graph_info.extents['minY'] + 2 * self.padding)
+        # the surface holds 4 bytes per pixel
+        with span("export.allocate_surface", {'surface_bytes': 4 * width * height}):
+            surface = skia.Surface(width, height)
+        with span("export.rasterize"), surface as canvas:
+            self._draw(canvas)
 
         return surface.makeImageSnapshot()
 
+    @traced("export.draw")
+    def _draw(self, canvas):
+        canvas.drawRect(self.background_canvas['rectangle'], self.background_canvas['fill'])
+        self.sort_layers(self.layers)
+        for layer in self.layers:
+            for sublayer in layer.sub_layers:
+                for simple_rectangle in sublayer.simple_rectangles:
+                    if 'translate' in simple_rectangle:
+                        canvas.translate(simple_rectangle['translate']['x'], simple_rectangle['translate']['y'])
+                        canvas.rotate(simple_rectangle['rotate'])
+                    canvas.drawRect(simple_rectangle["rectangle"], simple_rectangle["border"])
+                    canvas.drawRect(simple_rectangle["rectangle"], simple_rectangle["fill"])
+                    if 'translate' in simple_rectangle:
+                        canvas.rotate(-simple_rectangle['rotate'])
+                        canvas.translate(-simple_rectangle['translate']['x'], -simple_rectangle['translate']['y'])
+                for rounded_rectangle in sublayer.rounded_rectangles:
+                    if 'translate' in rounded_rectangle:
+                        canvas.translate(rounded_rectangle['translate']['x'], rounded_rectangle['translate']['y'])
+                        canvas.rotate(rounded_rectangle['rotate'])
+                    canvas.drawRoundRect(rounded_rectangle["rectangle"], rounded_rectangle["border-radius"],
+                                         rounded_rectangle["border-radius"], rounded_rectangle["border"])
+                    canvas.drawRoundRect(rounded_rectangle["rectangle"], rounded_rectangle["border-radius"],
+                                         rounded_rectangle["border-radius"], rounded_rectangle["fill"])
+                    if 'translate' in rounded_rectangle:
+                        canvas.rotate(-rounded_rectangle['rotate'])
+                        canvas.translate(-rounded_rectangle['translate']['x'], -rounded_rectangle['translate']['y'])
+                for ellipse in sublayer.ellipses:
+                    if 'translate' in ellipse:
+                        canvas.translate(ellipse['translate']['x'], ellipse['translate']['y'])
+                        canvas.rotate(ellipse['rotate'])
+                    canvas.drawOval(ellipse["rectangle"], ellipse["border"])
+                    canvas.drawOval(ellipse["rectangle"], ellipse["fill"])
+                    if 'translate' in ellipse:
+                        canvas.rotate(-ellipse['rotate'])
+                        canvas.translate(-ellipse['translate']['x'], -ellipse['translate']['y'])
+                for polygon in sublayer.polygons:
+                    if 'translate' in polygon:
+                        canvas.translate(polygon['translate']['x'], polygon['translate']['y'])
+                        canvas.rotate(polygon['rotate'])
+                    path = skia.Path()
+                    path.moveTo(polygon['move-to-vertex']['x'], polygon['move-to-vertex']['y'])
+                    for vertex in polygon['line-to-vertices']:
+                        path.lineTo(vertex['x'], vertex['y'])
+                    path.close()
+                    canvas.drawPath(path, polygon["border"])
+                    canvas.drawPath(path, polygon["fill"])
+                    if 'translate' in polygon:
+                        canvas.rotate(-polygon['rotate'])
+                        canvas.translate(-polygon['translate']['x'], -polygon['translate']['y'])
+                for curve in sublayer.curves:
+                    if 'translate' in curve:
+                        canvas.translate(curve['translate']['x'], curve['translate']['y'])
+                        canvas.rotate(curve['rotate'])
+                    for vertex in curve['vertices']:
+                        path = skia.Path()
+                        path.moveTo(vertex['startX'], vertex['startY'])
+                        path.cubicTo(vertex['basePoint1X'], vertex['basePoint1Y'],
+                                     vertex['basePoint2X'], vertex['basePoint2Y'],
+                                     vertex['endX'], vertex['endY'])
+                        canvas.drawPath(path, curve["border"])
+                    if 'translate' in curve:
+                        canvas.rotate(-curve['rotate'])
+                        canvas.translate(-curve['translate']['x'], -curve['translate']['y'])
+                for text in sublayer.texts:
+                    canvas.drawTextBlob(text['text'], text['x'], text['y'], text['text-paint'])
+
 
 class Layer:
     def __init__(self, layer_index):
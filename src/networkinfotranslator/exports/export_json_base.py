@@ -13,24 +13,24 @@ class NetworkInfoExportToJsonBase(NetworkInfoExportBase):
         self.edges.clear()
 
     def add_compartment(self, compartment):
-        if 'id' in list(compartment.keys()) and 'referenceId' in list(compartment.keys()):
+        if 'id' in compartment and 'referenceId' in compartment:
             self.add_node(compartment, "Compartment")
 
     def add_species(self, species):
-        if 'id' in list(species.keys()) and 'referenceId' in list(species.keys()):
+        if 'id' in species and 'referenceId' in species:
             self.add_node(species, "Species")
 
     def add_reaction(self, reaction):
-        if 'id' in list(reaction.keys()) and 'referenceId' in list(reaction.keys()):
+        if 'id' in reaction and 'referenceId' in reaction:
             self.add_node(reaction, "Reaction")
 
-            if 'speciesReferences' in list(reaction.keys()):
+            if 'speciesReferences' in reaction:
                 for sr in reaction['speciesReferences']:
                     self.add_species_reference(reaction, sr)
 
     def add_species_reference(self, reaction, species_reference):
-        if 'id' in list(species_reference.keys()) and 'referenceId' in list(species_reference.keys()) \
-                and 'species' in list(species_reference.keys()):
+        if 'id' in species_reference and 'referenceId' in species_reference \
+                and 'species' in species_reference:
             self.add_edge(species_reference, reaction)
 
     def add_node(self, go):
@@ -1,4 +1,5 @@
 from .export_json_base import NetworkInfoExportToJsonBase
+from ..tracing import traced, count_exported_entities
 import json
 import math
 from pathlib import Path as pathlib
@@ -35,16 +36,14 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
 
     @staticmethod
     def set_entity_metaid(item, go):
-        if 'metaId' in list(go.keys()):
+        if 'metaId' in go:
             item['metaId'] = go['metaId']
 
     def set_entity_compartment(self, item, go):
-        if 'compartment' in list(go.keys()):
-
-            for c in self.graph_info.compartments:
-                if c['referenceId'] == go['compartment']:
-                    item['parent'] = c['id']
-                    break
+        if 'compartment' in go:
+            compartment = self.graph_info.find_compartment(go['compartment'])
+            if compartment:
+                item['parent'] = compartment['id']
 
     @staticmethod
     def initialize_node_style(go, category):
@@ -86,42 +85,40 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
                 'name-title': "Id", 'is-name-editable': True, 'shapes': []}
 
     def set_edge_nodes(self, edge, species_reference, reaction):
-        species = {}
-        for s in self.graph_info.species:
-            if s['referenceId'] == species_reference['species'] and s['id'] == species_reference['species_glyph_id']:
-                species = s
-                break
-        if 'role' in list(species_reference.keys()):
+        species = self.graph_info.find_species_glyph(species_reference['species_glyph_id'])
+        if not species or species['referenceId'] != species_reference['species']:
+            species = {}
+        if 'role' in species_reference:
             if species_reference['role'].lower() == "product" or species_reference['role'].lower() == "side product":
                 edge['source'], edge['target'] = self.get_edge_nodes_features(reaction, species)
             else:
                 edge['source'], edge['target'] = self.get_edge_nodes_features(species, reaction)
 
     def extract_node_features(self, go, node, style):
-        if 'features' in list(go.keys()):
+        if 'features' in go:
             node['position'] = self.get_node_position(go)
             node['dimensions'] = self.get_node_dimensions(go)
-            if 'curve' in list(go['features'].keys()):
+            if 'curve' in go['features']:
                 style['shapes'] = self.get_centroid_shape_style(go)
-            elif 'graphicalShape' in list(go['features'].keys()) \
-                    and 'geometricShapes' in list(go['features']['graphicalShape'].keys()):
+            elif 'graphicalShape' in go['features'] \
+                    and 'geometricShapes' in go['features']['graphicalShape']:
                 if len(go['features']['graphicalShape']['geometricShapes']):
                     style['shapes'] = self.get_shape_style(go, offset_x=-0.5 * go['features']['boundingBox']['width'],
                                                            offset_y=-0.5 * go['features']['boundingBox']['height'])
-                elif 'curve' in list(go['features'].keys()):
+                elif 'curve' in go['features']:
                     style['shapes'] = self.get_centroid_shape_style(go)
-            if 'texts' in list(go.keys()):
+            if 'texts' in go:
                 for text in go['texts']:
-                    if 'features' in list(text.keys()):
+                    if 'features' in text:
                         style['shapes'].append(self.get_node_text(text, go['features']['boundingBox']))
 
     def extract_edge_features(self, go, style):
-        if 'features' in list(go.keys()) and 'graphicalCurve' in list(go['features'].keys()):
+        if 'features' in go and 'graphicalCurve' in go['features']:
             curve_style = self.get_curve_style(go)
             curve_style["shape"] = self.get_curve_style_shape_type(style)
             style['shapes'].append(curve_style)
-            if 'heads' in list(go['features']['graphicalCurve'].keys()) \
-                    and 'end' in list(go['features']['graphicalCurve']['heads'].keys()):
+            if 'heads' in go['features']['graphicalCurve'] \
+                    and 'end' in go['features']['graphicalCurve']['heads']:
                 style['arrow-head'] =\
                     self.get_arrow_heads(go['features']['graphicalCurve']['heads'], style['name'])
 
@@ -134,12 +131,12 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
 
     @staticmethod
     def get_node_position(go):
-        if 'features' in list(go.keys()):
-            if 'curve' in list(go['features'].keys()):
+        if 'features' in go:
+            if 'curve' in go['features']:
                 if len(go['features']['curve']):
                     return {'x': 0.5 * (go['features']['curve'][0]['startX'] + go['features']['curve'][-1]['endX']),
                             'y': 0.5 * (go['features']['curve'][0]['startY'] + go['features']['curve'][-1]['endY'])}
-            elif 'boundingBox' in list(go['features'].keys()):
+            elif 'boundingBox' in go['features']:
                 return {'x': go['features']['boundingBox']['x']
                              + 0.5 * go['features']['boundingBox']['width'],
                         'y': go['features']['boundingBox']['y']
@@ -149,10 +146,10 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
 
     @staticmethod
     def get_node_dimensions(go):
-        if 'features' in list(go.keys()):
-            if 'curve' in list(go['features'].keys()):
+        if 'features' in go:
+            if 'curve' in go['features']:
                 return {'width': 0.2, 'height': 0.2}
-            elif 'boundingBox' in list(go['features'].keys()):
+            elif 'boundingBox' in go['features']:
                 return {'width': go['features']['boundingBox']['width'],
                         'height': go['features']['boundingBox']['height']}
 
@@ -178,21 +175,21 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
         geometric_shapes = []
         for gs in go['features']['graphicalShape']['geometricShapes']:
             geometric_shape = {}
-            if 'strokeColor' in list(go['features']['graphicalShape'].keys()):
+            if 'strokeColor' in go['features']['graphicalShape']:
                 default_stroke = \
                     self.graph_info.find_color_value(go['features']['graphicalShape']['strokeColor'])
                 if default_stroke:
                     geometric_shape['border-color'] = default_stroke
-            if 'strokeWidth' in list(go['features']['graphicalShape'].keys()):
+            if 'strokeWidth' in go['features']['graphicalShape']:
                 geometric_shape['border-width'] = go['features']['graphicalShape']['strokeWidth']
-            if 'fillColor' in list(go['features']['graphicalShape'].keys()):
+            if 'fillColor' in go['features']['graphicalShape']:
                 default_fill = \
                     self.graph_info.find_color_value(go['features']['graphicalShape']['fillColor'])
                 if default_fill:
                     geometric_shape['fill-color'] = default_fill
             geometric_shape.update(
                 self.get_geometric_shape_features(gs, self.get_node_dimensions(go), offset_x, offset_y))
-            if 'shape' in list(geometric_shape.keys()):
+            if 'shape' in geometric_shape:
                 geometric_shapes.append(geometric_shape)
         return geometric_shapes
 
@@ -200,42 +197,42 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
     def get_centroid_shape_style(go):
         geometric_shape = {'shape': "centroid"}
         graphical_features = {}
-        if 'graphicalCurve' in list(go['features'].keys()):
+        if 'graphicalCurve' in go['features']:
             graphical_features = go['features']['graphicalCurve']
-        elif 'graphicalShape' in list(go['features'].keys()):
+        elif 'graphicalShape' in go['features']:
             graphical_features = go['features']['graphicalShape']
-        if 'strokeColor' in list(graphical_features.keys()):
+        if 'strokeColor' in graphical_features:
             geometric_shape['border-color'] = graphical_features['strokeColor']
-        if 'strokeWidth' in list(graphical_features.keys()):
+        if 'strokeWidth' in graphical_features:
             geometric_shape['border-width'] = graphical_features['strokeWidth']
-        if 'fillColor' in list(graphical_features.keys()):
+        if 'fillColor' in graphical_features:
             geometric_shape['fill-color'] = graphical_features['fillColor']
 
         return [geometric_shape]
 
     def get_curve_style(self, go):
         geometric_shape = {}
-        if 'strokeColor' in list(go['features']['graphicalCurve'].keys()):
+        if 'strokeColor' in go['features']['graphicalCurve']:
             default_stroke = \
                 self.graph_info.find_color_value(go['features']['graphicalCurve']['strokeColor'])
             if default_stroke:
                 geometric_shape['border-color'] = default_stroke
-        if 'strokeWidth' in list(go['features']['graphicalCurve'].keys()):
+        if 'strokeWidth' in go['features']['graphicalCurve']:
             geometric_shape['border-width'] = go['features']['graphicalCurve']['strokeWidth']
         geometric_shape.update(self.get_curve_style_features(go['features']['graphicalCurve']))
-        if 'curve' in list(go['features'].keys()) and len(go['features']['curve']):
+        if 'curve' in go['features'] and len(go['features']['curve']):
             geometric_shape.update(self.get_curve_features(go['features']['curve']))
         return geometric_shape
 
     def get_geometric_shape_features(self, gs, dimensions, offset_x, offset_y):
         geometric_shape = {}
-        if 'strokeColor' in list(gs.keys()):
+        if 'strokeColor' in gs:
             geometric_shape['border-color'] = self.graph_info.find_color_value(gs['strokeColor'])
-        if 'strokeWidth' in list(gs.keys()):
+        if 'strokeWidth' in gs:
             geometric_shape['border-width'] = gs['strokeWidth']
-        if 'fillColor' in list(gs.keys()):
+        if 'fillColor' in gs:
             geometric_shape['fill-color'] = self.graph_info.find_color_value(gs['fillColor'])
-        if 'shape' in list(gs.keys()):
+        if 'shape' in gs:
             if gs['shape'].lower() == "rectangle":
                 geometric_shape.update(
                     self.get_rectangle_features(gs, dimensions, offset_x, offset_y))
@@ -249,11 +246,11 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
 
     def get_curve_style_features(self, gc):
         geometric_shape = {}
-        if 'strokeColor' in list(gc.keys()):
+        if 'strokeColor' in gc:
             geometric_shape['stroke'] = self.graph_info.find_color_value(gc['strokeColor'])
-        if 'strokeWidth' in list(gc.keys()):
+        if 'strokeWidth' in gc:
             geometric_shape['border-width'] = gc['strokeWidth']
-        if 'fillColor' in list(gc.keys()):
+        if 'fillColor' in gc:
             geometric_shape['fill-color'] = self.graph_info.find_color_value(gc['fillColor'])
         return geometric_shape
 
@@ -292,19 +289,19 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
     @staticmethod
     def get_ellipse_features(gs, dimensions, offset_x, offset_y):
         ellipse_shape = {'shape': "ellipse"}
-        if 'cx' in list(gs.keys()):
+        if 'cx' in gs:
             ellipse_shape['center-x'] = gs['cx']['abs'] + 0.01 * gs['cx'][
                 'rel'] * dimensions['width'] + offset_x
-        if 'cy' in list(gs.keys()):
+        if 'cy' in gs:
             ellipse_shape['center-y'] = gs['cy']['abs'] + 0.01 * gs['cy'][
                 'rel'] * dimensions['height'] + offset_y
-        if 'rx' in list(gs.keys()):
+        if 'rx' in gs:
             ellipse_shape['radius-x'] = gs['rx']['abs'] + 0.01 * gs['rx'][
                 'rel'] * dimensions['width']
-        if 'ry' in list(gs.keys()):
+        if 'ry' in gs:
             ellipse_shape['radius-y'] = gs['ry']['abs'] + \
                                   0.01 * gs['ry']['rel'] * dimensions['height']
-        if 'ratio' in list(gs.keys()) and gs['ratio'] > 0.0:
+        if 'ratio' in gs and gs['ratio'] > 0.0:
             if (dimensions['width'] / dimensions['height']) <= gs['ratio']:
                 ellipse_shape['radius-x'] = 0.5 * dimensions['width']
                 ellipse_shape['radius-y'] = (0.5 * dimensions['width'] / gs['ratio'])
@@ -316,19 +313,19 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
     @staticmethod
     def get_rectangle_features(gs, dimensions, offset_x, offset_y):
         rectangle_shape = {'shape': "rectangle"}
-        if 'x' in list(gs.keys()):
+        if 'x' in gs:
             rectangle_shape['x'] = gs['x']['abs'] + \
                                    0.01 * gs['x']['rel'] * dimensions['width'] + offset_x
-        if 'y' in list(gs.keys()):
+        if 'y' in gs:
             rectangle_shape['y'] = gs['y']['abs'] + \
                                    0.01 * gs['y']['rel'] * dimensions['height'] + offset_y
-        if 'width' in list(gs.keys()):
+        if 'width' in gs:
             rectangle_shape['width'] = gs['width']['abs'] + \
                                        0.01 * gs['width']['rel'] * dimensions['width']
-        if 'height' in list(gs.keys()):
+        if 'height' in gs:
             rectangle_shape['height'] = gs['height']['abs'] + \
                                         0.01 * gs['height']['rel'] * dimensions['height']
-        if 'ratio' in list(gs.keys()) and gs['ratio'] > 0.0:
+        if 'ratio' in gs and gs['ratio'] > 0.0:
             if (dimensions['width'] / dimensions['height']) <= gs['ratio']:
                 rectangle_shape['width'] = dimensions['width']
                 rectangle_shape['height'] = dimensions['height'] / gs['ratio']
@@ -337,10 +334,10 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
                 rectangle_shape['height'] = dimensions['height']
                 rectangle_shape['width'] = gs['ratio'] * dimensions['height']
                 rectangle_shape['x'] += 0.5 * (dimensions['width'] - rectangle_shape['width'])
-        if 'rx' in list(gs.keys()):
+        if 'rx' in gs:
             rectangle_shape['border-radius-x'] = gs['rx']['abs'] + \
                                     0.01 * gs['rx']['rel'] * 0.5 * dimensions['width']
-        if 'ry' in list(gs.keys()):
+        if 'ry' in gs:
             rectangle_shape['border-radius-y'] = gs['ry']['abs'] + \
                                     0.01 * gs['ry']['rel'] * 0.5 * dimensions['height']
             return rectangle_shape
@@ -348,7 +345,7 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
     @staticmethod
     def get_polygon_features(gs, dimensions, offset_x, offset_y):
         polygon_shape = {'shape': "polygon"}
-        if 'vertices' in list(gs.keys()):
+        if 'vertices' in gs:
             points = []
             for v_index in range(len(gs['vertices'])):
                 points.append({'x': gs['vertices'][v_index]['renderPointX']['abs'] + 0.01 *
@@ -360,40 +357,40 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
 
     def get_node_text(self, text, go_bounding_box):
         text_shape = {'shape': "text"}
-        if 'plainText' in list(text['features'].keys()):
+        if 'plainText' in text['features']:
             text_shape['plain-text'] = text['features']['plainText']
         text_shape['plain-text-alternatives'] = []
-        if 'text-name' in list(text['features'].keys()) and text['features']['text-name'] != text_shape['plain-text']:
+        if 'text-name' in text['features'] and text['features']['text-name'] != text_shape['plain-text']:
             text_shape['plain-text-alternatives'].append(text['features']['text-name'])
-        if 'text-id' in list(text['features'].keys()) and text['features']['text-id'] != text_shape['plain-text']:
+        if 'text-id' in text['features'] and text['features']['text-id'] != text_shape['plain-text']:
             text_shape['plain-text-alternatives'].append(text['features']['text-id'])
-        if 'graphicalText' in list(text['features'].keys()):
+        if 'graphicalText' in text['features']:
             text_shape.update(self.get_text_features(text, go_bounding_box))
         return text_shape
 
     def get_text_features(self, text, go_bounding_box):
         features = {}
-        if 'strokeColor' in list(text['features']['graphicalText'].keys()):
+        if 'strokeColor' in text['features']['graphicalText']:
             features['text-color'] = \
                 self.graph_info.find_color_value(text['features']['graphicalText']['strokeColor'])
-        if 'fontFamily' in list(text['features']['graphicalText'].keys()):
+        if 'fontFamily' in text['features']['graphicalText']:
             features['font-family'] = text['features']['graphicalText']['fontFamily']
-        if 'fontWeight' in list(text['features']['graphicalText'].keys()):
+        if 'fontWeight' in text['features']['graphicalText']:
             features['font-weight'] = text['features']['graphicalText']['fontWeight']
-        if 'fontStyle' in list(text['features']['graphicalText'].keys()):
+        if 'fontStyle' in text['features']['graphicalText']:
             features['font-style'] = text['features']['graphicalText']['fontStyle']
-        if 'hTextAnchor' in list(text['features']['graphicalText'].keys()):
+        if 'hTextAnchor' in text['features']['graphicalText']:
             features['horizontal-alignment'] = text['features']['graphicalText']['hTextAnchor']
-        if 'vTextAnchor' in list(text['features']['graphicalText'].keys()):
+        if 'vTextAnchor' in text['features']['graphicalText']:
             features['vertical-alignment'] = text['features']['graphicalText']['vTextAnchor']
-        if 'boundingBox' in list(text['features'].keys()):
+        if 'boundingBox' in text['features']:
             features['x'] = text['features']['boundingBox']['x'] -\
                             (go_bounding_box['x'] + 0.5 * go_bounding_box['width'])
             features['y'] = text['features']['boundingBox']['y'] -\
                             (go_bounding_box['y'] + 0.5 * go_bounding_box['height'])
             features['width'] = text['features']['boundingBox']['width']
             features['height'] = text['features']['boundingBox']['height']
-            if 'fontSize' in list(text['features']['graphicalText'].keys()):
+            if 'fontSize' in text['features']['graphicalText']:
                 features['font-size'] = text['features']['graphicalText']['fontSize']['abs'] +\
                                         text['features']['boundingBox']['width'] * \
                                         text['features']['graphicalText']['fontSize']['rel']
@@ -402,14 +399,15 @@ class NetworkInfoExportToNetworkEditor(NetworkInfoExportToJsonBase):
     def get_arrow_heads(self, heads, style_name):
         line_ending_style = {'name': style_name + "_ArrowHead", 'category': "LineEnding", 'shapes': []}
         line_ending = self.graph_info.find_line_ending(heads['end'])
-        if line_ending and 'graphicalShape' in list(line_ending['features'].keys())\
-            and 'geometricShapes' in list(line_ending['features']['graphicalShape'].keys()):
+        if line_ending and 'graphicalShape' in line_ending['features']\
+            and 'geometricShapes' in line_ending['features']['graphicalShape']:
             line_ending_style['shapes'] =\
                 self.get_shape_style(line_ending,
                                      offset_x=line_ending['features']['boundingBox']['x'],
                                      offset_y=line_ending['features']['boundingBox']['y'])
         return line_ending_style
 
+    @traced("export.export", count_exported_entities)
     def export(self, file_name=""):
         position = {'x': self.graph_info.extents['minX'] + 0.5 * (self.graph_info.extents['maxX'] - self.graph_info.extents['minX']),
                     'y': self.graph_info.extents['minY'] + 0.5 * (self.graph_info.extents['maxY'] - self.graph_info.extents['minY'])}
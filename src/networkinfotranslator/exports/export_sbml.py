@@ -1,4 +1,5 @@
 from .export_base import NetworkInfoExportBase
+from ..tracing import traced, span, count_exported_entities
 import libsbml
 
 
@@ -15,20 +16,24 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
     def reset(self):
         super().reset()
 
+    @traced("export.extract_graph_info", count_exported_entities)
     def extract_graph_info(self, graph_info):
         self.create_model()
         super().extract_graph_info(graph_info)
         self.set_layout_dimensions()
         self.set_render_background_color()
 
-        for color in self.graph_info.colors:
-            self.add_color(color)
+        with span("export.add_color", {'colors': len(self.graph_info.colors)}):
+            for color in self.graph_info.colors:
+                self.add_color(color)
 
-        for gradient in self.graph_info.gradients:
-            self.add_gradient(gradient)
+        with span("export.add_gradient", {'gradients': len(self.graph_info.gradients)}):
+            for gradient in self.graph_info.gradients:
+                self.add_gradient(gradient)
 
-        for line_ending in self.graph_info.line_endings:
-            self.add_line_ending(line_ending)
+        with span("export.add_line_ending", {'line_endings': len(self.graph_info.line_endings)}):
+            for line_ending in self.graph_info.line_endings:
+                self.add_line_ending(line_ending)
 
     def set_layout_dimensions(self):
         self.layout.setDimensions(libsbml.Dimensions(self.layoutns,
@@ -107,7 +112,7 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
         self.local_render.setReferenceRenderInformation("NetworkInfoTranslator_Global_Render")
 
     def add_compartment(self, compartment):
-        if 'referenceId' in list(compartment.keys()):
+        if 'referenceId' in compartment:
             c = self.document.model.createCompartment()
             self.check(c, 'create compartment ' + compartment['referenceId'])
             self.check(c.setId(compartment['referenceId']), 'set compartment id')
@@ -117,11 +122,11 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
             self.add_compartment_glyph(compartment)
 
     def add_species(self, species):
-        if 'referenceId' in list(species.keys()):
+        if 'referenceId' in species:
             s = self.document.model.createSpecies()
             self.check(s, 'create species ' + species['referenceId'])
             self.check(s.setId(species['referenceId']), 'set species ' + species['referenceId'] + ' id')
-            if 'compartment' in list(species.keys()):
+            if 'compartment' in species:
                 self.check(s.setCompartment(species['compartment']),
                            'set species' + species['referenceId'] + ' compartment')
             self.check(s.setConstant(False), 'set "constant" attribute on ' + species['referenceId'])
@@ -131,7 +136,7 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
             self.add_species_glyph(species)
 
     def add_reaction(self, reaction):
-        if 'referenceId' in list(reaction.keys()):
+        if 'referenceId' in reaction:
             r = self.document.model.createReaction()
             self.check(r, 'create reaction ' + reaction['referenceId'])
             self.check(r.setId(reaction['referenceId']), 'set reaction ' + reaction['referenceId'] + ' id')
@@ -139,16 +144,16 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
             self.check(r.setFast(False), 'set reaction ' + reaction['referenceId'] + ' "fast" attribute')
 
             # species references
-            if 'speciesReferences' in list(reaction.keys()):
+            if 'speciesReferences' in reaction:
                 for sr in reaction['speciesReferences']:
                     self.add_species_reference(sr, r)
 
             self.add_reaction_glyph(reaction)
 
     def add_species_reference(self, species_reference, reaction):
-        if 'referenceId' in list(species_reference.keys()) and \
-                'role' in list(species_reference.keys()) and \
-                'species' in list(species_reference.keys()):
+        if 'referenceId' in species_reference and \
+                'role' in species_reference and \
+                'species' in species_reference:
             sr = None
             if species_reference['role'].lower() == "substrate" or species_reference['role'].lower() == "sidesubstrate" \
                     or species_reference['role'].lower() == "side substrate" \
@@ -173,7 +178,7 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
                            'assign species_reference ' + species_reference['referenceId'] + ' species')
 
     def add_compartment_glyph(self, compartment):
-        if 'id' in list(compartment.keys()):
+        if 'id' in compartment:
             compartment_glyph = self.layout.createCompartmentGlyph()
             compartment_glyph.setId(compartment['id'])
             compartment_glyph.setCompartmentId(compartment['referenceId'])
@@ -181,12 +186,12 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
             self.add_local_style(compartment)
 
             # text
-            if 'texts' in list(compartment.keys()):
+            if 'texts' in compartment:
                 for text in compartment['texts']:
                     self.add_text_glyph(text, compartment_glyph)
 
     def add_species_glyph(self, species):
-        if 'id' in list(species.keys()):
+        if 'id' in species:
             species_glyph = self.layout.createSpeciesGlyph()
             species_glyph.setId(species['id'])
             species_glyph.setSpeciesId(species['referenceId'])
@@ -198,7 +203,7 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
                 self.add_text_glyph(text, species_glyph)
 
     def add_reaction_glyph(self, reaction):
-        if 'id' in list(reaction.keys()):
+        if 'id' in reaction:
             reaction_glyph = self.layout.createReactionGlyph()
             reaction_glyph.setId(reaction['id'])
             reaction_glyph.setReactionId(reaction['referenceId'])
@@ -211,12 +216,12 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
                 self.add_text_glyph(text, reaction_glyph)
 
             # species references
-            if 'speciesReferences' in list(reaction.keys()):
+            if 'speciesReferences' in reaction:
                 for sr in reaction['speciesReferences']:
                     self.add_species_reference_glyph(sr, reaction_glyph)
 
     def add_species_reference_glyph(self, species_reference, reaction_glyph):
-        if 'id' in list(species_reference.keys()) and 'speciesGlyph' in list(species_reference.keys()):
+        if 'id' in species_reference and 'speciesGlyph' in species_reference:
             species_reference_glyph = reaction_glyph.createSpeciesReferenceGlyph()
             species_reference_glyph.setId(species_reference['id'])
             species_reference_glyph.setSpeciesGlyphId(species_reference['speciesGlyph'])
@@ -237,7 +242,7 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
             self.add_local_style(species_reference)
 
     def add_text_glyph(self, text, go_glyph):
-        if 'id' in list(text.keys()):
+        if 'id' in text:
             text_glyph = self.layout.createTextGlyph()
             text_glyph.setId(text['id'])
             text_glyph.setOriginOfTextId(go_glyph.getId())
@@ -247,9 +252,9 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
             self.add_local_style(text)
 
     def add_local_style(self, go):
-        if 'features' in list(go.keys()):
+        if 'features' in go:
             style = self.local_render.createLocalStyle()
-            if 'styleName' in list(go['features'].keys()):
+            if 'styleName' in go['features']:
                 style.setId(go['features']['styleName'])
             else:
                 style.setId(go['id'] + "_style")
@@ -258,7 +263,7 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
             self.set_render_group_features(render_group, go['features'])
 
     def set_glyph_bounding_box(self, go, go_glyph):
-        if 'features' in list(go.keys()) and 'boundingBox' in list(go['features'].keys()):
+        if 'features' in go and 'boundingBox' in go['features']:
             go_glyph.setBoundingBox(libsbml.BoundingBox(self.layoutns,
                                                         go_glyph.getId() + "_bb",
                                                         go['features']['boundingBox']['x'],
@@ -267,7 +272,7 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
                                                         go['features']['boundingBox']['height']))
 
     def set_glyph_curve(self, go, go_glyph):
-        if 'features' in list(go.keys()) and 'curve' in list(go['features'].keys()):
+        if 'features' in go and 'curve' in go['features']:
             for go_curve_element in go['features']['curve']:
                 if all(k in go_curve_element.keys() for k in ('startX', 'startY', 'endX', 'endY')):
                     go_glyph_curve = go_glyph.getCurve()
@@ -292,36 +297,36 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
 
     @staticmethod
     def set_text_glyph_plain_text(text, text_glyph):
-        if 'features' in list(text.keys()) and 'plainText' in list(text['features'].keys()):
+        if 'features' in text and 'plainText' in text['features']:
             text_glyph.setText(text['features']['plainText'])
 
     def set_render_group_features(self, render_group, features):
-        if 'graphicalShape' in list(features.keys()):
+        if 'graphicalShape' in features:
             self.set_group_general_features(render_group, features['graphicalShape'])
-            if 'geometricShapes' in list(features['graphicalShape'].keys()):
+            if 'geometricShapes' in features['graphicalShape']:
                 for shape in features['graphicalShape']['geometricShapes']:
                     self.set_group_geometric_shape_features(render_group, shape)
-        if 'graphicalCurve' in list(features.keys()):
+        if 'graphicalCurve' in features:
             self.set_group_curve_features(render_group, features['graphicalCurve'])
-        if 'graphicalText' in list(features.keys()):
+        if 'graphicalText' in features:
             self.set_group_text_features(render_group, features['graphicalText'])
 
     @staticmethod
     def set_group_general_features(render_group, features):
         # stroke color
-        if 'strokeColor' in list(features.keys()):
+        if 'strokeColor' in features:
             render_group.setStroke(features['strokeColor'])
 
         # stroke width
-        if 'strokeWidth' in list(features.keys()):
+        if 'strokeWidth' in features:
             render_group.setStrokeWidth(features['strokeWidth'])
 
         # fill color
-        if 'fillColor' in list(features.keys()):
+        if 'fillColor' in features:
             render_group.setFill(features['fillColor'])
 
     def set_group_geometric_shape_features(self, render_group, shape):
-        if 'shape' in list(shape.keys()):
+        if 'shape' in shape:
             if shape['shape'] == "image":
                 self.set_image_shape_features(render_group, shape)
             elif shape['shape'] == "renderCurve":
@@ -340,41 +345,41 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
         render_image = render_group.createImage()
 
         # x
-        if 'x' in list(image_shape.keys()):
+        if 'x' in image_shape:
             render_image.setX(libsbml.RelAbsVector(image_shape['x']['abs'],
                                                    image_shape['x']['rel']))
 
         # y
-        if 'y' in list(rectangle_shape.keys()):
+        if 'y' in rectangle_shape:
             render_image.setY(libsbml.RelAbsVector(image_shape['y']['abs'],
                                                    image_shape['y']['rel']))
 
         # width
-        if 'width' in list(rectangle_shape.keys()):
+        if 'width' in rectangle_shape:
             render_image.setWidth(libsbml.RelAbsVector(image_shape['width']['abs'],
                                                        image_shape['width']['rel']))
 
         # height
-        if 'height' in list(rectangle_shape.keys()):
+        if 'height' in rectangle_shape:
             render_image.setHeight(libsbml.RelAbsVector(image_shape['height']['abs'],
                                                         image_shape['height']['rel']))
 
         # href
-        if 'href' in list(rectangle_shape.keys()):
+        if 'href' in rectangle_shape:
             render_image.setHref(image_shape['href'])
 
     def set_render_curve_shape_features(self, render_group, curve_shape):
         render_curve = render_group.createCurve()
 
         # stroke color
-        if 'strokeColor' in list(curve_shape.keys()):
+        if 'strokeColor' in curve_shape:
             render_curve.setStroke(curve_shape['strokeColor'])
 
         # stroke width
-        if 'strokeWidth' in list(curve_shape.keys()):
+        if 'strokeWidth' in curve_shape:
             render_curve.setStrokeWidth(curve_shape['strokeWidth'])
 
-        if 'vertices' in list(curve_shape.keys()):
+        if 'vertices' in curve_shape:
             for vertex in curve_shape['vertices']:
                 if all(k in vertex.keys() for k in ('basePoint1X', 'basePoint1Y', 'basePoint2X', 'basePoint2Y')):
                     render_curve.addElement(libsbml.RenderCubicBezier(self.renderns,
@@ -402,42 +407,42 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
         render_text = render_group.createText()
 
         # stroke color
-        if 'strokeColor' in list(text_shape.keys()):
+        if 'strokeColor' in text_shape:
             render_text.setStroke(text_shape['strokeColor'])
 
         # x
-        if 'x' in list(text_shape.keys()):
+        if 'x' in text_shape:
             render_text.setX(libsbml.RelAbsVector(text_shape['x']['abs'],
                                                   text_shape['x']['rel']))
 
         # y
-        if 'y' in list(text_shape.keys()):
+        if 'y' in text_shape:
             render_text.setY(libsbml.RelAbsVector(text_shape['y']['abs'],
                                                   text_shape['y']['rel']))
 
         # font family
-        if 'fontFamily' in list(text_shape.keys()):
+        if 'fontFamily' in text_shape:
             render_text.setFontFamily(text_shape['fontFamily'])
 
         # font Size
-        if 'fontSize' in list(text_shape.keys()):
+        if 'fontSize' in text_shape:
             render_text.setFontSize(libsbml.RelAbsVector(text_shape['fontSize']['abs'],
                                                          text_shape['fontSize']['rel']))
 
         # font weight
-        if 'fontWeight' in list(text_shape.keys()):
+        if 'fontWeight' in text_shape:
             render_text.setFontWeight(text_shape['fontWeight'])
 
         # font weight
-        if 'fontStyle' in list(text_shape.keys()):
+        if 'fontStyle' in text_shape:
             render_text.setFontStyle(text_shape['fontStyle'])
 
         # horizontal text anchor
-        if 'hTextAnchor' in list(text_shape.keys()):
+        if 'hTextAnchor' in text_shape:
             render_text.setTextAnchor(text_shape['hTextAnchor'])
 
         # vertical text anchor
-        if 'vTextAnchor' in list(text_shape.keys()):
+        if 'vTextAnchor' in text_shape:
             render_text.setVTextAnchor(text_shape['vTextAnchor'])
 
     @staticmethod
@@ -445,48 +450,48 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
         render_rectangle = render_group.createRectangle()
 
         # stroke color
-        if 'strokeColor' in list(rectangle_shape.keys()):
+        if 'strokeColor' in rectangle_shape:
             render_rectangle.setStroke(rectangle_shape['strokeColor'])
 
         # stroke width
-        if 'strokeWidth' in list(rectangle_shape.keys()):
+        if 'strokeWidth' in rectangle_shape:
             render_rectangle.setStrokeWidth(rectangle_shape['strokeWidth'])
 
         # fill color
-        if 'fillColor' in list(rectangle_shape.keys()):
+        if 'fillColor' in rectangle_shape:
             render_rectangle.setFill(rectangle_shape['fillColor'])
 
         # x
-        if 'x' in list(rectangle_shape.keys()):
+        if 'x' in rectangle_shape:
             render_rectangle.setX(libsbml.RelAbsVector(rectangle_shape['x']['abs'],
                                                        rectangle_shape['x']['rel']))
 
         # y
-        if 'y' in list(rectangle_shape.keys()):
+        if 'y' in rectangle_shape:
             render_rectangle.setY(libsbml.RelAbsVector(rectangle_shape['y']['abs'],
                                                        rectangle_shape['y']['rel']))
 
         # width
-        if 'width' in list(rectangle_shape.keys()):
+        if 'width' in rectangle_shape:
             render_rectangle.setWidth(libsbml.RelAbsVector(rectangle_shape['width']['abs'],
                                                            rectangle_shape['width']['rel']))
 
         # height
-        if 'height' in list(rectangle_shape.keys()):
+        if 'height' in rectangle_shape:
             render_rectangle.setHeight(libsbml.RelAbsVector(rectangle_shape['height']['abs'],
                                                             rectangle_shape['height']['rel']))
 
         # ratio
-        if 'ratio' in list(rectangle_shape.keys()):
+        if 'ratio' in rectangle_shape:
             render_rectangle.setRatio(rectangle_shape['ratio'])
 
         # rx
-        if 'rx' in list(rectangle_shape.keys()):
+        if 'rx' in rectangle_shape:
             render_rectangle.setRX(libsbml.RelAbsVector(rectangle_shape['rx']['abs'],
                                                         rectangle_shape['rx']['rel']))
 
         # ry
-        if 'ry' in list(rectangle_shape.keys()):
+        if 'ry' in rectangle_shape:
             render_rectangle.setRY(libsbml.RelAbsVector(rectangle_shape['ry']['abs'],
                                                         rectangle_shape['ry']['rel']))
 
@@ -495,61 +500,61 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
         render_ellipse = render_group.createEllipse()
 
         # stroke color
-        if 'strokeColor' in list(ellipse_shape.keys()):
+        if 'strokeColor' in ellipse_shape:
             render_ellipse.setStroke(ellipse_shape['strokeColor'])
 
         # stroke width
-        if 'strokeWidth' in list(ellipse_shape.keys()):
+        if 'strokeWidth' in ellipse_shape:
             render_ellipse.setStrokeWidth(ellipse_shape['strokeWidth'])
 
         # fill color
-        if 'fillColor' in list(ellipse_shape.keys()):
+        if 'fillColor' in ellipse_shape:
             render_ellipse.setFill(ellipse_shape['fillColor'])
 
         # cx
-        if 'cx' in list(ellipse_shape.keys()):
+        if 'cx' in ellipse_shape:
             render_ellipse.setCX(libsbml.RelAbsVector(ellipse_shape['cx']['abs'],
                                                       ellipse_shape['cx']['rel']))
 
         # cy
-        if 'cy' in list(ellipse_shape.keys()):
+        if 'cy' in ellipse_shape:
             render_ellipse.setCY(libsbml.RelAbsVector(ellipse_shape['cy']['abs'],
                                                       ellipse_shape['cy']['rel']))
 
         # rx
-        if 'rx' in list(ellipse_shape.keys()):
+        if 'rx' in ellipse_shape:
             render_ellipse.setRX(libsbml.RelAbsVector(ellipse_shape['rx']['abs'],
                                                       ellipse_shape['rx']['rel']))
 
         # ry
-        if 'ry' in list(ellipse_shape.keys()):
+        if 'ry' in ellipse_shape:
             render_ellipse.setRY(libsbml.RelAbsVector(ellipse_shape['ry']['abs'],
                                                       ellipse_shape['ry']['rel']))
 
         # ratio
-        if 'ratio' in list(ellipse_shape.keys()):
+        if 'ratio' in ellipse_shape:
             render_ellipse.setRatio(ellipse_shape['ratio'])
 
     def set_polygon_shape_features(self, render_group, polygon_shape):
         render_polygon = render_group.createPolygon()
 
         # stroke color
-        if 'strokeColor' in list(polygon_shape.keys()):
+        if 'strokeColor' in polygon_shape:
             render_polygon.setStroke(polygon_shape['strokeColor'])
 
         # stroke width
-        if 'strokeWidth' in list(polygon_shape.keys()):
+        if 'strokeWidth' in polygon_shape:
             render_polygon.setStrokeWidth(polygon_shape['strokeWidth'])
 
         # fill color
-        if 'fillColor' in list(polygon_shape.keys()):
+        if 'fillColor' in polygon_shape:
             render_polygon.setFill(polygon_shape['fillColor'])
 
         # fill rule
-        if 'fillRule' in list(polygon_shape.keys()):
+        if 'fillRule' in polygon_shape:
             render_polygon.setFillRule(polygon_shape['fillRule'])
 
-        if 'vertices' in list(polygon_shape.keys()):
+        if 'vertices' in polygon_shape:
             for vertex in polygon_shape['vertices']:
                 if all(k in vertex.keys() for k in ('basePoint1X', 'basePoint1Y', 'basePoint2X', 'basePoint2Y')):
                     render_polygon.addElement(libsbml.RenderCubicBezier(self.renderns,
@@ -575,62 +580,62 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
     @staticmethod
     def set_group_curve_features(render_group, features):
         # stroke color
-        if 'strokeColor' in list(features.keys()):
+        if 'strokeColor' in features:
             render_group.setStroke(features['strokeColor'])
 
         # stroke width
-        if 'strokeWidth' in list(features.keys()):
+        if 'strokeWidth' in features:
             render_group.setStrokeWidth(features['strokeWidth'])
 
         # heads
-        if 'heads' in list(features.keys()):
-            if 'start' in list(features['heads'].keys()):
+        if 'heads' in features:
+            if 'start' in features['heads']:
                 render_group.setStartHead(features['heads']['start'])
-            if 'end' in list(features['heads'].keys()):
+            if 'end' in features['heads']:
                 render_group.setEndHead(features['heads']['end'])
 
     @staticmethod
     def set_group_text_features(render_group, features):
         # stroke color
-        if 'strokeColor' in list(features.keys()):
+        if 'strokeColor' in features:
             render_group.setStroke(features['strokeColor'])
 
         # font family
-        if 'fontFamily' in list(features.keys()):
+        if 'fontFamily' in features:
             render_group.setFontFamily(features['fontFamily'])
 
         # font Size
-        if 'fontSize' in list(features.keys()):
+        if 'fontSize' in features:
             render_group.setFontSize(libsbml.RelAbsVector(features['fontSize']['abs'],
                                                           features['fontSize']['rel']))
 
         # font weight
-        if 'fontWeight' in list(features.keys()):
+        if 'fontWeight' in features:
             render_group.setFontWeight(features['fontWeight'])
 
         # font weight
-        if 'fontStyle' in list(features.keys()):
+        if 'fontStyle' in features:
             render_group.setFontStyle(features['fontStyle'])
 
         # horizontal text anchor
-        if 'hTextAnchor' in list(features.keys()):
+        if 'hTextAnchor' in features:
             render_group.setTextAnchor(features['hTextAnchor'])
 
         # vertical text anchor
-        if 'vTextAnchor' in list(features.keys()):
+        if 'vTextAnchor' in features:
             render_group.setVTextAnchor(features['vTextAnchor'])
 
     def add_color(self, color):
         color_definition = self.global_render.createColorDefinition()
         color_definition.setId(color['id'])
-        if 'features' in list(color.keys()):
+        if 'features' in color:
             color_definition.setValue(color['features']['value'])
 
     def add_gradient(self, gradient):
-        if 'features' in list(gradient.keys()):
+        if 'features' in gradient:
             gradient_definition = None
             # linear gradient
-            if 'start' in list(gradient['features'].keys()) and 'end' in list(gradient['features'].keys()):
+            if 'start' in gradient['features'] and 'end' in gradient['features']:
                 gradient_definition = self.global_render.createLinearGradientDefinition()
                 gradient_definition.setX1(libsbml.RelAbsVector(gradient['features']['start']['x']['abs'],
                                                                gradient['features']['start']['x']['rel']))
@@ -641,9 +646,9 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
                 gradient_definition.setY2(libsbml.RelAbsVector(gradient['features']['end']['y']['abs'],
                                                                gradient['features']['end']['y']['rel']))
             # radial gradient
-            elif 'center' in list(gradient['features'].keys()) and \
-                    'focalPoint' in list(gradient['features'].keys() and \
-                                         'radius' in list(gradient['features'].keys())):
+            elif 'center' in gradient['features'] and \
+                    'focalPoint' in gradient['features'] and \
+                    'radius' in gradient['features']:
                 gradient_definition = self.global_render.createRadialGradientDefinition()
                 gradient_definition.setCx(libsbml.RelAbsVector(gradient['features']['center']['x']['abs'],
                                                                gradient['features']['center']['x']['rel']))
@@ -658,27 +663,28 @@ class NetworkInfoExportToSBMLModel(NetworkInfoExportBase):
 
             if gradient_definition:
                 # spread method
-                if 'spreadMethod' in list(gradient['features'].keys()):
+                if 'spreadMethod' in gradient['features']:
                     gradient_definition.setSpreadMethod(gradient['features']['spreadMethod'])
 
                 # stops
                 for stop in gradient['features']['stops']:
                     gradient_stop = gradient_definition.createGradientStop()
-                    if 'offset' in list(stop.keys()):
+                    if 'offset' in stop:
                         gradient_stop.setOffset(libsbml.RelAbsVector(stop['offset']['abs'], stop['offset']['rel']))
-                    if 'color' in list(stop.keys()):
+                    if 'color' in stop:
                         gradient_stop.setStopColor(stop['color'])
 
     def add_line_ending(self, line_ending):
         line_ending_definition = self.global_render.createLineEnding()
         line_ending_definition.setId(line_ending['id'])
         self.set_glyph_bounding_box(line_ending, line_ending_definition)
-        if 'features' in list(line_ending.keys()):
+        if 'features' in line_ending:
             render_group = line_ending_definition.createGroup()
             self.set_render_group_features(render_group, line_ending['features'])
-            if 'enableRotation' in list(line_ending['features'].keys()):
+            if 'enableRotation' in line_ending['features']:
                 line_ending_definition.setEnableRotationalMapping(line_ending['features']['enableRotation'])
 
+    @traced("export.export", count_exported_entities)
     def export(self, file_name=""):
         if file_name == "":
             return libsbml.writeSBMLToString(self.document)
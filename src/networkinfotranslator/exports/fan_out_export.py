@@ -0,0 +1,96 @@
+import importlib
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# the exporters by the name of their target format, as (module, class, suffix of the file written) imported on first
+# use, so that only the backends of the requested targets are loaded
+export_targets = {
+    "png": (".export_figure_skia", "NetworkInfoExportToSkia", ".png"),
+    "jpg": (".export_figure_skia", "NetworkInfoExportToSkia", ".jpg"),
+    "pdf": (".export_figure_skia", "NetworkInfoExportToSkia", ".pdf"),
+    "svg": (".export_figure_skia", "NetworkInfoExportToSkia", ".svg"),
+    "cytoscapejs": (".export_cytoscapejs", "NetworkInfoExportToCytoscapeJs", ".js"),
+    "network_editor": (".export_network_editor", "NetworkInfoExportToNetworkEditor", ".json"),
+    # the escher exporter also writes a .json file, kept apart from the network editor one
+    "escher": (".export_escher", "NetworkInfoExportToEscher", "_escher.json"),
+    "sbml": (".export_sbml", "NetworkInfoExportToSBMLModel", ".xml"),
+}
+
+
+def get_exporter_class_name(target):
+    if target not in export_targets:
+        raise ValueError("Unknown export target \"{}\", expected one of {}".format(target, list(export_targets.keys())))
+
+    return export_targets[target][1]
+
+
+def get_exporter_class(target):
+    class_name = get_exporter_class_name(target)
+
+    return getattr(importlib.import_module(export_targets[target][0], __package__), class_name)
+
+
+def get_target_file_name(file_name, target):
+    # the exporters replace the extension of the file name with the one of their format
+    return file_name.split('.')[0] + export_targets[target][2]
+
+
+def export_graph_info(graph_info, targets, file_name, max_workers=None, use_processes=False):
+    """
+    Exports the info of an imported model to each of the target formats concurrently, writing the files named after
+    file_name with the extension of each format.
+
+    The features required by all the targets are extracted once beforehand, so the exporters only read the shared
+    info and run on a pool of threads. With use_processes, the exporters run on a pool of worker processes instead,
+    to which the extracted info of the model is sent, which has to be picklable (it is not with the libsbne reader,
+    whose entities hold its glyph objects).
+
+    Returns a dict per target with the name of the file written ("file_name"), the formatted traceback of the error
+    raised while exporting it ("error", None on success) and the time its export took in seconds ("time").
+    """
+    targets = list(dict.fromkeys(targets))
+    exporter_classes = [get_exporter_class(target) for target in targets]
+    required_profile = "layout"
+    if any(exporter_class.required_profile == "full" for exporter_class in exporter_classes):
+        required_profile = "full"
+    graph_info.extract_entity_features(required_profile)
+    if use_processes:
+        extracted_info = graph_info.get_extracted_info()
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(export_extracted_info, extracted_info, target,
+                                       get_target_file_name(file_name, target)) for target in targets]
+            return {target: get_export_result(future, get_target_file_name(file_name, target))
+                    for target, future in zip(targets, futures)}
+    with ThreadPoolExecutor(max_workers) as executor:
+        futures = [executor.submit(export_target, graph_info, target, get_target_file_name(file_name, target))
+                   for target in targets]
+        return {target: future.result() for target, future in zip(targets, futures)}
+
+
+def export_target(graph_info, target, file_name):
+    start = time.perf_counter()
+    result = {'file_name': file_name, 'error': None}
+    try:
+        exporter = get_exporter_class(target)()
+        exporter.extract_graph_info(graph_info)
+        exporter.export(file_name)
+    except Exception:
+        result['error'] = traceback.format_exc()
+    result['time'] = time.perf_counter() - start
+
+    return result
+
+
+def get_export_result(future, file_name):
+    # the errors raised while sending the info to a worker process, or by the pool itself, are reported as the ones
+    # of the target
+    try:
+        return future.result()
+    except Exception:
+        return {'file_name': file_name, 'error': traceback.format_exc(), 'time': 0.0}
+
+
+def export_extracted_info(extracted_info, target, file_name):
+    from ..imports.batch_import import load_imported_info
+    return export_target(load_imported_info(extracted_info), target, file_name)
@@ -0,0 +1,91 @@
+import functools
+import importlib.metadata
+import json
+import os
+import pathlib
+from ..imports.extraction_cache import ExtractionCache, read_graph_content
+
+# the distributions whose version is part of the keys of the cached files, as a new version of the package or of the
+# backends rendering the models may export them differently
+versioned_distributions = ["networkinfotranslator", "libsbmlnetwork", "python-libsbml", "skia-python", "Pillow"]
+
+
+@functools.lru_cache(maxsize=None)
+def get_library_versions():
+    # read from the metadata of the installed distributions rather than by importing them, so that a hit does not
+    # load the backends
+    versions = []
+    for distribution in versioned_distributions:
+        try:
+            versions.append((distribution, importlib.metadata.version(distribution)))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append((distribution, None))
+
+    return tuple(versions)
+
+
+class OutputCache(ExtractionCache):
+    """
+    On-disk cache of the content of the files exported from the models, like the png, pdf and JSON ones.
+
+    Each entry is named after the hash of the imported model, the import options, the exporter, its options and the
+    versions of the package and its backends, so a hit is served without importing the model, nor even loading the
+    backends. Entries are touched when read, and the least recently used ones are removed once the total size of the
+    cache directory exceeds max_size bytes.
+    """
+    file_extension = ".output"
+    # bump when the exporters change the content of the files they write
+    format_version = 1
+
+    def make_output_key(self, graph, exporter_class_name, import_options=None, export_options=None):
+        """
+        Returns the key of the file exported from the graph, given as a file name, the content of a file as a string
+        or bytes, or a network editor dict, or None if it is none of them.
+        """
+        if isinstance(graph, bytes):
+            content = graph
+        elif isinstance(graph, dict):
+            content = json.dumps(graph).encode()
+        else:
+            content = read_graph_content(graph)
+        if content is None:
+            return None
+
+        return self.make_key(content, exporter_class_name, sorted((import_options or {}).items()),
+                             sorted((export_options or {}).items()), get_library_versions())
+
+    def read_entry(self, cache_file):
+        return cache_file.read()
+
+    def write_entry(self, cache_file, content):
+        cache_file.write(content)
+
+    def load_file(self, key, file_name):
+        """writes the cached content of the key to the file, and returns whether it was found"""
+        content = self.load(key)
+        if content is None:
+            return False
+        with open(file_name, 'wb') as output_file:
+            output_file.write(content)
+
+        return True
+
+    def store_file(self, key, file_name):
+        with open(file_name, 'rb') as output_file:
+            self.store(key, output_file.read())
+
+
+def get_output_cache(cache, max_size=256 * 1024 * 1024):
+    """returns the cache, or an OutputCache in it if given the name of a directory, or None if cache is None"""
+    if cache is None or isinstance(cache, OutputCache):
+        return cache
+
+    return OutputCache(os.fspath(cache), max_size)
+
+
+def get_target_export_options(target, file_name):
+    # the figures only depend on their format, but the JSON exporters also name the graph after the file they write
+    if target in ["png", "jpg", "pdf", "svg"]:
+        return {'format': target}
+
+    return {'format': target, 'name': pathlib.Path(file_name).stem}
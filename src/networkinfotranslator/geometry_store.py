@@ -0,0 +1,192 @@
+from collections.abc import Mapping, MutableMapping, Sequence
+import numpy as np
+
+
+class GeometryStore:
+    """
+    Columnar storage of the bounding boxes and curve segments of the glyphs of a network.
+
+    Bounding boxes are kept as rows of [x, y, width, height] and curve segments as rows of
+    [startX, startY, endX, endY, basePoint1X, basePoint1Y, basePoint2X, basePoint2Y] (NaN for the base points of
+    straight segments) in contiguous float64 arrays. The importers hand out views over these rows, which behave like
+    the feature dicts they replace, while the extents of the network are computed over all the glyphs at once.
+    """
+    bounding_box_columns = ('x', 'y', 'width', 'height')
+    curve_segment_columns = ('startX', 'startY', 'endX', 'endY',
+                             'basePoint1X', 'basePoint1Y', 'basePoint2X', 'basePoint2Y')
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.bounding_boxes = np.empty((capacity, len(self.bounding_box_columns)))
+        self.glyph_bounding_boxes = np.empty(capacity, dtype=bool)
+        self.curve_segments = np.empty((capacity, len(self.curve_segment_columns)))
+        self.num_bounding_boxes = 0
+        self.num_curve_segments = 0
+        self.bounding_box_rows = {}
+        self.curve_rows = {}
+
+    def clear(self):
+        self.num_bounding_boxes = 0
+        self.num_curve_segments = 0
+        self.bounding_box_rows.clear()
+        self.curve_rows.clear()
+
+    def add_bounding_box(self, key, x, y, width, height, is_glyph=True):
+        row = self.num_bounding_boxes
+        if row == len(self.bounding_boxes):
+            self.bounding_boxes = self._grow(self.bounding_boxes)
+            self.glyph_bounding_boxes = self._grow(self.glyph_bounding_boxes)
+        self.bounding_boxes[row] = (x, y, width, height)
+        self.glyph_bounding_boxes[row] = is_glyph
+        self.num_bounding_boxes += 1
+        self.bounding_box_rows[key] = row
+
+        return BoundingBoxView(self, row)
+
+    def add_curve(self, key, curve_segments):
+        start = self.num_curve_segments
+        stop = start + len(curve_segments)
+        while stop > len(self.curve_segments):
+            self.curve_segments = self._grow(self.curve_segments)
+        for row, curve_segment in enumerate(curve_segments, start):
+            self.curve_segments[row] = [curve_segment.get(column, np.nan) for column in self.curve_segment_columns]
+        self.num_curve_segments = stop
+        self.curve_rows[key] = (start, stop)
+
+        return CurveView(self, start, stop)
+
+    def get_bounding_box(self, key):
+        if key in self.bounding_box_rows:
+            return BoundingBoxView(self, self.bounding_box_rows[key])
+
+        return None
+
+    def get_curve(self, key):
+        if key in self.curve_rows:
+            return CurveView(self, *self.curve_rows[key])
+
+        return None
+
+    def get_bounding_boxes(self, glyphs_only=False):
+        bounding_boxes = self.bounding_boxes[:self.num_bounding_boxes]
+        if glyphs_only:
+            return bounding_boxes[self.glyph_bounding_boxes[:self.num_bounding_boxes]]
+
+        return bounding_boxes
+
+    def get_curve_segments(self):
+        return self.curve_segments[:self.num_curve_segments]
+
+    def get_extents(self, glyphs_only=True):
+        bounding_boxes = self.get_bounding_boxes(glyphs_only)
+        if not len(bounding_boxes):
+            return None
+
+        return {'minX': float(bounding_boxes[:, 0].min()), 'minY': float(bounding_boxes[:, 1].min()),
+                'maxX': float((bounding_boxes[:, 0] + bounding_boxes[:, 2]).max()),
+                'maxY': float((bounding_boxes[:, 1] + bounding_boxes[:, 3]).max())}
+
+    @staticmethod
+    def _grow(array):
+        grown_array = np.empty((2 * len(array),) + array.shape[1:], dtype=array.dtype)
+        grown_array[:len(array)] = array
+        return grown_array
+
+
+class BoundingBoxView(MutableMapping):
+    """dict-compatible view of a row of the bounding boxes of a GeometryStore"""
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, key):
+        return float(self.store.bounding_boxes[self.row, self._column(key)])
+
+    def __setitem__(self, key, value):
+        self.store.bounding_boxes[self.row, self._column(key)] = value
+
+    def __delitem__(self, key):
+        raise TypeError("the columns of a bounding box can not be removed")
+
+    def __contains__(self, key):
+        return key in GeometryStore.bounding_box_columns
+
+    def __iter__(self):
+        return iter(GeometryStore.bounding_box_columns)
+
+    def __len__(self):
+        return len(GeometryStore.bounding_box_columns)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    @staticmethod
+    def _column(key):
+        try:
+            return GeometryStore.bounding_box_columns.index(key)
+        except ValueError:
+            raise KeyError(key)
+
+
+class CurveSegmentView(Mapping):
+    """dict-compatible view of a row of the curve segments of a GeometryStore; unset base points are missing keys"""
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __getitem__(self, key):
+        try:
+            value = self.store.curve_segments[self.row, GeometryStore.curve_segment_columns.index(key)]
+        except ValueError:
+            raise KeyError(key)
+        if np.isnan(value):
+            raise KeyError(key)
+
+        return float(value)
+
+    def __contains__(self, key):
+        return key in GeometryStore.curve_segment_columns and \
+            not np.isnan(self.store.curve_segments[self.row, GeometryStore.curve_segment_columns.index(key)])
+
+    def __iter__(self):
+        values = self.store.curve_segments[self.row]
+        return (column for column, value in zip(GeometryStore.curve_segment_columns, values) if not np.isnan(value))
+
+    def __len__(self):
+        return int(np.count_nonzero(~np.isnan(self.store.curve_segments[self.row])))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class CurveView(Sequence):
+    """list-compatible view of the curve segments of an entity in a GeometryStore"""
+    __slots__ = ('store', 'start', 'stop')
+
+    def __init__(self, store, start, stop):
+        self.store = store
+        self.start = start
+        self.stop = stop
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        return CurveSegmentView(self.store, self.start + index)
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def get_points(self):
+        return self.store.curve_segments[self.start:self.stop]
+
+    def __repr__(self):
+        return repr(list(self))
@@ -0,0 +1,49 @@
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from .import_sbml import NetworkInfoImportFromSBMLModel
+
+
+def import_sbml_models(graphs, max_workers=None, return_info=True, chunk_size=1, **import_options):
+    """
+    Imports SBML models (file names or SBML strings) across a pool of worker processes.
+
+    Returns, in the order of graphs, a dict per model with its "index", its picklable extracted graph info ("info",
+    None if return_info is False or the import failed), the formatted traceback of the error raised while importing
+    it ("error", None on success) and the time its import took in seconds ("time"). import_options are passed to
+    NetworkInfoImportFromSBMLModel in each worker; with a cache_dir the extracted info is also written to the
+    extraction cache, so return_info=False only warms the cache without sending the info back.
+    """
+    graphs = list(graphs)
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(partial(import_sbml_model, import_options, return_info), range(len(graphs)), graphs,
+                                 chunksize=chunk_size))
+
+
+def import_sbml_model(import_options, return_info, index, graph):
+    start = time.perf_counter()
+    result = {'index': index, 'info': None, 'error': None}
+    try:
+        import_from_sbml = NetworkInfoImportFromSBMLModel(**import_options)
+        import_from_sbml.extract_info(graph)
+        import_from_sbml.extract_entity_features()
+        if return_info:
+            result['info'] = import_from_sbml.get_extracted_info()
+    except Exception:
+        result['error'] = traceback.format_exc()
+    result['time'] = time.perf_counter() - start
+
+    return result
+
+
+def load_imported_info(info, **import_options):
+    """
+    Returns an importer holding the info of a model imported by import_sbml_models, ready to be exported by the
+    exporters whose required profile it was imported with (see NetworkInfoImportBase.profiles), the others raising a
+    ValueError.
+    """
+    import_from_sbml = NetworkInfoImportFromSBMLModel(**import_options)
+    import_from_sbml.set_extracted_info(info)
+
+    return import_from_sbml
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+
+class ExtractionCache:
+    """
+    On-disk cache of the graph info extracted by the importers.
+
+    Each entry is a pickle file named after the hash of the imported content and the import options, so a warm hit
+    skips the parsing and feature extraction of the model entirely. Entries are touched when read, and the least
+    recently used ones are removed once the total size of the cache directory exceeds max_size bytes.
+    """
+    file_extension = ".pickle"
+    # bump when the layout of the cached info changes
+    format_version = 2
+
+    def __init__(self, cache_dir, max_size=256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, content, *options):
+        hash_object = hashlib.sha256()
+        hash_object.update(content)
+        hash_object.update(repr((self.format_version,) + options).encode())
+        return hash_object.hexdigest()
+
+    def load(self, key):
+        file_name = self.get_file_name(key)
+        try:
+            with open(file_name, 'rb') as cache_file:
+                info = self.read_entry(cache_file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # a corrupt or incompatible entry is treated as a miss
+            self.remove(file_name)
+            return None
+        try:
+            os.utime(file_name)
+        except OSError:
+            pass
+
+        return info
+
+    def store(self, key, info):
+        file_descriptor, temp_file_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, 'wb') as cache_file:
+                self.write_entry(cache_file, info)
+            os.replace(temp_file_name, self.get_file_name(key))
+        except Exception:
+            self.remove(temp_file_name)
+            raise
+        self.evict()
+
+    def read_entry(self, cache_file):
+        return pickle.load(cache_file)
+
+    def write_entry(self, cache_file, info):
+        pickle.dump(info, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def evict(self):
+        entries = []
+        total_size = 0
+        with os.scandir(self.cache_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.endswith(self.file_extension):
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, dir_entry.path))
+                    total_size += stat.st_size
+        entries.sort()
+        for mtime, size, file_name in entries:
+            if total_size <= self.max_size:
+                break
+            self.remove(file_name)
+            total_size -= size
+
+    def clear(self):
+        with os.scandir(self.cache_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                if dir_entry.name.endswith(self.file_extension):
+                    self.remove(dir_entry.path)
+
+    def get_file_name(self, key):
+        return os.path.join(self.cache_dir, key + self.file_extension)
+
+    @staticmethod
+    def remove(file_name):
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
+
+
+def read_graph_content(graph):
+    """returns the bytes of an SBML file name or SBML string, or None if graph is neither"""
+    if isinstance(graph, str):
+        if os.path.isfile(graph):
+            with open(graph, 'rb') as graph_file:
+                return graph_file.read()
+        return graph.encode()
+
+    return None
@@ -1,5 +1,16 @@
+from ..entities import compact_graphical_object
+from ..geometry_store import GeometryStore
+from ..tracing import traced, count_entities
+
+
 class NetworkInfoImportBase:
-    def __init__(self):
+    # "layout" extracts the ids, geometry, connectivity and plain texts of the entities,
+    # "full" also extracts their render features (shape, curve and text styles, line endings, colors and gradients)
+    profiles = ("layout", "full")
+
+    def __init__(self, compact_entities=False, profile="full"):
+        if profile not in self.profiles:
+            raise ValueError("unknown import profile '" + str(profile) + "', expected one of " + str(self.profiles))
         self.compartments = []
         self.species = []
         self.reactions = []
@@ -9,6 +20,25 @@ class NetworkInfoImportBase:
         self.line_endings = []
         self.extents = {}
         self.background_color = ""
+        # store the entities as slotted, dict-compatible objects instead of nested dicts
+        self.compact_entities = compact_entities
+        # lookup indexes of the entities, kept up to date by the append_* methods
+        self.compartment_index = {}
+        self.species_index = {}
+        self.species_glyph_index = {}
+        self.reaction_index = {}
+        self.color_index = {}
+        self.gradient_index = {}
+        self.line_ending_index = {}
+        # columnar storage of the bounding boxes and curves of the glyphs
+        self.geometry = GeometryStore()
+        # with the "layout" profile, only the features required by the exporters are extracted
+        self.profile = profile
+        # features are extracted once and shared by all the exporters until invalidate() is called
+        self.extracted_profile = None
+        self.extraction_profile = profile
+        # the info was loaded with set_extracted_info, from the extraction cache or a batch import
+        self.extracted_from_cache = False
 
     def reset_info(self):
         self.compartments.clear()
@@ -19,56 +49,120 @@ class NetworkInfoImportBase:
         self.line_endings.clear()
         self.extents = {'minX': 0, 'maxX': 0, 'minY': 0, 'maxY': 0}
         self.background_color = "white"
+        self.reset_indexes()
+        self.geometry.clear()
+        self.extracted_profile = None
 
-    def find_compartment(self, compartment_reference_id):
+    def reset_indexes(self):
+        self.compartment_index.clear()
+        self.species_index.clear()
+        self.species_glyph_index.clear()
+        self.reaction_index.clear()
+        self.color_index.clear()
+        self.gradient_index.clear()
+        self.line_ending_index.clear()
+
+    def rebuild_indexes(self):
+        self.reset_indexes()
         for compartment in self.compartments:
-            if compartment_reference_id == compartment['referenceId']:
-                return compartment
+            self.index_compartment(compartment)
+        for species in self.species:
+            self.index_species(species)
+        for reaction in self.reactions:
+            self.index_reaction(reaction)
+        for color in self.colors:
+            self.index_color(color)
+        for gradient in self.gradients:
+            self.index_gradient(gradient)
+        for line_ending in self.line_endings:
+            self.index_line_ending(line_ending)
+
+    def append_compartment(self, compartment):
+        self.compartments.append(compartment)
+        self.index_compartment(compartment)
+
+    def append_species(self, species):
+        self.species.append(species)
+        self.index_species(species)
+
+    def append_reaction(self, reaction):
+        self.reactions.append(reaction)
+        self.index_reaction(reaction)
+
+    def append_color(self, color):
+        self.colors.append(color)
+        self.index_color(color)
+
+    def append_gradient(self, gradient):
+        self.gradients.append(gradient)
+        self.index_gradient(gradient)
 
-        return None
+    def append_line_ending(self, line_ending):
+        self.line_endings.append(line_ending)
+        self.index_line_ending(line_ending)
+
+    # the first entity added with a given id wins, matching the order of the entity lists
+    def index_compartment(self, compartment):
+        self.compartment_index.setdefault(compartment['referenceId'], compartment)
+
+    def index_species(self, species):
+        self.species_index.setdefault(species['referenceId'], species)
+        if 'id' in species:
+            self.species_glyph_index.setdefault(species['id'], species)
+
+    def index_reaction(self, reaction):
+        self.reaction_index.setdefault(reaction['referenceId'], reaction)
+
+    def index_color(self, color):
+        self.color_index.setdefault(color['id'], color)
+
+    def index_gradient(self, gradient):
+        self.gradient_index.setdefault(gradient['id'], gradient)
+
+    def index_line_ending(self, line_ending):
+        self.line_ending_index.setdefault(line_ending['id'], line_ending)
+
+    def rename_color(self, color, color_id):
+        if self.color_index.get(color['id']) is color:
+            del self.color_index[color['id']]
+        color['id'] = color_id
+        self.index_color(color)
+
+    def find_compartment(self, compartment_reference_id):
+        return self.compartment_index.get(compartment_reference_id)
 
     def find_species(self, species_reference_id):
-        for species in self.species:
-            if species_reference_id == species['referenceId']:
-                return species
+        return self.species_index.get(species_reference_id)
 
-        return None
+    def find_species_glyph(self, species_glyph_id):
+        return self.species_glyph_index.get(species_glyph_id)
 
     def find_reaction(self, reaction_reference_id):
-        for reaction in self.reactions:
-            if reaction_reference_id == reaction['referenceId']:
-                return reaction
-
-        return None
+        return self.reaction_index.get(reaction_reference_id)
 
     def find_color(self, color_id):
-        for color in self.colors:
-            if color_id == color['id']:
-                return color
-
-        return None
+        return self.color_index.get(color_id)
 
     def find_color_value(self, color_id, search_among_gradients=False):
         # search among the gradients
         if search_among_gradients:
-            for gradient in self.gradients:
-                if color_id == gradient['id'] and 'stops' in list(gradient['features'].keys()):
-                    stop_colors = []
-                    """
-                    for stop in gradient['features']['stops']:
-                        if 'color' in list(stop.keys()):
-                            stop_colors.append(mcolors.to_rgb(
-                                find_color_value(graph_info,
-                                                 stop['color'])))
-                    if len(stop_colors):
-                        return mcolors.to_hex(np.average(np.array(stop_colors), axis=0).tolist())
-                    """
+            gradient = self.gradient_index.get(color_id)
+            if gradient and 'stops' in list(gradient['features'].keys()):
+                stop_colors = []
+                """
+                for stop in gradient['features']['stops']:
+                    if 'color' in list(stop.keys()):
+                        stop_colors.append(mcolors.to_rgb(
+                            find_color_value(graph_info,
+                                             stop['color'])))
+                if len(stop_colors):
+                    return mcolors.to_hex(np.average(np.array(stop_colors), axis=0).tolist())
+                """
 
         # search among the colors
-        for color in self.colors:
-            if color_id == color['id'] and \
-                    'value' in list(color['features'].keys()):
-                return color['features']['value']
+        color = self.color_index.get(color_id)
+        if color and 'value' in list(color['features'].keys()):
+            return color['features']['value']
         if color_id.startswith("#"):
             return color_id
         else:
@@ -79,44 +173,102 @@ class NetworkInfoImportBase:
         k = 0
         color_found = True
         while color_found:
-            color_found = False
             k = k + 1
-            for color in self.colors:
-                if color_id + str(k) == color['id']:
-                    color_found = True
-                    break
+            color_found = color_id + str(k) in self.color_index
 
         return color_id + str(k)
 
     def find_gradient(self, gradient_id):
-        for gradient in self.gradients:
-            if gradient_id == gradient['id'] and 'stops' in list(gradient['features'].keys()):
-                return gradient
+        gradient = self.gradient_index.get(gradient_id)
+        if gradient and 'stops' in list(gradient['features'].keys()):
+            return gradient
 
         return {}
 
-
     def find_line_ending(self, line_ending_id):
-        for line_ending in self.line_endings:
-            if line_ending_id == line_ending['id']:
-                return line_ending
-
-        return None
+        return self.line_ending_index.get(line_ending_id)
 
     def extract_info(self, graph):
         self.reset_info()
+        self.extracted_from_cache = False
+
+    def get_extracted_info(self):
+        # picklable extracted graph info, with no reference to the model it was extracted from
+        return {'compartments': self.compartments, 'species': self.species, 'reactions': self.reactions,
+                'additional_graphical_objects': self.additional_graphical_objects, 'colors': self.colors,
+                'gradients': self.gradients, 'line_endings': self.line_endings, 'extents': self.extents,
+                'background_color': self.background_color, 'geometry': self.geometry,
+                'profile': self.extracted_profile}
+
+    def set_extracted_info(self, info):
+        self.compartments = info['compartments']
+        self.species = info['species']
+        self.reactions = info['reactions']
+        self.additional_graphical_objects = info['additional_graphical_objects']
+        self.colors = info['colors']
+        self.gradients = info['gradients']
+        self.line_endings = info['line_endings']
+        self.extents = info['extents']
+        self.background_color = info['background_color']
+        self.geometry = info['geometry']
+        self.rebuild_indexes()
+        self.extracted_from_cache = True
+        self.extracted_profile = info['profile']
+        self.extraction_profile = info['profile']
+
+    def invalidate(self):
+        self.extracted_profile = None
+
+    def get_extraction_profile(self, required_profile=None):
+        if self.profile == "full" or required_profile is None:
+            return self.profile
+
+        return required_profile
+
+    def is_extracted(self, profile):
+        return self.extracted_profile is not None and \
+            self.profiles.index(self.extracted_profile) >= self.profiles.index(profile)
+
+    def extracts_render_features(self):
+        return self.extraction_profile == "full"
+
+    def has_extracted_features(self, required_profile=None):
+        """
+        Returns whether the features of the entities are extracted with the profile required, or with the one of the
+        importer if None. The info loaded with set_extracted_info has no model to extract more features from, so a
+        ValueError is raised if it lacks the ones required.
+        """
+        if self.extracted_from_cache:
+            if required_profile is not None and not self.is_extracted(required_profile):
+                raise ValueError("The info of the model was extracted with the \"{}\" profile, but the \"{}\" "
+                                 "profile is required".format(self.extracted_profile, required_profile))
+            return True
+
+        return self.is_extracted(self.get_extraction_profile(required_profile))
+
+    @traced("import.extract_entity_features", count_entities)
+    def extract_entity_features(self, required_profile=None):
+        # the features already extracted, and the profile they were extracted with, are kept as they are
+        if self.has_extracted_features(required_profile):
+            return
+        self.extraction_profile = self.get_extraction_profile(required_profile)
+        self.geometry.clear()
 
-    def extract_entity_features(self):
         # compartments
-        for compartment in self.compartments:
+        for position, compartment in enumerate(self.compartments):
             self.extract_compartment_features(compartment)
+            if self.compact_entities:
+                self.compartments[position] = self.compact_entity(compartment, (self.compartment_index, 'referenceId'))
 
         # species
-        for species in self.species:
+        for position, species in enumerate(self.species):
             self.extract_species_features(species)
+            if self.compact_entities:
+                self.species[position] = self.compact_entity(species, (self.species_index, 'referenceId'),
+                                                             (self.species_glyph_index, 'id'))
 
         # reactions
-        for reaction in self.reactions:
+        for position, reaction in enumerate(self.reactions):
             self.extract_reaction_features(reaction)
 
             # species references
@@ -124,19 +276,38 @@ class NetworkInfoImportBase:
                 species_references = reaction['speciesReferences']
                 for species_reference in species_references:
                     self.extract_species_reference_features(species_reference)
+            if self.compact_entities:
+                self.reactions[position] = self.compact_entity(reaction, (self.reaction_index, 'referenceId'))
 
         # additional graphical objects
-        for additional_graphical_object in self.additional_graphical_objects:
+        for position, additional_graphical_object in enumerate(self.additional_graphical_objects):
             self.extract_additional_graphical_object_features(additional_graphical_object)
+            if self.compact_entities:
+                self.additional_graphical_objects[position] = self.compact_entity(additional_graphical_object)
 
-        # line endings
-        for line_ending in self.line_endings:
-            self.extract_line_ending_features(line_ending)
+        if self.extracts_render_features():
+            # line endings
+            for line_ending in self.line_endings:
+                self.extract_line_ending_features(line_ending)
 
-        # colors
-        for color in self.colors:
-            self.extract_color_features(color)
+            # colors
+            for color in self.colors:
+                self.extract_color_features(color)
 
-        # gradients
-        for gradient in self.gradients:
-            self.extract_gradient_features(gradient)
\ No newline at end of file
+            # gradients
+            for gradient in self.gradients:
+                self.extract_gradient_features(gradient)
+
+        self.extracted_profile = self.extraction_profile
+
+    @staticmethod
+    def compact_entity(entity, *entity_indexes):
+        # each entity is converted as soon as its features are extracted, and the indexes are pointed at the compact
+        # entity right away, so that the dict form of at most one entity is held at a time
+        compact_entity = compact_graphical_object(entity)
+        if compact_entity is not entity:
+            for entity_index, key in entity_indexes:
+                if key in entity and entity_index.get(entity[key]) is entity:
+                    entity_index[entity[key]] = compact_entity
+
+        return compact_entity
@@ -1,21 +1,45 @@
 from .import_base import NetworkInfoImportBase
+from .json_stream import load_json, iter_json_items
+from ..colors import color_to_hex
+from ..tracing import traced, count_entities
 import json
 import math
-import webcolors
 
 
 class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, compact_entities=False, profile="full"):
+        super().__init__(compact_entities, profile)
 
-    def extract_info(self, graph):
+    @traced("import.extract_info", count_entities)
+    def extract_info(self, graph, incremental=False):
         super().extract_info(graph)
 
-        self.graph_info = graph
+        if isinstance(graph, dict):
+            self.graph_info = graph
+        elif incremental:
+            self.extract_streamed_info(graph)
+            return
+        else:
+            self.graph_info = load_json(graph)
         self.extract_extents(self.graph_info)
         self.extract_background_color(self.graph_info)
         self.extract_entities(self.graph_info)
 
+    def extract_streamed_info(self, graph):
+        # the nodes and edges are added as they are read, so only the other top-level values of the document are kept
+        self.graph_info = {}
+        incident_edges = {}
+        for key, value in iter_json_items(graph, ('nodes', 'edges')):
+            if key == 'nodes':
+                self.add_node(value)
+            elif key == 'edges':
+                self.index_incident_edge(incident_edges, value)
+            else:
+                self.graph_info[key] = value
+        self.extract_extents(self.graph_info)
+        self.extract_background_color(self.graph_info)
+        self.add_reactions_species_references(incident_edges)
+
     def extract_extents(self, graph_info):
         if 'position' in list(graph_info.keys()):
             if 'x' in list(graph_info['position'].keys()):
@@ -37,13 +61,37 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
     def extract_entities(self, graph_info):
         if 'nodes' in list(graph_info.keys()):
             for node in graph_info['nodes']:
-                if 'style' in list(node.keys()) and 'category' in list(node['style'].keys()):
-                    if node['style']['category'].lower() == "compartment":
-                        self.add_compartment(node)
-                    elif node['style']['category'].lower() == "species":
-                        self.add_species(node)
-                    elif node['style']['category'].lower() == "reaction":
-                        self.add_reaction(node, graph_info)
+                self.add_node(node)
+        incident_edges = {}
+        if 'edges' in list(graph_info.keys()):
+            for edge in graph_info['edges']:
+                self.index_incident_edge(incident_edges, edge)
+        self.add_reactions_species_references(incident_edges)
+
+    def add_node(self, node):
+        if 'style' in list(node.keys()) and 'category' in list(node['style'].keys()):
+            if node['style']['category'].lower() == "compartment":
+                self.add_compartment(node)
+            elif node['style']['category'].lower() == "species":
+                self.add_species(node)
+            elif node['style']['category'].lower() == "reaction":
+                self.add_reaction(node)
+
+    @staticmethod
+    def index_incident_edge(incident_edges, edge):
+        # edges connected to each node, in the order of the edges of the graph
+        source_node = None
+        if 'source' in list(edge.keys()) and 'node' in list(edge['source'].keys()):
+            source_node = edge['source']['node']
+            incident_edges.setdefault(source_node, []).append(edge)
+        if 'target' in list(edge.keys()) and 'node' in list(edge['target'].keys()) and \
+                edge['target']['node'] != source_node:
+            incident_edges.setdefault(edge['target']['node'], []).append(edge)
+
+    def add_reactions_species_references(self, incident_edges):
+        for reaction in self.reactions:
+            for edge in incident_edges.get(reaction['referenceId'], []):
+                self.add_species_reference(reaction['speciesReferences'], edge)
 
     def add_compartment(self, compartment_info):
         compartment_ = {}
@@ -51,7 +99,7 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
             compartment_['info'] = compartment_info
             compartment_['id'] = compartment_info['id'] + "_glyph"
             compartment_['referenceId'] = compartment_info['id']
-            self.compartments.append(compartment_)
+            self.append_compartment(compartment_)
 
     def add_species(self, species_info):
         species_ = {}
@@ -59,9 +107,9 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
             species_['info'] = species_info
             species_['id'] = species_info['id'] + "_glyph"
             species_['referenceId'] = species_info['id']
-            self.species.append(species_)
+            self.append_species(species_)
 
-    def add_reaction(self, reaction_info, graph_info):
+    def add_reaction(self, reaction_info):
         reaction_ = {}
         if 'id' in list(reaction_info.keys()):
             reaction_['info'] = reaction_info
@@ -69,16 +117,7 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
             reaction_['referenceId'] = reaction_info['id']
 
             reaction_['speciesReferences'] = []
-            if 'edges' in list(graph_info.keys()):
-                for edge in graph_info['edges']:
-                    if ('source' in list(edge.keys()) and
-                        'node' in list(edge['source'].keys()) and
-                        edge['source']['node'] == reaction_['referenceId']) or \
-                            ('target' in list(edge.keys()) and
-                             'node' in list(edge['target'].keys()) and
-                             edge['target']['node'] == reaction_['referenceId']):
-                        self.add_species_reference(reaction_['speciesReferences'], edge)
-            self.reactions.append(reaction_)
+            self.append_reaction(reaction_)
 
     @staticmethod
     def add_species_reference(species_references, species_reference_info):
@@ -97,12 +136,12 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
 
     def add_color(self, color):
         if not self.find_color(color):
-            self.colors.append({'id': color})
+            self.append_color({'id': color})
 
     def add_line_ending(self, line_ending):
         if 'name' in list(line_ending.keys()) and not self.find_line_ending(line_ending['name']) and \
                 'shapes' in list(line_ending.keys()) and len(line_ending['shapes']):
-            self.line_endings.append({'id': line_ending['name'], 'info': line_ending})
+            self.append_line_ending({'id': line_ending['name'], 'info': line_ending})
 
     def extract_compartment_features(self, compartment):
         self.extract_node_features(compartment)
@@ -131,13 +170,10 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
             if color['id'].startswith("#"):
                 color['features'] = {}
                 color['features']['value'] = color['id']
-                color['id'] = self.find_color_unique_id()
+                self.rename_color(color, self.find_color_unique_id())
             elif 'features' not in list(color.keys()) or 'value' not in list(color['features'].keys()):
                 color['features'] = {}
-                try:
-                    color['features']['value'] = webcolors.name_to_hex(color['id'])
-                except:
-                    color['features']['value'] = webcolors.name_to_hex("white")
+                color['features']['value'] = color_to_hex(color['id'], "#ffffff")
 
     def extract_line_ending_features(self, line_ending):
         line_ending['features'] = {}
@@ -167,8 +203,9 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
             if 'name' in list(node['info']['style']):
                 node['features']['styleName'] = node['info']['style']['name']
             if 'shapes' in list(node['info']['style']):
-                node['features']['graphicalShape'] = \
-                    self.extract_graphical_shape_features(node['info']['style']['shapes'], offset_x, offset_y)
+                if self.extracts_render_features():
+                    node['features']['graphicalShape'] = \
+                        self.extract_graphical_shape_features(node['info']['style']['shapes'], offset_x, offset_y)
                 for shape in node['info']['style']['shapes']:
                     if 'shape' in list(shape.keys()) and shape['shape'].lower() == "text":
                         self.add_text(node, shape)
@@ -258,7 +295,8 @@ class NetworkInfoImportFromNetworkEditor(NetworkInfoImportBase):
         if 'style' in list(edge['info'].keys()):
             if 'name' in list(edge['info']['style']):
                 edge['features']['styleName'] = edge['info']['style']['name']
-            if 'shapes' in list(edge['info']['style']) and len(edge['info']['style']['shapes']):
+            if 'shapes' in list(edge['info']['style']) and len(edge['info']['style']['shapes']) and \
+                    self.extracts_render_features():
                 edge['features']['graphicalCurve'] = \
                     self.extract_curve_features(edge['info']['style']['shapes'][0], edge['features']['curve'])
                 if 'arrow-head' in list(edge['info']['style']):
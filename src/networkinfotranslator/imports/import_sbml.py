@@ -1,33 +1,72 @@
 from .import_base import NetworkInfoImportBase
+from .extraction_cache import ExtractionCache, read_graph_content
+from .layout_accessor import LayoutAccessor
+from ..tracing import traced, span, count_entities
 import libsbmlnetwork
 import math
 
 
 class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
     def __init__(self, display_compartments_text_label=True,
-                 display_species_text_label=True, display_reactions_text_label =False):
-        super().__init__()
+                 display_species_text_label=True, display_reactions_text_label =False, compact_entities=False,
+                 cache_dir=None, cache_max_size=256 * 1024 * 1024, profile="full", layout_cache_dir=None,
+                 regenerate_layout=False):
+        super().__init__(compact_entities, profile)
         self.sbml_network = None
         self.display_compartments_text_label = display_compartments_text_label
         self.display_species_text_label = display_species_text_label
         self.display_reactions_text_label = display_reactions_text_label
         self.empty_species_ids = []
-
+        self.render_info_extracted = False
+        # glyphs of the layout, read in one pass at the start of the feature extraction
+        self.layout_accessor = None
+        # opt-in on-disk cache of the extracted graph info
+        self.cache = ExtractionCache(cache_dir, cache_max_size) if cache_dir else None
+        self.cache_key = None
+        # on-disk cache of the layouts generated for the models without one, which falls back to the info cache
+        self.layout_cache = ExtractionCache(layout_cache_dir, cache_max_size) if layout_cache_dir else self.cache
+        # generate the layout again, ignoring the cached layouts and info
+        self.regenerate_layout = regenerate_layout
+
+    @traced("import.extract_info", count_entities)
     def extract_info(self, graph):
         super().extract_info(graph)
+        self.cache_key = None
+        self.render_info_extracted = False
+        if self.cache and self.load_cached_info(graph):
+            return
         if isinstance(graph, libsbmlnetwork.LibSBMLNetwork):
             self.sbml_network = graph
         else:
-            self.sbml_network = libsbmlnetwork.LibSBMLNetwork(graph)
+            with span("import.read_sbml"):
+                self.sbml_network = libsbmlnetwork.LibSBMLNetwork(graph)
         self.extract_layout_info()
-        self.extract_render_info()
+        if self.profile == "full":
+            self.extract_render_info()
 
     def extract_layout_info(self):
         if not self.sbml_network.getNumLayouts():
-            self.sbml_network.createDefaultLayout()
+            self.create_default_layout()
         self.extract_layout_features()
 
+    def create_default_layout(self):
+        # the auto-layout is the slowest step of importing a model without a layout, so the model with its generated
+        # layout and render info is cached under the hash of the model
+        layout_cache_key = None
+        if self.layout_cache:
+            layout_cache_key = self.layout_cache.make_key(self.sbml_network.export().encode(), "layout")
+            if not self.regenerate_layout:
+                laid_out_sbml = self.layout_cache.load(layout_cache_key)
+                if laid_out_sbml is not None:
+                    self.sbml_network = libsbmlnetwork.LibSBMLNetwork(laid_out_sbml)
+                    return
+        self.sbml_network.createDefaultLayout()
+        self.extract_global_render_info()
+        if layout_cache_key:
+            self.layout_cache.store(layout_cache_key, self.sbml_network.export())
+
     def extract_render_info(self):
+        self.render_info_extracted = True
         self.extract_global_render_info()
         self.extract_global_render_features()
         self.extract_local_render_info()
@@ -84,27 +123,75 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
         for le_index in range(self.sbml_network.getNumLocalLineEndings()):
             self.add_line_ending(self.sbml_network.getLocalLineEndingId(le_index))
 
-    def extract_extents(self, bounding_box_x, bounding_box_y, bounding_box_width, bounding_box_height):
-        self.extents['minX'] = min(self.extents['minX'], bounding_box_x)
-        self.extents['minY'] = min(self.extents['minY'], bounding_box_y)
-        self.extents['maxX'] = self.extents['minX'] + self.sbml_network.getCanvasWidth()
-        self.extents['maxY'] = self.extents['minY'] + self.sbml_network.getCanvasHeight()
+    def load_cached_info(self, graph):
+        graph_content = read_graph_content(graph)
+        if graph_content is None:
+            return False
+        self.cache_key = self.cache.make_key(graph_content, self.display_compartments_text_label,
+                                             self.display_species_text_label, self.display_reactions_text_label,
+                                             self.compact_entities)
+        # the cached info may have been extracted from a previously generated layout
+        if self.regenerate_layout:
+            return False
+        cached_info = self.cache.load(self.cache_key)
+        if cached_info is None:
+            return False
+        self.set_extracted_info(cached_info)
+
+        return True
+
+    def store_cached_info(self):
+        self.cache.store(self.cache_key, self.get_extracted_info())
+        # the entry is written once per import
+        self.cache_key = None
+
+    def get_extracted_info(self):
+        info = super().get_extracted_info()
+        info['empty_species_ids'] = self.empty_species_ids
+
+        return info
+
+    def set_extracted_info(self, info):
+        super().set_extracted_info(info)
+        self.sbml_network = None
+        self.empty_species_ids = info.get('empty_species_ids', [])
+
+    @traced("import.extract_entity_features", count_entities)
+    def extract_entity_features(self, required_profile=None):
+        if self.has_extracted_features(required_profile):
+            return
+        if self.get_extraction_profile(required_profile) == "full" and not self.render_info_extracted:
+            self.extract_render_info()
+        self.layout_accessor = LayoutAccessor(self.sbml_network.export())
+        super().extract_entity_features(required_profile)
+        self.extract_extents()
+        # only the full extraction is cached, as it serves both profiles
+        if self.cache_key and self.extracted_profile == "full":
+            self.store_cached_info()
+
+    def extract_extents(self):
+        glyphs_extents = self.geometry.get_extents()
+        if glyphs_extents:
+            self.extents['minX'] = min(self.extents['minX'], glyphs_extents['minX'])
+            self.extents['minY'] = min(self.extents['minY'], glyphs_extents['minY'])
+            self.extents['maxX'] = self.extents['minX'] + self.sbml_network.getCanvasWidth()
+            self.extents['maxY'] = self.extents['minY'] + self.sbml_network.getCanvasHeight()
 
     def add_compartment(self, compartment_id):
         for cg_index in range(self.sbml_network.getNumCompartmentGlyphs(compartment_id)):
             compartment = self.extract_go_object_features(compartment_id, cg_index)
-            self.compartments.append(compartment)
+            self.append_compartment(compartment)
 
     def add_species(self, species_id):
         for sg_index in range(self.sbml_network.getNumSpeciesGlyphs(species_id)):
             species = self.extract_go_object_features(species_id, sg_index)
             species['compartment'] = self.sbml_network.getGraphicalObjectCompartmentId(species_id)
-            self.species.append(species)
+            self.append_species(species)
 
     def add_empty_species(self, empty_species_id):
         self.empty_species_ids.append(empty_species_id)
         species = self.extract_go_object_features(empty_species_id, 0)
-        self.species.append(species)
+        self.append_species(species)
 
     def add_reaction(self, reaction_id):
         for rg_index in range(self.sbml_network.getNumReactionGlyphs(reaction_id)):
@@ -118,7 +205,7 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
                 species_reference['species_glyph_id'] = self.sbml_network.getSpeciesReferenceSpeciesGlyphId(reaction_id, rg_index, srg_index)
                 species_reference['species_reference_glyph_index'] = srg_index
                 species_reference['id'] = self.sbml_network.getSpeciesReferenceId(reaction_id, rg_index, srg_index)
-                species_reference['referenceId'] = self.sbml_network.getSpeciesReferenceId(reaction_id, rg_index, srg_index)
+                species_reference['referenceId'] = species_reference['id']
                 if self.sbml_network.isSetSpeciesReferenceRole(reaction_id, rg_index, srg_index):
                     species_reference['role'] = self.sbml_network.getSpeciesReferenceRole(reaction_id, rg_index, srg_index)
                 if self.sbml_network.isSetSpeciesReferenceEmptySpeciesGlyph(reaction_id, rg_index, srg_index):
@@ -126,20 +213,20 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
                     if empty_species_id == species_reference['species_glyph_id']:
                         self.add_empty_species(empty_species_id)
                 reaction['speciesReferences'].append(species_reference)
-            self.reactions.append(reaction)
+            self.append_reaction(reaction)
 
     def add_additional_graphical_object(self, additional_graphical_object_id):
         graphical_object = self.extract_go_object_features(additional_graphical_object_id, 0)
         self.additional_graphical_objects.append(graphical_object)
 
     def add_color(self, color_id):
-        self.colors.append({'id': color_id})
+        self.append_color({'id': color_id})
 
     def add_gradient(self, gradient_id):
-        self.gradients.append({'id': gradient_id})
+        self.append_gradient({'id': gradient_id})
 
     def add_line_ending(self, line_ending_id):
-        self.line_endings.append({'id': line_ending_id})
+        self.append_line_ending({'id': line_ending_id})
 
     def extract_go_object_features(self, entity_id, graphical_object_index):
         features = {'referenceId': entity_id, 'id': self.sbml_network.getId(entity_id, graphical_object_index),
@@ -154,87 +241,97 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
             compartment['features'] = self.extract_go_general_features(compartment['referenceId'], compartment['index'])
             if self.display_compartments_text_label:
                 compartment['texts'] = self.extract_go_text_features(compartment['referenceId'], compartment['index'])
-            self.extract_extents(self.sbml_network.getX(compartment['referenceId'], compartment['index']),
-                                 self.sbml_network.getY(compartment['referenceId'], compartment['index']),
-                                 self.sbml_network.getWidth(compartment['referenceId'], compartment['index']),
-                                 self.sbml_network.getHeight(compartment['referenceId'], compartment['index']))
 
     def extract_species_features(self, species):
         if species['referenceId']:
             species['features'] = self.extract_go_general_features(species['referenceId'], species['index'])
             if self.display_species_text_label and not species['referenceId'] in self.empty_species_ids:
                 species['texts'] = self.extract_go_text_features(species['referenceId'], species['index'])
-            self.extract_extents(self.sbml_network.getX(species['referenceId'], species['index']),
-                                 self.sbml_network.getY(species['referenceId'], species['index']),
-                                 self.sbml_network.getWidth(species['referenceId'], species['index']),
-                                 self.sbml_network.getHeight(species['referenceId'], species['index']))
 
     def extract_reaction_features(self, reaction):
         if reaction['referenceId']:
             reaction['features'] = self.extract_go_general_features(reaction['referenceId'], reaction['index'])
             if self.display_reactions_text_label:
                 reaction['texts'] = self.extract_go_text_features(reaction['referenceId'], reaction['index'])
-            self.extract_extents(self.sbml_network.getX(reaction['referenceId'], reaction['index']),
-                                 self.sbml_network.getY(reaction['referenceId'], reaction['index']),
-                                 self.sbml_network.getWidth(reaction['referenceId'], reaction['index']),
-                                 self.sbml_network.getHeight(reaction['referenceId'], reaction['index']))
-            if self.sbml_network.isSetCurve(reaction['referenceId'], reaction['index']):
-                curve = []
-                for cs_index in range(self.sbml_network.getNumCurveSegments(reaction['referenceId'], reaction['index'])):
-                    curve_segment = {'startX': self.sbml_network.getCurveSegmentStartPointX(reaction['referenceId'], reaction['index'], cs_index),
-                                'startY': self.sbml_network.getCurveSegmentStartPointY(reaction['referenceId'], reaction['index'], cs_index),
-                                'endX': self.sbml_network.getCurveSegmentEndPointX(reaction['referenceId'], reaction['index'], cs_index),
-                                'endY': self.sbml_network.getCurveSegmentEndPointY(reaction['referenceId'], reaction['index'], cs_index)}
-                    if self.sbml_network.isCurveSegmentCubicBezier(reaction['referenceId'], reaction['index'], cs_index):
-                        curve_segment["basePoint1X"] = self.sbml_network.getCurveSegmentBasePoint1X(reaction['referenceId'], reaction['index'], cs_index)
-                        curve_segment["basePoint1Y"] = self.sbml_network.getCurveSegmentBasePoint1Y(reaction['referenceId'], reaction['index'], cs_index)
-                        curve_segment["basePoint2X"] = self.sbml_network.getCurveSegmentBasePoint2X(reaction['referenceId'], reaction['index'], cs_index)
-                        curve_segment["basePoint2Y"] = self.sbml_network.getCurveSegmentBasePoint2Y(reaction['referenceId'], reaction['index'], cs_index)
-                    curve.append(curve_segment)
-                if curve:
-                    reaction['features']['curve'] = curve
+            curve = self.extract_curve_segments(reaction['referenceId'], reaction['index'])
+            if curve:
+                reaction['features']['curve'] = self.geometry.add_curve((reaction['referenceId'], reaction['index']), curve)
+                if self.extracts_render_features():
                     reaction['features']['graphicalCurve'] = self.extract_curve_features(reaction['referenceId'], reaction['index'])
 
     def extract_species_reference_features(self, species_reference):
         species_reference['features'] = {}
         if species_reference['reaction']:
-            curve = []
-            for cs_index in range(self.sbml_network.getNumSpeciesReferenceCurveSegments(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'])):
-                curve_segment = {'startX': self.sbml_network.getSpeciesReferenceCurveSegmentStartPointX(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index),
-                            'startY': self.sbml_network.getSpeciesReferenceCurveSegmentStartPointY(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index),
-                            'endX': self.sbml_network.getSpeciesReferenceCurveSegmentEndPointX(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index),
-                            'endY': self.sbml_network.getSpeciesReferenceCurveSegmentEndPointY(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index)}
-                if self.sbml_network.isSpeciesReferenceCurveSegmentCubicBezier(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index):
-                    curve_segment["basePoint1X"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint1X(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index)
-                    curve_segment["basePoint1Y"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint1Y(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index)
-                    curve_segment["basePoint2X"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint2X(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index)
-                    curve_segment["basePoint2Y"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint2Y(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'], cs_index)
-
-                if cs_index == 0:
-                    species_reference['features']['startPoint'] = {'x': curve_segment['startX'], 'y': curve_segment['startY']}
-                    if 'basePoint1X' in list(curve_segment.keys()) and not curve_segment['startX'] == curve_segment['basePoint1X']:
-                        species_reference['features']['startSlope'] = math.atan2(curve_segment['startY'] - curve_segment['basePoint1Y'], curve_segment['startX'] - curve_segment['basePoint1X'])
-                    else:
-                        species_reference['features']['startSlope'] = math.atan2(curve_segment['startY'] - curve_segment['endY'], curve_segment['startX'] - curve_segment['endX'])
-                if cs_index == self.sbml_network.getNumSpeciesReferenceCurveSegments(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index']) - 1:
-                    species_reference['features']['endPoint'] = {'x': curve_segment['endX'], 'y': curve_segment['endY']}
-                    if 'basePoint2X' in list(curve_segment.keys()) and not curve_segment['endX'] == curve_segment['basePoint2X']:
-                        species_reference['features']['endSlope'] = math.atan2(curve_segment['endY'] - curve_segment['basePoint2Y'], curve_segment['endX'] - curve_segment['basePoint2X'])
-                    else:
-                        species_reference['features']['endSlope'] = math.atan2(curve_segment['endY'] - curve_segment['startY'], curve_segment['endX'] - curve_segment['startX'])
-                curve.append(curve_segment)
+            curve = self.extract_species_reference_curve_segments(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'])
             if curve:
-                species_reference['features']['curve'] = curve
-                species_reference['features']['graphicalCurve'] = self.extract_species_reference_curve_features(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'])
+                curve_segment = curve[0]
+                species_reference['features']['startPoint'] = {'x': curve_segment['startX'], 'y': curve_segment['startY']}
+                if 'basePoint1X' in curve_segment and not curve_segment['startX'] == curve_segment['basePoint1X']:
+                    species_reference['features']['startSlope'] = math.atan2(curve_segment['startY'] - curve_segment['basePoint1Y'], curve_segment['startX'] - curve_segment['basePoint1X'])
+                else:
+                    species_reference['features']['startSlope'] = math.atan2(curve_segment['startY'] - curve_segment['endY'], curve_segment['startX'] - curve_segment['endX'])
+                curve_segment = curve[-1]
+                species_reference['features']['endPoint'] = {'x': curve_segment['endX'], 'y': curve_segment['endY']}
+                if 'basePoint2X' in curve_segment and not curve_segment['endX'] == curve_segment['basePoint2X']:
+                    species_reference['features']['endSlope'] = math.atan2(curve_segment['endY'] - curve_segment['basePoint2Y'], curve_segment['endX'] - curve_segment['basePoint2X'])
+                else:
+                    species_reference['features']['endSlope'] = math.atan2(curve_segment['endY'] - curve_segment['startY'], curve_segment['endX'] - curve_segment['startX'])
+                species_reference['features']['curve'] = self.geometry.add_curve((species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index']), curve)
+                if self.extracts_render_features():
+                    species_reference['features']['graphicalCurve'] = self.extract_species_reference_curve_features(species_reference['reaction'], species_reference['reaction_glyph_index'], species_reference['species_reference_glyph_index'])
+
+    def get_layout_glyph(self, entity_id, graphical_object_index):
+        if self.layout_accessor:
+            return self.layout_accessor.get_glyph(entity_id, graphical_object_index)
+
+        return None
+
+    def extract_curve_segments(self, entity_id, graphical_object_index):
+        glyph = self.get_layout_glyph(entity_id, graphical_object_index)
+        if glyph:
+            return glyph.get('curve', [])
+
+        curve = []
+        if self.sbml_network.isSetCurve(entity_id, graphical_object_index):
+            for cs_index in range(self.sbml_network.getNumCurveSegments(entity_id, graphical_object_index)):
+                curve_segment = {'startX': self.sbml_network.getCurveSegmentStartPointX(entity_id, graphical_object_index, cs_index),
+                                 'startY': self.sbml_network.getCurveSegmentStartPointY(entity_id, graphical_object_index, cs_index),
+                                 'endX': self.sbml_network.getCurveSegmentEndPointX(entity_id, graphical_object_index, cs_index),
+                                 'endY': self.sbml_network.getCurveSegmentEndPointY(entity_id, graphical_object_index, cs_index)}
+                if self.sbml_network.isCurveSegmentCubicBezier(entity_id, graphical_object_index, cs_index):
+                    curve_segment["basePoint1X"] = self.sbml_network.getCurveSegmentBasePoint1X(entity_id, graphical_object_index, cs_index)
+                    curve_segment["basePoint1Y"] = self.sbml_network.getCurveSegmentBasePoint1Y(entity_id, graphical_object_index, cs_index)
+                    curve_segment["basePoint2X"] = self.sbml_network.getCurveSegmentBasePoint2X(entity_id, graphical_object_index, cs_index)
+                    curve_segment["basePoint2Y"] = self.sbml_network.getCurveSegmentBasePoint2Y(entity_id, graphical_object_index, cs_index)
+                curve.append(curve_segment)
+
+        return curve
+
+    def extract_species_reference_curve_segments(self, reaction_id, reaction_glyph_index, species_reference_glyph_index):
+        if self.layout_accessor:
+            curve = self.layout_accessor.get_species_reference_curve(reaction_id, reaction_glyph_index, species_reference_glyph_index)
+            if curve is not None:
+                return curve
+
+        curve = []
+        for cs_index in range(self.sbml_network.getNumSpeciesReferenceCurveSegments(reaction_id, reaction_glyph_index, species_reference_glyph_index)):
+            curve_segment = {'startX': self.sbml_network.getSpeciesReferenceCurveSegmentStartPointX(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index),
+                             'startY': self.sbml_network.getSpeciesReferenceCurveSegmentStartPointY(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index),
+                             'endX': self.sbml_network.getSpeciesReferenceCurveSegmentEndPointX(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index),
+                             'endY': self.sbml_network.getSpeciesReferenceCurveSegmentEndPointY(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index)}
+            if self.sbml_network.isSpeciesReferenceCurveSegmentCubicBezier(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index):
+                curve_segment["basePoint1X"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint1X(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index)
+                curve_segment["basePoint1Y"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint1Y(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index)
+                curve_segment["basePoint2X"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint2X(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index)
+                curve_segment["basePoint2Y"] = self.sbml_network.getSpeciesReferenceCurveSegmentBasePoint2Y(reaction_id, reaction_glyph_index, species_reference_glyph_index, cs_index)
+            curve.append(curve_segment)
+
+        return curve
 
     def extract_additional_graphical_object_features(self, additional_graphical_object):
         if additional_graphical_object['referenceId']:
             additional_graphical_object['features'] = self.extract_go_general_features(additional_graphical_object['referenceId'], additional_graphical_object['index'])
             additional_graphical_object['texts'] = self.extract_go_text_features(additional_graphical_object['referenceId'], additional_graphical_object['index'])
-            self.extract_extents(self.sbml_network.getX(additional_graphical_object['referenceId'], additional_graphical_object['index']),
-                                 self.sbml_network.getY(additional_graphical_object['referenceId'], additional_graphical_object['index']),
-                                 self.sbml_network.getWidth(additional_graphical_object['referenceId'], additional_graphical_object['index']),
-                                 self.sbml_network.getHeight(additional_graphical_object['referenceId'], additional_graphical_object['index']))
 
     def extract_color_features(self, color):
         color['features'] = {}
@@ -308,15 +405,25 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
 
     def extract_go_text_features(self, entity_id, graphical_object_index):
         text_features = []
-        for text_glyph_index in range(self.sbml_network.getNumTextGlyphs(entity_id, graphical_object_index)):
-            features = {'features': {'plainText': self.sbml_network.getText(entity_id,
-                                                                            graphical_object_index=graphical_object_index,
-                                                                            text_glyph_index=text_glyph_index),
+        glyph = self.get_layout_glyph(entity_id, graphical_object_index)
+        if glyph:
+            text_glyphs = glyph['texts']
+        else:
+            text_glyphs = [None] * self.sbml_network.getNumTextGlyphs(entity_id, graphical_object_index)
+        for text_glyph_index, text_glyph in enumerate(text_glyphs):
+            if text_glyph:
+                plain_text = text_glyph['plainText']
+            else:
+                plain_text = self.sbml_network.getText(entity_id, graphical_object_index=graphical_object_index,
+                                                       text_glyph_index=text_glyph_index)
+            features = {'features': {'plainText': plain_text,
                                      'boundingBox': self.extract_text_bounding_box_features(entity_id,
                                                                                             graphical_object_index,
-                                                                                            text_glyph_index),
-                                     'graphicalText': self.extract_text_features(entity_id,
-                                                                                 graphical_object_index, text_glyph_index)}}
+                                                                                            text_glyph_index,
+                                                                                            text_glyph)}}
+            if self.extracts_render_features():
+                features['features']['graphicalText'] = self.extract_text_features(entity_id, graphical_object_index,
+                                                                                   text_glyph_index)
             text_features.append(features)
 
         return text_features
@@ -349,32 +456,46 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
         return features
 
     def extract_go_general_features(self, entity_id, graphical_object_index):
-        features = {'boundingBox': self.extract_bounding_box_features(entity_id, graphical_object_index),
-                    'graphicalShape': self.extract_graphical_shape_features(entity_id, graphical_object_index)}
+        features = {'boundingBox': self.extract_bounding_box_features(entity_id, graphical_object_index)}
+        if self.extracts_render_features():
+            features['graphicalShape'] = self.extract_graphical_shape_features(entity_id, graphical_object_index)
 
         return features
 
     def extract_bounding_box_features(self, entity_id, graphical_object_index):
-        return {'x': self.sbml_network.getX(entity_id, graphical_object_index), 'y': self.sbml_network.getY(entity_id, graphical_object_index),
-                'width': self.sbml_network.getWidth(entity_id, graphical_object_index), 'height': self.sbml_network.getHeight(entity_id, graphical_object_index)}
-
-    def extract_text_bounding_box_features(self, entity_id, graphical_object_index, text_glyph_index):
-        return {'x': self.sbml_network.getTextX(entity_id, graphical_object_index, text_glyph_index),
-                'y': self.sbml_network.getTextY(entity_id, graphical_object_index, text_glyph_index),
-                'width': self.sbml_network.getTextWidth(entity_id, graphical_object_index, text_glyph_index),
-                'height': self.sbml_network.getTextHeight(entity_id, graphical_object_index, text_glyph_index)}
+        glyph = self.get_layout_glyph(entity_id, graphical_object_index)
+        if glyph:
+            return self.geometry.add_bounding_box((entity_id, graphical_object_index), *glyph['boundingBox'])
+
+        return self.geometry.add_bounding_box((entity_id, graphical_object_index),
+                                              self.sbml_network.getX(entity_id, graphical_object_index), self.sbml_network.getY(entity_id, graphical_object_index),
+                                              self.sbml_network.getWidth(entity_id, graphical_object_index), self.sbml_network.getHeight(entity_id, graphical_object_index))
+
+    def extract_text_bounding_box_features(self, entity_id, graphical_object_index, text_glyph_index, text_glyph=None):
+        if text_glyph:
+            return self.geometry.add_bounding_box((entity_id, graphical_object_index, text_glyph_index),
+                                                  *text_glyph['boundingBox'], is_glyph=False)
+
+        return self.geometry.add_bounding_box((entity_id, graphical_object_index, text_glyph_index),
+                                              self.sbml_network.getTextX(entity_id, graphical_object_index, text_glyph_index),
+                                              self.sbml_network.getTextY(entity_id, graphical_object_index, text_glyph_index),
+                                              self.sbml_network.getTextWidth(entity_id, graphical_object_index, text_glyph_index),
+                                              self.sbml_network.getTextHeight(entity_id, graphical_object_index, text_glyph_index),
+                                              is_glyph=False)
 
     def extract_graphical_shape_features(self, entity_id, graphical_object_index):
         graphical_shape_info = {}
         graphical_shape_info = self.extract_render_group_general_features(entity_id, graphical_object_index)
-        graphical_shape_info['geometricShapes'] = self.extract_render_group_geometric_shapes(entity_id, graphical_object_index)
+        graphical_shape_info['geometricShapes'] = self.extract_render_group_geometric_shapes(entity_id, graphical_object_index,
+                                                                                            graphical_shape_info.get('strokeDashArray'))
 
         return graphical_shape_info
 
     def extract_line_ending_graphical_shape_features(self, line_ending_id):
         line_ending_graphical_shape_info = {}
         line_ending_graphical_shape_info = self.extract_line_ending_render_group_general_features(line_ending_id)
-        line_ending_graphical_shape_info['geometricShapes'] = self.extract_line_ending_render_group_geometric_shapes(line_ending_id)
+        line_ending_graphical_shape_info['geometricShapes'] = self.extract_line_ending_render_group_geometric_shapes(line_ending_id,
+                                                                                                                    line_ending_graphical_shape_info)
 
         return line_ending_graphical_shape_info
 
@@ -387,9 +508,10 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
         if self.sbml_network.isSetBorderWidth(entity_id, graphical_object_index):
             render_group_general_features['strokeWidth'] = self.sbml_network.getBorderWidth(entity_id, graphical_object_index)
         # get stroke dash array
-        if self.sbml_network.getNumBorderDashes(entity_id, graphical_object_index):
+        num_dashes = self.sbml_network.getNumBorderDashes(entity_id, graphical_object_index)
+        if num_dashes:
             dash_array = []
-            for d_index in range(self.sbml_network.getNumBorderDashes(entity_id, graphical_object_index)):
+            for d_index in range(num_dashes):
                 dash_array.append(self.sbml_network.getBorderDash(entity_id, graphical_object_index, d_index))
             render_group_general_features['strokeDashArray'] = tuple(dash_array)
         # get fill color
@@ -410,9 +532,10 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
         if self.sbml_network.isSetLineEndingBorderWidth(line_ending_id):
             line_ending_render_group_general_features['strokeWidth'] = self.sbml_network.getLineEndingBorderWidth(line_ending_id)
         # get stroke dash array
-        if self.sbml_network.getNumLineEndingBorderDashes(line_ending_id):
+        num_dashes = self.sbml_network.getNumLineEndingBorderDashes(line_ending_id)
+        if num_dashes:
             dash_array = []
-            for d_index in range(self.sbml_network.getNumLineEndingBorderDashes(line_ending_id)):
+            for d_index in range(num_dashes):
                 dash_array.append(self.sbml_network.getLineEndingBorderDash(line_ending_id, d_index))
             line_ending_render_group_general_features['strokeDashArray'] = tuple(dash_array)
         # get fill color
@@ -424,27 +547,28 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
 
         return line_ending_render_group_general_features
 
-    def extract_render_group_geometric_shapes(self, entity_id, graphical_object_index):
+    def extract_render_group_geometric_shapes(self, entity_id, graphical_object_index, stroke_dash_array):
         geometric_shapes = []
         for gs_index in range(self.sbml_network.getNumGeometricShapes(entity_id, graphical_object_index)):
             geometric_shape = {}
-            geometric_shape.update(self.extract_geometric_shape_general_features(entity_id, graphical_object_index, gs_index))
+            geometric_shape.update(self.extract_geometric_shape_general_features(entity_id, graphical_object_index, gs_index,
+                                                                                 stroke_dash_array))
             geometric_shape.update(self.extract_geometric_shape_exclusive_features(entity_id, graphical_object_index, gs_index))
             geometric_shapes.append(geometric_shape)
 
         return geometric_shapes
 
-    def extract_line_ending_render_group_geometric_shapes(self, line_ending_id):
+    def extract_line_ending_render_group_geometric_shapes(self, line_ending_id, render_group_general_features):
         geometric_shapes = []
         for gs_index in range(self.sbml_network.getNumLineEndingGeometricShapes(line_ending_id)):
             geometric_shape = {}
-            geometric_shape.update(self.extract_line_ending_geometric_shape_general_features(line_ending_id, gs_index))
+            geometric_shape.update(self.extract_line_ending_geometric_shape_general_features(render_group_general_features))
             geometric_shape.update(self.extract_line_ending_geometric_shape_exclusive_features(line_ending_id, gs_index))
             geometric_shapes.append(geometric_shape)
 
         return geometric_shapes
 
-    def extract_geometric_shape_general_features(self, entity_id, graphical_object_index, geometric_shape_index):
+    def extract_geometric_shape_general_features(self, entity_id, graphical_object_index, geometric_shape_index, stroke_dash_array):
         geometric_shape_general_features = {}
         # get stroke color
         if self.sbml_network.isSetGeometricShapeBorderColor(entity_id, geometric_shape_index, graphical_object_index):
@@ -458,31 +582,19 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
                                                                                                              geometric_shape_index,
                                                                                                              graphical_object_index)
 
-        # get stroke dash array
-        if self.sbml_network.getNumBorderDashes(entity_id, graphical_object_index):
-            dash_array = []
-            for d_index in range(self.sbml_network.getNumBorderDashes(entity_id, graphical_object_index)):
-                dash_array.append(self.sbml_network.getBorderDash(entity_id, graphical_object_index, d_index))
-            geometric_shape_general_features['strokeDashArray'] = tuple(dash_array)
+        # get stroke dash array (the one of the render group, already read)
+        if stroke_dash_array:
+            geometric_shape_general_features['strokeDashArray'] = stroke_dash_array
 
         return geometric_shape_general_features
 
-    def extract_line_ending_geometric_shape_general_features(self, line_ending_id, geometric_shape_index):
+    @staticmethod
+    def extract_line_ending_geometric_shape_general_features(render_group_general_features):
+        # the stroke of the geometric shapes of a line ending is the one of its render group, already read
         geometric_shape_general_features = {}
-        # get stroke color
-        if self.sbml_network.isSetLineEndingBorderColor(line_ending_id):
-            geometric_shape_general_features['strokeColor'] = self.sbml_network.getLineEndingBorderColor(line_ending_id)
-
-        # get stroke width
-        if self.sbml_network.isSetLineEndingBorderWidth(line_ending_id):
-            geometric_shape_general_features['strokeWidth'] = self.sbml_network.getLineEndingBorderWidth(line_ending_id)
-
-        # get stroke dash array
-        if self.sbml_network.getNumLineEndingBorderDashes(line_ending_id):
-            dash_array = []
-            for d_index in range(self.sbml_network.getNumLineEndingBorderDashes(line_ending_id)):
-                dash_array.append(self.sbml_network.getLineEndingBorderDash(line_ending_id, d_index))
-            geometric_shape_general_features['strokeDashArray'] = tuple(dash_array)
+        for key in ['strokeColor', 'strokeWidth', 'strokeDashArray']:
+            if key in render_group_general_features:
+                geometric_shape_general_features[key] = render_group_general_features[key]
 
         return geometric_shape_general_features
 
@@ -527,9 +639,10 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
             curve_features['strokeWidth'] = self.sbml_network.getLineWidth(entity_id, graphical_object_index)
 
         # get stroke dash array
-        if self.sbml_network.getNumLineDashes(entity_id, graphical_object_index):
+        num_dashes = self.sbml_network.getNumLineDashes(entity_id, graphical_object_index)
+        if num_dashes:
             dash_array = []
-            for d_index in range(self.sbml_network.getNumLineDashes(entity_id, graphical_object_index)):
+            for d_index in range(num_dashes):
                 dash_array.append(self.sbml_network.getLineDash(entity_id, graphical_object_index, d_index))
             curve_features['strokeDashArray'] = tuple(dash_array)
 
@@ -553,9 +666,10 @@ class NetworkInfoImportFromSBMLModel(NetworkInfoImportBase):
             curve_features['strokeWidth'] = self.sbml_network.getSpeciesReferenceLineWidth(reaction_id, reaction_glyph_index, species_reference_glyph_index)
 
         # get stroke dash array
-        if self.sbml_network.getNumSpeciesReferenceLineDashes(reaction_id, reaction_glyph_index, species_reference_glyph_index):
+        num_dashes = self.sbml_network.getNumSpeciesReferenceLineDashes(reaction_id, reaction_glyph_index, species_reference_glyph_index)
+        if num_dashes:
             dash_array = []
-            for d_index in range(self.sbml_network.getNumSpeciesReferenceLineDashes(reaction_id, reaction_glyph_index, species_reference_glyph_index)):
+            for d_index in range(num_dashes):
                 dash_array.append(self.sbml_network.getSpeciesReferenceLineDash(reaction_id, reaction_glyph_index, species_reference_glyph_index, d_index))
             curve_features['strokeDashArray'] = tuple(dash_array)
 
@@ -0,0 +1,637 @@
+from .import_base import NetworkInfoImportBase
+from .layout_accessor import LayoutAccessor
+from ..tracing import traced, span, count_entities
+import libsbml
+import math
+
+
+class NetworkInfoImportFromSBMLModelUsingLibSBML(NetworkInfoImportBase):
+    """
+    Imports the models that already carry a layout and render information by walking their libsbml Layout and
+    RenderInformation objects directly.
+
+    The styles of the render information are indexed once by id, role and type, so each glyph is matched to its
+    style with a few dict lookups and its render group is read in one pass, instead of looking the glyph up by its
+    id again for every attribute as the libsbmlnetwork API does. The extracted info has the same structure as the
+    one of NetworkInfoImportFromSBMLModel, which the models with no layout or render information fall back to
+    for generating them.
+    """
+    # the types of the styles matching each kind of glyph, from the most to the least specific
+    glyph_style_types = {'compartment': ["COMPARTMENTGLYPH", "GRAPHICALOBJECT", "ANY"],
+                         'species': ["SPECIESGLYPH", "GRAPHICALOBJECT", "ANY"],
+                         'empty_species': ["EMPTY_SPECIESGLYPH", "SPECIESGLYPH", "GRAPHICALOBJECT", "ANY"],
+                         'reaction': ["REACTIONGLYPH", "GRAPHICALOBJECT", "ANY"],
+                         'species_reference': ["SPECIESREFERENCEGLYPH", "GRAPHICALOBJECT", "ANY"],
+                         'additional_graphical_object': ["GENERALGLYPH", "GRAPHICALOBJECT", "ANY"]}
+    text_glyph_style_types = {'compartment': ["COMPARTMENTGLYPH_TEXTGLYPH", "TEXTGLYPH", "GRAPHICALOBJECT", "ANY"],
+                              'species': ["SPECIESGLYPH_TEXTGLYPH", "TEXTGLYPH", "GRAPHICALOBJECT", "ANY"],
+                              'reaction': ["REACTIONGLYPH_TEXTGLYPH", "TEXTGLYPH", "GRAPHICALOBJECT", "ANY"],
+                              'additional_graphical_object': ["TEXTGLYPH", "GRAPHICALOBJECT", "ANY"]}
+
+    def __init__(self, display_compartments_text_label=True,
+                 display_species_text_label=True, display_reactions_text_label=False, compact_entities=False,
+                 profile="full"):
+        super().__init__(compact_entities, profile)
+        self.document = None
+        self.layout = None
+        self.display_compartments_text_label = display_compartments_text_label
+        self.display_species_text_label = display_species_text_label
+        self.display_reactions_text_label = display_reactions_text_label
+        self.empty_species_ids = []
+        self.entity_names = {}
+        # libsbml objects of the glyphs and species reference glyphs, by the keys of their entities
+        self.glyphs = {}
+        self.species_reference_glyphs = {}
+        self.texts = {}
+        # the local render information, then the global one, each with its styles indexed by id, role and type
+        self.render_infos = []
+        self.line_ending_definitions = {}
+        self.color_definitions = {}
+        self.gradient_definitions = {}
+
+    @traced("import.extract_info", count_entities)
+    def extract_info(self, graph):
+        super().extract_info(graph)
+        self.empty_species_ids = []
+        self.glyphs = {}
+        self.species_reference_glyphs = {}
+        self.texts = {}
+        self.render_infos = []
+        with span("import.read_sbml"):
+            self.document = self.read_document(graph)
+        self.layout = self.get_layout(self.document)
+        if self.layout is None or (self.profile == "full" and not self.get_render_info_objects(self.layout)):
+            self.document = self.create_default_layout_and_render(graph)
+            self.layout = self.get_layout(self.document)
+        self.extract_layout_features()
+        if self.profile == "full":
+            self.extract_render_info()
+
+    @staticmethod
+    def read_document(graph):
+        if isinstance(graph, libsbml.SBMLDocument):
+            return graph
+        if graph.lstrip().startswith("<"):
+            return libsbml.readSBMLFromString(graph)
+
+        return libsbml.readSBMLFromFile(graph)
+
+    @staticmethod
+    def get_layout(document):
+        model = document.getModel()
+        if model is None:
+            return None
+        layout_plugin = model.getPlugin('layout')
+        if layout_plugin is None or not layout_plugin.getNumLayouts():
+            return None
+
+        return layout_plugin.getLayout(0)
+
+    @staticmethod
+    def get_render_info_objects(layout):
+        render_infos = []
+        local_render_plugin = layout.getPlugin('render')
+        if local_render_plugin and local_render_plugin.getNumLocalRenderInformationObjects():
+            render_infos.append(local_render_plugin.getRenderInformation(0))
+        global_render_plugin = layout.getParentSBMLObject().getPlugin('render')
+        if global_render_plugin and global_render_plugin.getNumGlobalRenderInformationObjects():
+            global_render_info = None
+            if render_infos and render_infos[0].isSetReferenceRenderInformation():
+                global_render_info = global_render_plugin.getRenderInformation(
+                    render_infos[0].getReferenceRenderInformationId())
+            render_infos.append(global_render_info or global_render_plugin.getRenderInformation(0))
+
+        return render_infos
+
+    def create_default_layout_and_render(self, graph):
+        # the layout and render information missing from the model are generated with libsbmlnetwork, only needed here
+        import libsbmlnetwork
+        if isinstance(graph, libsbml.SBMLDocument):
+            graph = libsbml.writeSBMLToString(graph)
+        sbml_network = libsbmlnetwork.LibSBMLNetwork(graph)
+        if not sbml_network.getNumLayouts():
+            sbml_network.createDefaultLayout()
+        if not sbml_network.getNumGlobalRenderInformation() and not sbml_network.getNumLocalRenderInformation():
+            sbml_network.createDefaultGlobalRenderInformation()
+
+        return libsbml.readSBMLFromString(sbml_network.export())
+
+    def extract_layout_features(self):
+        model = self.document.getModel()
+        # names of the model entities, which are the texts of the text glyphs without a text of their own
+        self.entity_names = {}
+        for entities in [model.getListOfCompartments(), model.getListOfSpecies(), model.getListOfReactions()]:
+            for entity in entities:
+                self.entity_names[entity.getId()] = entity.getName() if entity.isSetName() else entity.getId()
+        for text_glyph in self.layout.getListOfTextGlyphs():
+            self.texts.setdefault(text_glyph.getGraphicalObjectId(), []).append(text_glyph)
+
+        # glyphs of each model entity, in the order of the layout
+        glyphs = {}
+        for compartment_glyph in self.layout.getListOfCompartmentGlyphs():
+            glyphs.setdefault(compartment_glyph.getCompartmentId(), []).append(compartment_glyph)
+        species_glyphs = {}
+        for species_glyph in self.layout.getListOfSpeciesGlyphs():
+            species_glyphs[species_glyph.getId()] = species_glyph
+            if species_glyph.isSetSpeciesId():
+                glyphs.setdefault(species_glyph.getSpeciesId(), []).append(species_glyph)
+        for reaction_glyph in self.layout.getListOfReactionGlyphs():
+            glyphs.setdefault(reaction_glyph.getReactionId(), []).append(reaction_glyph)
+
+        for compartment in model.getListOfCompartments():
+            self.add_compartment(compartment, glyphs.get(compartment.getId(), []))
+
+        for species in model.getListOfSpecies():
+            self.add_species(species, glyphs.get(species.getId(), []))
+
+        for reaction in model.getListOfReactions():
+            self.add_reaction(reaction, glyphs.get(reaction.getId(), []), species_glyphs)
+
+        for additional_graphical_object in self.layout.getListOfAdditionalGraphicalObjects():
+            self.add_additional_graphical_object(additional_graphical_object)
+
+    def extract_render_info(self):
+        self.render_infos = []
+        self.line_ending_definitions = {}
+        self.color_definitions = {}
+        self.gradient_definitions = {}
+        render_infos = self.get_render_info_objects(self.layout)
+        for render_info in render_infos:
+            self.render_infos.append(self.index_styles(render_info))
+        # the definitions of the global render information come first, as with NetworkInfoImportFromSBMLModel
+        for render_info in reversed(render_infos):
+            # libsbml reports the background color as set to its "#FFFFFFFF" default when the attribute is missing
+            if render_info.isSetBackgroundColor() and render_info.getBackgroundColor() != "#FFFFFFFF":
+                self.background_color = render_info.getBackgroundColor()
+            for color_definition in render_info.getListOfColorDefinitions():
+                self.color_definitions[color_definition.getId()] = color_definition
+                self.append_color({'id': color_definition.getId()})
+            for gradient_definition in render_info.getListOfGradientDefinitions():
+                self.gradient_definitions[gradient_definition.getId()] = gradient_definition
+                self.append_gradient({'id': gradient_definition.getId()})
+            for line_ending in render_info.getListOfLineEndings():
+                self.line_ending_definitions[line_ending.getId()] = line_ending
+                self.append_line_ending({'id': line_ending.getId()})
+
+    @staticmethod
+    def index_styles(render_info):
+        styles = {'id': {}, 'role': {}, 'type': {}}
+        for style in render_info.getListOfStyles():
+            # only the local styles have an id list
+            if isinstance(style, libsbml.LocalStyle):
+                for glyph_id in style.createIdString().split():
+                    styles['id'].setdefault(glyph_id, style)
+            for role in style.createRoleString().split():
+                styles['role'].setdefault(role, style)
+            for style_type in style.createTypeString().split():
+                styles['type'].setdefault(style_type, style)
+
+        return styles
+
+    def find_style(self, glyph_id, style_types, role=None):
+        for styles in self.render_infos:
+            style = styles['id'].get(glyph_id)
+            if style is None and role:
+                style = styles['role'].get(role)
+            for style_type in style_types:
+                if style is not None:
+                    break
+                style = styles['type'].get(style_type)
+            if style is not None:
+                return style.getGroup()
+
+        return None
+
+    def add_compartment(self, compartment, compartment_glyphs):
+        for cg_index, compartment_glyph in enumerate(compartment_glyphs):
+            compartment_info = self.extract_go_object_features(compartment.getId(), cg_index, compartment_glyph,
+                                                               'compartment')
+            self.append_compartment(compartment_info)
+
+    def add_species(self, species, species_glyphs):
+        for sg_index, species_glyph in enumerate(species_glyphs):
+            species_info = self.extract_go_object_features(species.getId(), sg_index, species_glyph, 'species')
+            species_info['compartment'] = species.getCompartment()
+            self.append_species(species_info)
+
+    def add_empty_species(self, species_glyph):
+        empty_species_id = species_glyph.getId()
+        self.empty_species_ids.append(empty_species_id)
+        species_info = self.extract_go_object_features(empty_species_id, 0, species_glyph, 'empty_species')
+        self.append_species(species_info)
+
+    def add_reaction(self, reaction, reaction_glyphs, species_glyphs):
+        reaction_id = reaction.getId()
+        for rg_index, reaction_glyph in enumerate(reaction_glyphs):
+            reaction_info = self.extract_go_object_features(reaction_id, rg_index, reaction_glyph, 'reaction')
+            reaction_info['compartment'] = reaction.getCompartment() if reaction.isSetCompartment() else ""
+            reaction_info['speciesReferences'] = []
+            for srg_index, species_reference_glyph in enumerate(reaction_glyph.getListOfSpeciesReferenceGlyphs()):
+                species_glyph = species_glyphs.get(species_reference_glyph.getSpeciesGlyphId())
+                species_reference = {'reaction': reaction_id}
+                species_reference['reaction_glyph_index'] = rg_index
+                species_reference['species'] = species_glyph.getSpeciesId() if species_glyph else ""
+                species_reference['species_glyph_id'] = species_reference_glyph.getSpeciesGlyphId()
+                species_reference['species_reference_glyph_index'] = srg_index
+                species_reference['id'] = species_reference_glyph.getSpeciesReferenceId()
+                species_reference['referenceId'] = species_reference['id']
+                if species_reference_glyph.isSetRole():
+                    species_reference['role'] = species_reference_glyph.getRoleString()
+                if species_glyph and not species_glyph.isSetSpeciesId() and \
+                        not species_glyph.getId() in self.empty_species_ids:
+                    self.add_empty_species(species_glyph)
+                self.species_reference_glyphs[(reaction_id, rg_index, srg_index)] = species_reference_glyph
+                reaction_info['speciesReferences'].append(species_reference)
+            self.append_reaction(reaction_info)
+
+    def add_additional_graphical_object(self, additional_graphical_object):
+        graphical_object = self.extract_go_object_features(additional_graphical_object.getId(), 0,
+                                                           additional_graphical_object, 'additional_graphical_object')
+        self.additional_graphical_objects.append(graphical_object)
+
+    def extract_go_object_features(self, entity_id, graphical_object_index, glyph, glyph_type):
+        self.glyphs[(entity_id, graphical_object_index)] = (glyph, glyph_type)
+        features = {'referenceId': entity_id, 'id': glyph.getId(), 'index': graphical_object_index}
+        if glyph.isSetMetaId():
+            features['metaId'] = glyph.getMetaId()
+
+        return features
+
+    @traced("import.extract_entity_features", count_entities)
+    def extract_entity_features(self, required_profile=None):
+        if self.has_extracted_features(required_profile):
+            return
+        if self.get_extraction_profile(required_profile) == "full" and not self.render_infos:
+            self.extract_render_info()
+        super().extract_entity_features(required_profile)
+        self.extract_extents()
+
+    def extract_extents(self):
+        glyphs_extents = self.geometry.get_extents()
+        if glyphs_extents:
+            self.extents['minX'] = min(self.extents['minX'], glyphs_extents['minX'])
+            self.extents['minY'] = min(self.extents['minY'], glyphs_extents['minY'])
+            self.extents['maxX'] = self.extents['minX'] + self.layout.getDimensions().getWidth()
+            self.extents['maxY'] = self.extents['minY'] + self.layout.getDimensions().getHeight()
+
+    def extract_compartment_features(self, compartment):
+        compartment['features'] = self.extract_go_general_features(compartment['referenceId'], compartment['index'])
+        if self.display_compartments_text_label:
+            compartment['texts'] = self.extract_go_text_features(compartment['referenceId'], compartment['index'])
+
+    def extract_species_features(self, species):
+        species['features'] = self.extract_go_general_features(species['referenceId'], species['index'])
+        if self.display_species_text_label and not species['referenceId'] in self.empty_species_ids:
+            species['texts'] = self.extract_go_text_features(species['referenceId'], species['index'])
+
+    def extract_reaction_features(self, reaction):
+        reaction['features'] = self.extract_go_general_features(reaction['referenceId'], reaction['index'])
+        if self.display_reactions_text_label:
+            reaction['texts'] = self.extract_go_text_features(reaction['referenceId'], reaction['index'])
+        reaction_glyph, glyph_type = self.glyphs[(reaction['referenceId'], reaction['index'])]
+        curve = LayoutAccessor.read_curve(reaction_glyph.getCurve()) if reaction_glyph.isSetCurve() else []
+        if curve:
+            reaction['features']['curve'] = self.geometry.add_curve((reaction['referenceId'], reaction['index']), curve)
+            if self.extracts_render_features():
+                reaction['features']['graphicalCurve'] = self.extract_curve_features(
+                    self.find_style(reaction_glyph.getId(), self.glyph_style_types[glyph_type]))
+
+    def extract_species_reference_features(self, species_reference):
+        species_reference['features'] = {}
+        key = (species_reference['reaction'], species_reference['reaction_glyph_index'],
+               species_reference['species_reference_glyph_index'])
+        species_reference_glyph = self.species_reference_glyphs[key]
+        curve = LayoutAccessor.read_curve(species_reference_glyph.getCurve()) \
+            if species_reference_glyph.isSetCurve() else []
+        if curve:
+            curve_segment = curve[0]
+            species_reference['features']['startPoint'] = {'x': curve_segment['startX'], 'y': curve_segment['startY']}
+            if 'basePoint1X' in curve_segment and not curve_segment['startX'] == curve_segment['basePoint1X']:
+                species_reference['features']['startSlope'] = math.atan2(curve_segment['startY'] - curve_segment['basePoint1Y'], curve_segment['startX'] - curve_segment['basePoint1X'])
+            else:
+                species_reference['features']['startSlope'] = math.atan2(curve_segment['startY'] - curve_segment['endY'], curve_segment['startX'] - curve_segment['endX'])
+            curve_segment = curve[-1]
+            species_reference['features']['endPoint'] = {'x': curve_segment['endX'], 'y': curve_segment['endY']}
+            if 'basePoint2X' in curve_segment and not curve_segment['endX'] == curve_segment['basePoint2X']:
+                species_reference['features']['endSlope'] = math.atan2(curve_segment['endY'] - curve_segment['basePoint2Y'], curve_segment['endX'] - curve_segment['basePoint2X'])
+            else:
+                species_reference['features']['endSlope'] = math.atan2(curve_segment['endY'] - curve_segment['startY'], curve_segment['endX'] - curve_segment['startX'])
+            species_reference['features']['curve'] = self.geometry.add_curve(key, curve)
+            if self.extracts_render_features():
+                role = species_reference.get('role')
+                species_reference['features']['graphicalCurve'] = self.extract_curve_features(
+                    self.find_style(species_reference_glyph.getId(), self.glyph_style_types['species_reference'],
+                                    role))
+
+    def extract_additional_graphical_object_features(self, additional_graphical_object):
+        additional_graphical_object['features'] = self.extract_go_general_features(additional_graphical_object['referenceId'], additional_graphical_object['index'])
+        additional_graphical_object['texts'] = self.extract_go_text_features(additional_graphical_object['referenceId'], additional_graphical_object['index'])
+
+    def extract_color_features(self, color):
+        color['features'] = {}
+        color_definition = self.color_definitions[color['id']]
+        if color_definition.isSetValue():
+            color['features']['value'] = color_definition.getValue()
+        else:
+            color['features']['value'] = "#ffffff"
+
+    def extract_gradient_features(self, gradient):
+        gradient_definition = self.gradient_definitions[gradient['id']]
+        gradient['features'] = {}
+        # get spread method
+        if gradient_definition.isSetSpreadMethod():
+            gradient['features']['spreadMethod'] = gradient_definition.getSpreadMethodString()
+
+        # get gradient stops
+        stops_ = []
+        for stop in gradient_definition.getListOfGradientStops():
+            stop_ = {}
+            # get offset
+            if stop.isSetOffset():
+                stop_['offset'] = {'abs': 0, 'rel': stop.getOffset().getRelativeValue()}
+
+            # get stop color
+            if stop.isSetStopColor():
+                stop_['color'] = stop.getStopColor()
+            stops_.append(stop_)
+        gradient['features']['stops'] = stops_
+
+        # linear gradient
+        if gradient_definition.getTypeCode() == libsbml.SBML_RENDER_LINEARGRADIENT:
+            gradient['features']['type'] = 'linear'
+            # get start
+            gradient['features']['start'] = \
+                {'x': {'abs': 0.0, 'rel': gradient_definition.getXPoint1().getRelativeValue()},
+                 'y': {'abs': 0.0, 'rel': gradient_definition.getYPoint1().getRelativeValue()}}
+            # get end
+            gradient['features']['end'] = \
+                {'x': {'abs': 0.0, 'rel': gradient_definition.getXPoint2().getRelativeValue()},
+                 'y': {'abs': 0.0, 'rel': gradient_definition.getYPoint2().getRelativeValue()}}
+        # radial gradient
+        elif gradient_definition.getTypeCode() == libsbml.SBML_RENDER_RADIALGRADIENT:
+            gradient['features']['type'] = 'radial'
+            # get center
+            gradient['features']['center'] = \
+                {'x': {'abs': 0.0, 'rel': gradient_definition.getCenterX().getRelativeValue()},
+                 'y': {'abs': 0.0, 'rel': gradient_definition.getCenterY().getRelativeValue()}}
+            # get focal
+            gradient['features']['focalPoint'] = \
+                {'x': {'abs': 0.0, 'rel': gradient_definition.getFocalPointX().getRelativeValue()},
+                 'y': {'abs': 0.0, 'rel': gradient_definition.getFocalPointY().getRelativeValue()}}
+            # get radius
+            gradient['features']['radius'] = {'abs': gradient_definition.getRadius().getAbsoluteValue(), 'rel': 0.0}
+
+    def extract_line_ending_features(self, line_ending):
+        line_ending_definition = self.line_ending_definitions[line_ending['id']]
+        bounding_box = LayoutAccessor.read_bounding_box(line_ending_definition.getBoundingBox())
+        line_ending['features'] = {}
+        line_ending['features']['boundingBox'] = {'x': bounding_box[0], 'y': bounding_box[1],
+                                                  'width': bounding_box[2], 'height': bounding_box[3]}
+        line_ending['features']['graphicalShape'] = self.extract_graphical_shape_features(
+            line_ending_definition.getGroup(), bounding_box[2], bounding_box[3])
+
+    def extract_go_general_features(self, entity_id, graphical_object_index):
+        glyph, glyph_type = self.glyphs[(entity_id, graphical_object_index)]
+        bounding_box = LayoutAccessor.read_bounding_box(glyph.getBoundingBox())
+        features = {'boundingBox': self.geometry.add_bounding_box((entity_id, graphical_object_index), *bounding_box)}
+        if self.extracts_render_features():
+            render_group = self.find_style(glyph.getId(), self.glyph_style_types[glyph_type])
+            features['graphicalShape'] = self.extract_graphical_shape_features(render_group, bounding_box[2],
+                                                                              bounding_box[3])
+
+        return features
+
+    def extract_go_text_features(self, entity_id, graphical_object_index):
+        text_features = []
+        glyph, glyph_type = self.glyphs[(entity_id, graphical_object_index)]
+        for text_glyph_index, text_glyph in enumerate(self.texts.get(glyph.getId(), [])):
+            bounding_box = LayoutAccessor.read_bounding_box(text_glyph.getBoundingBox())
+            features = {'features': {'plainText': LayoutAccessor.read_text(self.document.getModel(), self.entity_names,
+                                                                           text_glyph),
+                                     'boundingBox': self.geometry.add_bounding_box(
+                                         (entity_id, graphical_object_index, text_glyph_index), *bounding_box,
+                                         is_glyph=False)}}
+            if self.extracts_render_features():
+                render_group = self.find_style(text_glyph.getId(), self.text_glyph_style_types.get(glyph_type, self.text_glyph_style_types['species']))
+                features['features']['graphicalText'] = self.extract_text_features(render_group, bounding_box[3])
+            text_features.append(features)
+
+        return text_features
+
+    @staticmethod
+    def resolve(rel_abs_vector, dimension):
+        return rel_abs_vector.getAbsoluteValue() + 0.01 * rel_abs_vector.getRelativeValue() * dimension
+
+    def extract_text_features(self, render_group, height):
+        features = {}
+        if render_group is None:
+            return features
+        # get stroke color
+        if render_group.isSetStroke():
+            features['strokeColor'] = render_group.getStroke()
+        features.update(self.extract_font_features(render_group, height))
+
+        return features
+
+    def extract_font_features(self, text, height):
+        features = {}
+        # get font family
+        if text.isSetFontFamily():
+            features['fontFamily'] = text.getFontFamily()
+        # get font size
+        if text.isSetFontSize():
+            features['fontSize'] = {'abs': self.resolve(text.getFontSize(), height), 'rel': 0.0}
+        # get font weight
+        if text.isSetFontWeight():
+            features['fontWeight'] = text.getFontWeightAsString()
+        # get font style
+        if text.isSetFontStyle():
+            features['fontStyle'] = text.getFontStyleAsString()
+        # get horizontal text anchor
+        if text.isSetTextAnchor():
+            features['hTextAnchor'] = text.getTextAnchorAsString()
+        # get vertical text anchor
+        if text.isSetVTextAnchor():
+            features['vTextAnchor'] = text.getVTextAnchorAsString()
+
+        return features
+
+    def extract_graphical_shape_features(self, render_group, width, height):
+        graphical_shape_info = {}
+        if render_group is None:
+            graphical_shape_info['geometricShapes'] = []
+            return graphical_shape_info
+        geometric_shapes = list(render_group.getListOfElements())
+        # the stroke and fill not set on the render group are the ones of its first geometric shape
+        graphical_shape_info = self.extract_stroke_features(render_group, geometric_shapes[:1])
+        fill_owner = self.find_attribute_owner('isSetFill', [render_group] + geometric_shapes[:1])
+        if fill_owner:
+            graphical_shape_info['fillColor'] = fill_owner.getFill()
+        if render_group.isSetFillRule():
+            graphical_shape_info['fillRule'] = render_group.getFillRuleAsString()
+        graphical_shape_info['geometricShapes'] = []
+        for geometric_shape in geometric_shapes:
+            geometric_shape_info = self.extract_stroke_features(geometric_shape, [render_group])
+            if graphical_shape_info.get('strokeDashArray'):
+                geometric_shape_info['strokeDashArray'] = graphical_shape_info['strokeDashArray']
+            geometric_shape_info.update(self.extract_geometric_shape_exclusive_features(geometric_shape, render_group,
+                                                                                        width, height))
+            graphical_shape_info['geometricShapes'].append(geometric_shape_info)
+
+        return graphical_shape_info
+
+    @staticmethod
+    def find_attribute_owner(is_set_method, render_objects):
+        for render_object in render_objects:
+            if hasattr(render_object, is_set_method) and getattr(render_object, is_set_method)():
+                return render_object
+
+        return None
+
+    def extract_stroke_features(self, render_object, fallback_render_objects):
+        stroke_features = {}
+        # get stroke color
+        stroke_owner = self.find_attribute_owner('isSetStroke', [render_object] + fallback_render_objects)
+        if stroke_owner:
+            stroke_features['strokeColor'] = stroke_owner.getStroke()
+        # get stroke width
+        stroke_width_owner = self.find_attribute_owner('isSetStrokeWidth', [render_object] + fallback_render_objects)
+        if stroke_width_owner:
+            stroke_features['strokeWidth'] = stroke_width_owner.getStrokeWidth()
+        # get stroke dash array
+        if hasattr(render_object, 'getNumDashes') and render_object.getNumDashes():
+            stroke_features['strokeDashArray'] = tuple(render_object.getDashByIndex(d_index)
+                                                       for d_index in range(render_object.getNumDashes()))
+
+        return stroke_features
+
+    def extract_curve_features(self, render_group):
+        curve_features = {}
+        if render_group is not None:
+            curve_features = self.extract_stroke_features(render_group, [])
+
+        # get heads
+        curve_features['heads'] = {}
+        if render_group is not None:
+            if render_group.isSetStartHead():
+                curve_features['heads']['start'] = render_group.getStartHead()
+            elif render_group.isSetEndHead():
+                curve_features['heads']['end'] = render_group.getEndHead()
+
+        return curve_features
+
+    def extract_geometric_shape_exclusive_features(self, geometric_shape, render_group, width, height):
+        type_code = geometric_shape.getTypeCode()
+        if type_code == libsbml.SBML_RENDER_IMAGE:
+            return self.extract_image_shape_features(geometric_shape, width, height)
+        elif type_code == libsbml.SBML_RENDER_CURVE:
+            return self.extract_curve_shape_features(geometric_shape, width, height)
+        elif type_code == libsbml.SBML_RENDER_TEXT:
+            return self.extract_text_shape_features(geometric_shape, width, height)
+        elif type_code == libsbml.SBML_RENDER_RECTANGLE:
+            return self.extract_rectangle_shape_features(geometric_shape, render_group, width, height)
+        elif type_code == libsbml.SBML_RENDER_ELLIPSE:
+            return self.extract_ellipse_shape_features(geometric_shape, render_group, width, height)
+        elif type_code == libsbml.SBML_RENDER_POLYGON:
+            return self.extract_polygon_shape_features(geometric_shape, render_group, width, height)
+
+        return {'shape': "None"}
+
+    def extract_image_shape_features(self, image, width, height):
+        # set shape
+        image_shape_info = {'shape': "image"}
+        image_shape_info['x'] = {'abs': self.resolve(image.getX(), width), 'rel': 0.0}
+        image_shape_info['y'] = {'abs': self.resolve(image.getY(), height), 'rel': 0.0}
+        image_shape_info['width'] = {'abs': self.resolve(image.getWidth(), width), 'rel': 0.0}
+        image_shape_info['height'] = {'abs': self.resolve(image.getHeight(), height), 'rel': 0.0}
+        # get href
+        if image.isSetHref():
+            image_shape_info['href'] = image.getHref()
+
+        return image_shape_info
+
+    def extract_curve_shape_features(self, render_curve, width, height):
+        # set shape
+        curve_shape_info = {'shape': "renderCurve"}
+        curve_shape_info['vertices'] = self.extract_vertices(render_curve, width, height)
+
+        return curve_shape_info
+
+    def extract_text_shape_features(self, text, width, height):
+        # set shape
+        text_shape_info = {'shape': "text"}
+        text_shape_info['x'] = {'abs': self.resolve(text.getX(), width), 'rel': 0.0}
+        text_shape_info['y'] = {'abs': self.resolve(text.getY(), height), 'rel': 0.0}
+        text_shape_info.update(self.extract_font_features(text, height))
+
+        return text_shape_info
+
+    def extract_rectangle_shape_features(self, rectangle, render_group, width, height):
+        # set shape
+        rectangle_shape_info = {'shape': "rectangle"}
+        # get fill color
+        fill_owner = self.find_attribute_owner('isSetFill', [rectangle, render_group])
+        if fill_owner:
+            rectangle_shape_info['fillColor'] = fill_owner.getFill()
+        rectangle_shape_info['x'] = {'abs': self.resolve(rectangle.getX(), width), 'rel': 0.0}
+        rectangle_shape_info['y'] = {'abs': self.resolve(rectangle.getY(), height), 'rel': 0.0}
+        rectangle_shape_info['width'] = {'abs': self.resolve(rectangle.getWidth(), width), 'rel': 0.0}
+        rectangle_shape_info['height'] = {'abs': self.resolve(rectangle.getHeight(), height), 'rel': 0.0}
+        # get corner curvature radii
+        rectangle_shape_info['rx'] = {'abs': self.resolve(rectangle.getRX(), width), 'rel': 0.0}
+        rectangle_shape_info['ry'] = {'abs': self.resolve(rectangle.getRY(), height), 'rel': 0.0}
+        # get width/height ratio
+        if rectangle.isSetRatio():
+            rectangle_shape_info['ratio'] = rectangle.getRatio()
+
+        return rectangle_shape_info
+
+    def extract_ellipse_shape_features(self, ellipse, render_group, width, height):
+        # set shape
+        ellipse_shape_info = {'shape': "ellipse"}
+        # get fill color
+        fill_owner = self.find_attribute_owner('isSetFill', [ellipse, render_group])
+        if fill_owner:
+            ellipse_shape_info['fillColor'] = fill_owner.getFill()
+        ellipse_shape_info['cx'] = {'abs': self.resolve(ellipse.getCX(), width), 'rel': 0.0}
+        ellipse_shape_info['cy'] = {'abs': self.resolve(ellipse.getCY(), height), 'rel': 0.0}
+        ellipse_shape_info['rx'] = {'abs': self.resolve(ellipse.getRX(), width), 'rel': 0.0}
+        # ry defaults to rx
+        if ellipse.isSetRY():
+            ellipse_shape_info['ry'] = {'abs': self.resolve(ellipse.getRY(), height), 'rel': 0.0}
+        else:
+            ellipse_shape_info['ry'] = dict(ellipse_shape_info['rx'])
+        # get radius ratio
+        if ellipse.isSetRatio():
+            ellipse_shape_info['ratio'] = ellipse.getRatio()
+
+        return ellipse_shape_info
+
+    def extract_polygon_shape_features(self, polygon, render_group, width, height):
+        # set shape
+        polygon_shape_info = {'shape': "polygon"}
+        # get fill color
+        fill_owner = self.find_attribute_owner('isSetFill', [polygon, render_group])
+        if fill_owner:
+            polygon_shape_info['fillColor'] = fill_owner.getFill()
+        # get fill rule
+        if polygon.isSetFillRule():
+            polygon_shape_info['fillRule'] = polygon.getFillRuleAsString()
+        polygon_shape_info['vertices'] = self.extract_vertices(polygon, width, height)
+
+        return polygon_shape_info
+
+    def extract_vertices(self, geometric_shape, width, height):
+        vertices_ = []
+        for element in geometric_shape.getListOfElements():
+            vertex_ = {}
+            vertex_['renderPointX'] = {'abs': self.resolve(element.getX(), width), 'rel': 0.0}
+            vertex_['renderPointY'] = {'abs': self.resolve(element.getY(), height), 'rel': 0.0}
+            if element.getTypeCode() == libsbml.SBML_RENDER_CUBICBEZIER:
+                vertex_['basePoint1X'] = {'abs': self.resolve(element.getBasePoint1_x(), width), 'rel': 0.0}
+                vertex_['basePoint1Y'] = {'abs': self.resolve(element.getBasePoint1_y(), height), 'rel': 0.0}
+                vertex_['basePoint2X'] = {'abs': self.resolve(element.getBasePoint2_x(), width), 'rel': 0.0}
+                vertex_['basePoint2Y'] = {'abs': self.resolve(element.getBasePoint2_y(), height), 'rel': 0.0}
+            vertices_.append(vertex_)
+
+        return vertices_
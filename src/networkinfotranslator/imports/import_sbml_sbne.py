@@ -1,11 +1,20 @@
 from .import_base import NetworkInfoImportBase
+from ..text_fitting import truncate_text_to_width
+from ..tracing import traced, count_entities
+import sbne
 
 
 class NetworkInfoImportFromSBMLModelUsingLibSBNE(NetworkInfoImportBase):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, display_compartments_text_label=True,
+                 display_species_text_label=True, display_reactions_text_label=False, compact_entities=False,
+                 profile="full"):
+        super().__init__(compact_entities, profile)
+        self.display_compartments_text_label = display_compartments_text_label
+        self.display_species_text_label = display_species_text_label
+        self.display_reactions_text_label = display_reactions_text_label
         self.is_layout_modified = False
 
+    @traced("import.extract_info", count_entities)
     def extract_info(self, graph):
         super().extract_info(graph)
 
@@ -75,34 +84,29 @@ class NetworkInfoImportFromSBMLModelUsingLibSBNE(NetworkInfoImportBase):
 
     def add_compartment(self, network, compartment_object):
         if sbne.ne_go_isSetGlyphId(compartment_object):
-            compartment = self.extract_go_object_features(network, compartment_object)
-            self.compartments.append(compartment)
+            compartment = self.extract_go_object_features(network, compartment_object,
+                                                          self.display_compartments_text_label)
+            self.append_compartment(compartment)
 
     def add_species(self, network, species_object):
         if sbne.ne_go_isSetGlyphId(species_object):
-            species = self.extract_go_object_features(network, species_object)
+            species = self.extract_go_object_features(network, species_object, self.display_species_text_label)
 
             # set the compartment
             s_compartment = sbne.ne_spc_getCompartment(species_object)
-            if s_compartment:
-                for c in self.compartments:
-                    if s_compartment == c['referenceId']:
-                        species['compartment'] = c['referenceId']
-                        break
+            if s_compartment and self.find_compartment(s_compartment):
+                species['compartment'] = s_compartment
 
-            self.species.append(species)
+            self.append_species(species)
 
     def add_reaction(self, network, reaction_object):
         if sbne.ne_go_isSetGlyphId(reaction_object):
-            reaction = self.extract_go_object_features(network, reaction_object)
+            reaction = self.extract_go_object_features(network, reaction_object, self.display_reactions_text_label)
 
             # set the compartment
             r_compartment = sbne.ne_rxn_findCompartment(reaction_object)
-            if r_compartment:
-                for c in self.compartments:
-                    if r_compartment == c['referenceId']:
-                        reaction['compartment'] = c['referenceId']
-                        break
+            if r_compartment and self.find_compartment(r_compartment):
+                reaction['compartment'] = r_compartment
 
             # species references
             reaction['speciesReferences'] = []
@@ -118,28 +122,28 @@ class NetworkInfoImportFromSBMLModelUsingLibSBNE(NetworkInfoImportBase):
                         species_reference['role'] = sbne.ne_sr_getRoleAsString(species_reference_object)
                     reaction['speciesReferences'].append(species_reference)
 
-            self.reactions.append(reaction)
+            self.append_reaction(reaction)
 
     def add_color(self, color_object):
         color_ = {}
         if sbne.ne_ve_isSetId(color_object):
             color_['colorDefinition'] = color_object
             color_['id'] = sbne.ne_ve_getId(color_object)
-            self.colors.append(color_)
+            self.append_color(color_)
 
     def add_gradient(self, gradient_object):
         gradient_ = {}
         if sbne.ne_ve_isSetId(gradient_object):
             gradient_['gradientBase'] = gradient_object
             gradient_['id'] = sbne.ne_ve_getId(gradient_object)
-            self.gradients.append(gradient_)
+            self.append_gradient(gradient_)
 
     def add_line_ending(self, line_ending_object):
         line_ending_ = {}
         if sbne.ne_ve_isSetId(line_ending_object):
             line_ending_['lineEnding'] = line_ending_object
             line_ending_['id'] = sbne.ne_ve_getId(line_ending_object)
-            self.line_endings.append(line_ending_)
+            self.append_line_ending(line_ending_)
 
     def assign_entity_styles(self, veneer):
         # get compartments style from veneer
@@ -178,13 +182,15 @@ class NetworkInfoImportFromSBMLModelUsingLibSBNE(NetworkInfoImportBase):
                     species_reference['style'] = sbne.ne_ven_findStyle(veneer,
                                                                        species_reference['glyphObject'])
 
-    def extract_go_object_features(self, network, go_object):
+    def extract_go_object_features(self, network, go_object, display_text_label=True):
         features = {'glyphObject': go_object, 'referenceId': sbne.ne_ne_getId(go_object),
                     'id': sbne.ne_go_getGlyphId(go_object)}
         if sbne.ne_ne_isSetMetaId(go_object):
             features['metaId'] = sbne.ne_ne_getMetaId(go_object)
         # text
         features['texts'] = []
+        if not display_text_label:
+            return features
         for text_index in range(sbne.ne_go_getNumTexts(go_object)):
             text_object = sbne.ne_go_getText(go_object, text_index)
             if sbne.ne_go_isSetGlyphId(text_object):
@@ -909,16 +915,8 @@ class NetworkInfoImportFromSBMLModelUsingLibSBNE(NetworkInfoImportBase):
                 and 'graphicalText' in list(text_features.keys()) \
                 and 'fontFamily' in list(text_features['graphicalText'].keys()) \
                 and 'fontSize' in list(text_features['graphicalText'].keys()):
-            fp = FontProperties(family=text_features['graphicalText']['fontFamily'],
-                                size=text_features['graphicalText']['fontSize']['abs']
-                                     + 0.01 * text_features['graphicalText']['fontSize']['rel']
-                                     * text_features['boundingBox']['width'])
-            text_width, text_height, text_descent = TextToPath().get_text_width_height_descent(
-                s=text_features['plainText'],
-                prop=fp, ismath=False)
-            char_width = text_width / len(text_features['plainText'])
-            if text_width > text_features['boundingBox']['width'] - char_width:
-                while text_width > text_features['boundingBox']['width'] - char_width:
-                    text_features['plainText'] = text_features['plainText'][:-1]
-                    text_width -= char_width
-                text_features['plainText'] += "."
\ No newline at end of file
+            font_size = text_features['graphicalText']['fontSize']['abs'] \
+                + 0.01 * text_features['graphicalText']['fontSize']['rel'] * text_features['boundingBox']['width']
+            text_features['plainText'] = truncate_text_to_width(text_features['plainText'],
+                                                                text_features['graphicalText']['fontFamily'],
+                                                                font_size, text_features['boundingBox']['width'])
\ No newline at end of file
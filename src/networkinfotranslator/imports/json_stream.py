@@ -0,0 +1,121 @@
+import codecs
+import contextlib
+import io
+import json
+import os
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(source):
+    """loads a whole JSON document from a file name, JSON string, bytes or file object, with orjson if installed"""
+    with open_json_source(source) as json_file:
+        content = json_file.read()
+    if orjson:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def iter_json_items(source, streamed_keys=()):
+    """
+    Reads the top-level object of a JSON document from a file name, JSON string, bytes or file object as a stream.
+
+    Yields a (key, value) pair for each of its members, except for the members named in streamed_keys holding an
+    array, for which a (key, element) pair is yielded for each element of the array, so that only one element is
+    held in memory at a time.
+    """
+    with open_json_source(source) as json_file:
+        reader = JSONStreamReader(json_file)
+        reader.expect('{')
+        if reader.skip('}'):
+            return
+        while True:
+            key = reader.read_value()
+            reader.expect(':')
+            if key in streamed_keys and reader.skip('['):
+                if not reader.skip(']'):
+                    while True:
+                        yield key, reader.read_value()
+                        if not reader.skip(','):
+                            break
+                    reader.expect(']')
+            else:
+                yield key, reader.read_value()
+            if not reader.skip(','):
+                break
+        reader.expect('}')
+
+
+def open_json_source(source):
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    if isinstance(source, str):
+        if os.path.isfile(source):
+            return open(source, 'rb')
+        return io.StringIO(source)
+    # file objects are left open for the caller
+    return contextlib.nullcontext(source)
+
+
+class JSONStreamReader:
+    """Reads JSON values one at a time from a file object, keeping only the unread part of the current chunk"""
+    whitespace = " \t\n\r"
+
+    def __init__(self, json_file, chunk_size=64 * 1024):
+        self.json_file = json_file
+        self.chunk_size = chunk_size
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        # the keys repeated across the values are shared, as json.loads does within a whole document
+        self.keys = {}
+        self.json_decoder = json.JSONDecoder(object_pairs_hook=self.make_object)
+        self.buffer = ""
+        self.position = 0
+        self.at_end = False
+
+    def make_object(self, pairs):
+        return {self.keys.setdefault(key, key): value for key, value in pairs}
+
+    def read_chunk(self):
+        chunk = self.json_file.read(self.chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = self.text_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self.at_end = True
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+
+    def peek(self):
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in self.whitespace:
+                self.position += 1
+            if self.position < len(self.buffer) or self.at_end:
+                return self.buffer[self.position:self.position + 1]
+            self.read_chunk()
+
+    def skip(self, character):
+        if self.peek() == character:
+            self.position += 1
+            return True
+
+        return False
+
+    def expect(self, character):
+        if not self.skip(character):
+            raise ValueError("Expected '{}' in the JSON document, found '{}'".format(character, self.peek()))
+
+    def read_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.json_decoder.raw_decode(self.buffer, self.position)
+                # a value ending with the buffer, like a number, may go on in the next chunk
+                if end < len(self.buffer) or self.at_end:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.at_end:
+                    raise
+            self.read_chunk()
@@ -0,0 +1,116 @@
+import libsbml
+
+
+class LayoutAccessor:
+    """
+    Reads the glyphs of the layout of an SBML model in one pass and serves them from memory.
+
+    The libsbmlnetwork API is per attribute: every call crosses into the native library and looks the graphical
+    object up by its id, so reading a model attribute by attribute costs time quadratic in its size. The accessor
+    walks the layout objects of the model once with libsbml instead and keeps, for each glyph, its bounding box,
+    curve segments and texts, which the importer then reads with a single dict lookup per glyph.
+    """
+    def __init__(self, sbml, layout_index=0):
+        self.glyphs = {}
+        self.glyphs_by_id = {}
+        self.species_reference_curves = {}
+        document = libsbml.readSBMLFromString(sbml)
+        model = document.getModel()
+        if model is None:
+            return
+        layout_plugin = model.getPlugin('layout')
+        if layout_plugin is None or layout_index >= layout_plugin.getNumLayouts():
+            return
+        layout = layout_plugin.getLayout(layout_index)
+
+        # names of the model entities, which are the texts of the text glyphs without a text of their own
+        entity_names = {}
+        for entities in [model.getListOfCompartments(), model.getListOfSpecies(), model.getListOfReactions()]:
+            for entity in entities:
+                entity_names[entity.getId()] = entity.getName() if entity.isSetName() else entity.getId()
+
+        # texts of each graphical object
+        texts = {}
+        for text_glyph in layout.getListOfTextGlyphs():
+            texts.setdefault(text_glyph.getGraphicalObjectId(), []).append(self.read_text_glyph(model, entity_names,
+                                                                                                text_glyph))
+
+        for compartment_glyph in layout.getListOfCompartmentGlyphs():
+            self.add_glyph(compartment_glyph.getCompartmentId(), compartment_glyph, texts)
+        for species_glyph in layout.getListOfSpeciesGlyphs():
+            self.add_glyph(species_glyph.getSpeciesId(), species_glyph, texts)
+        for reaction_glyph in layout.getListOfReactionGlyphs():
+            reaction_id = reaction_glyph.getReactionId()
+            glyph = self.add_glyph(reaction_id, reaction_glyph, texts)
+            glyph['curve'] = self.read_curve(reaction_glyph.getCurve()) if reaction_glyph.isSetCurve() else []
+            for srg_index, species_reference_glyph in enumerate(reaction_glyph.getListOfSpeciesReferenceGlyphs()):
+                self.species_reference_curves[(reaction_id, glyph['index'], srg_index)] = \
+                    self.read_curve(species_reference_glyph.getCurve()) if species_reference_glyph.isSetCurve() else []
+        for additional_graphical_object in layout.getListOfAdditionalGraphicalObjects():
+            self.add_glyph(additional_graphical_object.getId(), additional_graphical_object, texts)
+
+    def add_glyph(self, entity_id, graphical_object, texts):
+        index = 0
+        while (entity_id, index) in self.glyphs:
+            index += 1
+        glyph = {'index': index, 'boundingBox': self.read_bounding_box(graphical_object.getBoundingBox()),
+                 'texts': texts.get(graphical_object.getId(), [])}
+        self.glyphs[(entity_id, index)] = glyph
+        self.glyphs_by_id[graphical_object.getId()] = glyph
+
+        return glyph
+
+    def get_glyph(self, entity_id, graphical_object_index):
+        glyph = self.glyphs.get((entity_id, graphical_object_index))
+        # glyphs are also found by their own id, like the empty species glyphs
+        if glyph is None and graphical_object_index == 0:
+            return self.glyphs_by_id.get(entity_id)
+
+        return glyph
+
+    def get_species_reference_curve(self, reaction_id, reaction_glyph_index, species_reference_glyph_index):
+        return self.species_reference_curves.get((reaction_id, reaction_glyph_index, species_reference_glyph_index))
+
+    @staticmethod
+    def read_bounding_box(bounding_box):
+        position = bounding_box.getPosition()
+        dimensions = bounding_box.getDimensions()
+        return (position.getXOffset(), position.getYOffset(), dimensions.getWidth(), dimensions.getHeight())
+
+    @staticmethod
+    def read_curve(curve):
+        curve_segments = []
+        for segment in curve.getListOfCurveSegments():
+            start = segment.getStart()
+            end = segment.getEnd()
+            curve_segment = {'startX': start.getXOffset(), 'startY': start.getYOffset(),
+                             'endX': end.getXOffset(), 'endY': end.getYOffset()}
+            if segment.getTypeCode() == libsbml.SBML_LAYOUT_CUBICBEZIER:
+                base_point_1 = segment.getBasePoint1()
+                base_point_2 = segment.getBasePoint2()
+                curve_segment['basePoint1X'] = base_point_1.getXOffset()
+                curve_segment['basePoint1Y'] = base_point_1.getYOffset()
+                curve_segment['basePoint2X'] = base_point_2.getXOffset()
+                curve_segment['basePoint2Y'] = base_point_2.getYOffset()
+            curve_segments.append(curve_segment)
+
+        return curve_segments
+
+    def read_text_glyph(self, model, entity_names, text_glyph):
+        return {'plainText': self.read_text(model, entity_names, text_glyph),
+                'boundingBox': self.read_bounding_box(text_glyph.getBoundingBox())}
+
+    @staticmethod
+    def read_text(model, entity_names, text_glyph):
+        if text_glyph.isSetText():
+            return text_glyph.getText()
+        if text_glyph.isSetOriginOfTextId():
+            if text_glyph.getOriginOfTextId() in entity_names:
+                return entity_names[text_glyph.getOriginOfTextId()]
+            origin_of_text = model.getElementBySId(text_glyph.getOriginOfTextId())
+            if origin_of_text is not None:
+                if origin_of_text.isSetName():
+                    return origin_of_text.getName()
+                return origin_of_text.getId()
+
+        return text_glyph.getGraphicalObjectId()
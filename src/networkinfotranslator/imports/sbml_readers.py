@@ -0,0 +1,42 @@
+import importlib
+
+# the SBML importers by the name of the library they read SBML with, as (module, class) pairs imported on first use,
+# so that only the backend selected is loaded
+sbml_readers = {
+    "libsbmlnetwork": (".import_sbml", "NetworkInfoImportFromSBMLModel"),
+    "libsbne": (".import_sbml_sbne", "NetworkInfoImportFromSBMLModelUsingLibSBNE"),
+    # reads the layout and render information with libsbml, and needs libsbmlnetwork only for the models without them
+    "libsbml": (".import_sbml_libsbml", "NetworkInfoImportFromSBMLModelUsingLibSBML"),
+}
+default_sbml_reader = "libsbmlnetwork"
+
+
+def register_sbml_reader(name, module_name, class_name):
+    sbml_readers[name] = (module_name, class_name)
+
+
+def get_sbml_reader(name=None):
+    """returns the importer class of an SBML reader, raising an ImportError if its library is not installed"""
+    if name is None:
+        name = default_sbml_reader
+    if name not in sbml_readers:
+        raise ValueError("Unknown SBML reader \"{}\", expected one of {}".format(name, list(sbml_readers.keys())))
+    module_name, class_name = sbml_readers[name]
+
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
+
+def create_sbml_importer(sbml_reader=None, **import_options):
+    return get_sbml_reader(sbml_reader)(**import_options)
+
+
+def get_available_sbml_readers():
+    available_sbml_readers = []
+    for name in sbml_readers:
+        try:
+            get_sbml_reader(name)
+        except ImportError:
+            continue
+        available_sbml_readers.append(name)
+
+    return available_sbml_readers
@@ -0,0 +1,144 @@
+import os
+import tracemalloc
+from .tracing import StageCollector, MergedSpan
+try:
+    import resource
+except ImportError:
+    # not available on Windows
+    resource = None
+
+
+def read_proc_status_value(name):
+    # the size, in bytes, of a Vm entry of /proc/self/status, only available on Linux
+    try:
+        with open("/proc/self/status", encoding="ascii") as status_file:
+            for line in status_file:
+                if line.startswith(name + ":"):
+                    return 1024 * int(line.split()[1])
+    except OSError:
+        pass
+
+    return None
+
+
+def get_rss():
+    """returns the resident set size of the process in bytes, or None if it cannot be read on this platform"""
+    return read_proc_status_value("VmRSS")
+
+
+def get_peak_rss():
+    """returns the peak resident set size of the process in bytes, since it started or since reset_peak_rss"""
+    peak_rss = read_proc_status_value("VmHWM")
+    if peak_rss is None and resource is not None:
+        # in kilobytes on Linux, but in bytes on macOS
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if os.uname().sysname != "Darwin":
+            peak_rss *= 1024
+
+    return peak_rss
+
+
+def reset_peak_rss():
+    """resets the peak resident set size of the process to its current one, and returns whether it could (Linux only)"""
+    try:
+        with open("/proc/self/clear_refs", 'w', encoding="ascii") as clear_refs_file:
+            clear_refs_file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class MemoryStageCollector(StageCollector):
+    """
+    Collects the spans of the stages along with the memory they use:
+    - "allocated", the bytes allocated by Python during the stage and still allocated at its end, like the entities
+      of an importer or the layers of a figure exporter,
+    - "peak_allocated", the peak of the bytes allocated by Python during the stage above the ones allocated at its
+      start,
+    - "rss", the growth of the resident set size of the process during the stage, which also covers the memory
+      allocated by the native backends, like the Skia surfaces,
+    - "peak_rss", the peak resident set size of the process at the end of the stage.
+
+    With number_of_top_allocations, the lines of code allocating the most memory retained by each stage are listed in
+    "top_allocations" too, which takes a tracemalloc snapshot at its start and at its end. The peaks then also
+    count the snapshots held by the stages running.
+
+    Python allocations are traced with tracemalloc, which slows the stages down, so their times are not comparable
+    with the ones collected by a StageCollector, and are counted for the whole process, so the stages are to be run
+    on a single thread.
+    """
+
+    # the attributes reported as the maximum over the spans of a stage rather than as their sum
+    maximum_attributes = {"peak_allocated", "peak_rss"}
+
+    def __init__(self, number_of_top_allocations=0):
+        super().__init__()
+        self.number_of_top_allocations = number_of_top_allocations
+        self.started_tracemalloc = not tracemalloc.is_tracing()
+        if self.started_tracemalloc:
+            tracemalloc.start()
+        self.memory_at_start = {}
+        self.peaks = {}
+
+    def close(self):
+        if self.started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.started_tracemalloc = False
+
+    @staticmethod
+    def take_snapshot():
+        # without the memory allocated by the snapshots themselves
+        return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                                          tracemalloc.Filter(False, __file__)])
+
+    def update_peaks(self, peak):
+        # the peak since the last reset is passed on to the active spans before it is reset again
+        for active_span in self.get_active_spans():
+            if self.peaks.get(active_span, 0) < peak:
+                self.peaks[active_span] = peak
+
+    def start_span(self, name, attributes):
+        started_span = super().start_span(name, attributes)
+        if isinstance(started_span, MergedSpan):
+            return started_span
+        current, peak = tracemalloc.get_traced_memory()
+        self.update_peaks(peak)
+        tracemalloc.reset_peak()
+        snapshot = self.take_snapshot() if self.number_of_top_allocations else None
+        self.memory_at_start[started_span] = (current, get_rss(), snapshot)
+        self.peaks[started_span] = current
+
+        return started_span
+
+    def end_span(self, span, attributes):
+        if not isinstance(span, MergedSpan) and span in self.memory_at_start:
+            current, peak = tracemalloc.get_traced_memory()
+            self.update_peaks(peak)
+            start_current, start_rss, start_snapshot = self.memory_at_start.pop(span)
+            attributes = dict(attributes)
+            attributes['allocated'] = current - start_current
+            attributes['peak_allocated'] = self.peaks.pop(span) - start_current
+            rss = get_rss()
+            if rss is not None and start_rss is not None:
+                attributes['rss'] = rss - start_rss
+            peak_rss = get_peak_rss()
+            if peak_rss is not None:
+                attributes['peak_rss'] = peak_rss
+            if start_snapshot is not None:
+                statistics = self.take_snapshot().compare_to(start_snapshot, "lineno")
+                # the traced memory also counts the snapshot held since the start of the stage
+                attributes['allocated'] = sum(statistic.size_diff for statistic in statistics)
+                attributes['top_allocations'] = ["{}: {:+d} B".format(statistic.traceback[0], statistic.size_diff)
+                                                 for statistic in statistics[:self.number_of_top_allocations]]
+        super().end_span(span, attributes)
+
+    def format_breakdown(self):
+        lines = ["{:60s} {:>6s} {:>10s} {:>12s} {:>12s} {:>10s}".format(
+            "stage", "count", "time (s)", "alloc (MB)", "peak (MB)", "rss (MB)")]
+        for path, stage in self.get_breakdown().items():
+            lines.append("{:60s} {:6d} {:10.4f} {:12.3f} {:12.3f} {:10.3f}".format(
+                "  " * path.count("/") + path.rsplit("/", 1)[-1], stage['count'], stage['time'],
+                stage.get('allocated', 0) / 2 ** 20, stage.get('peak_allocated', 0) / 2 ** 20,
+                stage.get('rss', 0) / 2 ** 20))
+
+        return "\n".join(lines)
@@ -1,40 +1,203 @@
-from .imports.import_sbml import NetworkInfoImportFromSBMLModel
-from .imports.import_network_editor import NetworkInfoImportFromNetworkEditor
-from .exports.export_sbml import NetworkInfoExportToSBMLModel
-from .exports.export_network_editor import NetworkInfoExportToNetworkEditor
-from .exports.export_cytoscapejs import NetworkInfoExportToCytoscapeJs
-from .exports.export_figure_skia import NetworkInfoExportToSkia
-from .exports.export_escher import NetworkInfoExportToEscher
+from .imports.sbml_readers import create_sbml_importer, get_available_sbml_readers, default_sbml_reader
+from .exports.fan_out_export import export_graph_info, get_exporter_class_name, get_target_file_name
+from .exports.output_cache import OutputCache, get_output_cache, get_target_export_options
+import importlib
+import io
+import json
+import time
+
+# the importer and exporter classes of the package by name, as (module, name) pairs imported on first use, so that
+# importing the package does not load the native backends (libsbml, libsbmlnetwork, skia, PIL) of the unused ones
+lazy_attributes = {
+    "NetworkInfoImportFromSBMLModel": (".imports.import_sbml", "NetworkInfoImportFromSBMLModel"),
+    "NetworkInfoImportFromNetworkEditor": (".imports.import_network_editor", "NetworkInfoImportFromNetworkEditor"),
+    "import_sbml_models": (".imports.batch_import", "import_sbml_models"),
+    "load_imported_info": (".imports.batch_import", "load_imported_info"),
+    "NetworkInfoExportToSBMLModel": (".exports.export_sbml", "NetworkInfoExportToSBMLModel"),
+    "NetworkInfoExportToNetworkEditor": (".exports.export_network_editor", "NetworkInfoExportToNetworkEditor"),
+    "NetworkInfoExportToCytoscapeJs": (".exports.export_cytoscapejs", "NetworkInfoExportToCytoscapeJs"),
+    "NetworkInfoExportToSkia": (".exports.export_figure_skia", "NetworkInfoExportToSkia"),
+    "NetworkInfoExportToEscher": (".exports.export_escher", "NetworkInfoExportToEscher"),
+}
+
+
+def __getattr__(name):
+    if name in lazy_attributes:
+        module_name, attribute_name = lazy_attributes[name]
+        attribute = getattr(importlib.import_module(module_name, __package__), attribute_name)
+        globals()[name] = attribute
+        return attribute
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(lazy_attributes))
+
 
 def import_sbml_export_figure(import_file, file_name="", display_compartments_text_label=True,
-                              display_species_text_label=True, display_reactions_text_label=False):
-    import_from_sbml = NetworkInfoImportFromSBMLModel(display_compartments_text_label, display_species_text_label,
-                                                      display_reactions_text_label)
+                              display_species_text_label=True, display_reactions_text_label=False, sbml_reader=None,
+                              cache=None):
+    """
+    Imports an SBML model and exports it as a figure to the file, in the format of its extension (png, jpg, pdf or
+    svg, png by default).
+
+    With a cache, an OutputCache or the name of its directory, a figure already exported to a file from the same
+    model and options is copied from it without importing the model.
+    """
+    import_options = {'display_compartments_text_label': display_compartments_text_label,
+                      'display_species_text_label': display_species_text_label,
+                      'display_reactions_text_label': display_reactions_text_label}
+    cache = get_output_cache(cache)
+    cache_key = None
+    # without a file name, the figure is not written anywhere and so is not cached either
+    if cache is not None and file_name:
+        file_format = file_name.split(".")[-1]
+        cache_key = cache.make_output_key(import_file, "NetworkInfoExportToSkia",
+                                          dict(import_options, sbml_reader=sbml_reader or default_sbml_reader),
+                                          get_target_export_options(file_format if file_format in ["jpg", "pdf", "svg"]
+                                                                    else "png", file_name))
+        if cache_key is not None and cache.load_file(cache_key, file_name):
+            return
+    import_from_sbml = create_sbml_importer(sbml_reader, **import_options)
     import_from_sbml.extract_info(import_file)
+    from .exports.export_figure_skia import NetworkInfoExportToSkia
     export_to_figure = NetworkInfoExportToSkia()
     export_to_figure.extract_graph_info(import_from_sbml)
     export_to_figure.export(file_name)
+    if cache_key is not None:
+        cache.store_file(cache_key, file_name)
 
 
 def import_sbml_export_pil_image(import_file, display_compartments_text_label=True,
-                                 display_species_text_label=True, display_reactions_text_label=False):
-    import_from_sbml = NetworkInfoImportFromSBMLModel(display_compartments_text_label, display_species_text_label,
-                                                        display_reactions_text_label)
+                                 display_species_text_label=True, display_reactions_text_label=False,
+                                 sbml_reader=None, cache=None):
+    import_options = {'display_compartments_text_label': display_compartments_text_label,
+                      'display_species_text_label': display_species_text_label,
+                      'display_reactions_text_label': display_reactions_text_label}
+    cache = get_output_cache(cache)
+    cache_key = None
+    if cache is not None:
+        # the image is cached as a png, which keeps its pixels and mode
+        cache_key = cache.make_output_key(import_file, "NetworkInfoExportToSkia",
+                                          dict(import_options, sbml_reader=sbml_reader or default_sbml_reader),
+                                          {'format': "pil_image"})
+        content = cache.load(cache_key) if cache_key is not None else None
+        if content is not None:
+            from PIL import Image as PIL_Image
+            image = PIL_Image.open(io.BytesIO(content))
+            image.load()
+            return image
+    import_from_sbml = create_sbml_importer(sbml_reader, **import_options)
     import_from_sbml.extract_info(import_file)
+    from .exports.export_figure_skia import NetworkInfoExportToSkia
     export_to_figure = NetworkInfoExportToSkia()
     export_to_figure.extract_graph_info(import_from_sbml)
-    return export_to_figure.export_as_pil_image()
+    image = export_to_figure.export_as_pil_image()
+    if cache_key is not None:
+        content = io.BytesIO()
+        image.save(content, "PNG")
+        cache.store(cache_key, content.getvalue())
+    return image
 
-def import_network_editor_export_sbml(import_file, export_file=""):
+def import_network_editor_export_sbml(import_file, export_file="", cache=None):
+    cache = get_output_cache(cache)
+    cache_key = None
+    if cache is not None:
+        # the SBML document written to the file is the one returned as a string without one
+        cache_key = cache.make_output_key(import_file, "NetworkInfoExportToSBMLModel")
+        content = cache.load(cache_key) if cache_key is not None else None
+        if content is not None:
+            if export_file == "":
+                return content.decode("utf8")
+            with open(export_file.split('.')[0] + ".xml", 'wb') as sbml_file:
+                sbml_file.write(content)
+            # as libsbml.writeSBMLToFile on success
+            return 1
+    from .imports.import_network_editor import NetworkInfoImportFromNetworkEditor
+    from .exports.export_sbml import NetworkInfoExportToSBMLModel
     import_from_network_editor = NetworkInfoImportFromNetworkEditor()
     import_from_network_editor.extract_info(import_file)
     export_to_sbml = NetworkInfoExportToSBMLModel()
     export_to_sbml.extract_graph_info(import_from_network_editor)
-    return export_to_sbml.export(export_file)
+    result = export_to_sbml.export(export_file)
+    if cache_key is not None:
+        if export_file == "":
+            cache.store(cache_key, result.encode("utf8"))
+        elif result == 1:
+            cache.store_file(cache_key, export_file.split('.')[0] + ".xml")
+    return result
 
-def import_sbml_export_network_editor(import_file, export_file=""):
-    import_from_sbml = NetworkInfoImportFromSBMLModel()
+def import_sbml_export_network_editor(import_file, export_file="", sbml_reader=None, cache=None):
+    cache = get_output_cache(cache)
+    cache_key = None
+    if cache is not None:
+        # the graph returned without a file is named "file_graph" rather than after the file
+        cache_key = cache.make_output_key(import_file, "NetworkInfoExportToNetworkEditor",
+                                          {'sbml_reader': sbml_reader or default_sbml_reader},
+                                          get_target_export_options("network_editor", export_file))
+        content = cache.load(cache_key) if cache_key is not None else None
+        if content is not None:
+            if export_file == "":
+                return json.loads(content)
+            with open(export_file.split('.')[0] + ".json", 'wb') as json_file:
+                json_file.write(content)
+            return None
+    import_from_sbml = create_sbml_importer(sbml_reader)
     import_from_sbml.extract_info(import_file)
+    from .exports.export_network_editor import NetworkInfoExportToNetworkEditor
     export_to_network_editor = NetworkInfoExportToNetworkEditor()
     export_to_network_editor.extract_graph_info(import_from_sbml)
-    return export_to_network_editor.export(export_file)
\ No newline at end of file
+    result = export_to_network_editor.export(export_file)
+    if cache_key is not None:
+        if export_file == "":
+            cache.store(cache_key, json.dumps(result).encode("utf8"))
+        else:
+            cache.store_file(cache_key, export_file.split('.')[0] + ".json")
+    return result
+
+
+def import_sbml_export_targets(import_file, targets, file_name, display_compartments_text_label=True,
+                               display_species_text_label=True, display_reactions_text_label=False,
+                               sbml_reader=None, max_workers=None, use_processes=False, cache=None):
+    """
+    Imports an SBML model once and exports it to each of the target formats ("png", "jpg", "pdf", "cytoscapejs",
+    "network_editor", "escher", "sbml") concurrently, writing the files named after file_name.
+
+    With a cache, an OutputCache or the name of its directory, the files already exported from the same model and
+    options are copied from it, and the model is only imported if some of the targets are not cached.
+
+    Returns the time the import took in seconds ("import_time") and the result of each target ("targets"),
+    as returned by export_graph_info, with "cached" set to True for the ones copied from the cache.
+    """
+    targets = list(dict.fromkeys(targets))
+    import_options = {'display_compartments_text_label': display_compartments_text_label,
+                      'display_species_text_label': display_species_text_label,
+                      'display_reactions_text_label': display_reactions_text_label}
+    cache = get_output_cache(cache)
+    cache_keys = {}
+    results = {}
+    if cache is not None:
+        for target in targets:
+            start = time.perf_counter()
+            target_file_name = get_target_file_name(file_name, target)
+            cache_keys[target] = cache.make_output_key(
+                import_file, get_exporter_class_name(target),
+                dict(import_options, sbml_reader=sbml_reader or default_sbml_reader),
+                get_target_export_options(target, target_file_name))
+            if cache_keys[target] is not None and cache.load_file(cache_keys[target], target_file_name):
+                results[target] = {'file_name': target_file_name, 'error': None,
+                                   'time': time.perf_counter() - start, 'cached': True}
+    import_time = 0.0
+    exported_targets = [target for target in targets if target not in results]
+    if exported_targets:
+        start = time.perf_counter()
+        import_from_sbml = create_sbml_importer(sbml_reader, **import_options)
+        import_from_sbml.extract_info(import_file)
+        import_time = time.perf_counter() - start
+        for target, result in export_graph_info(import_from_sbml, exported_targets, file_name, max_workers,
+                                                use_processes).items():
+            if cache_keys.get(target) is not None and result['error'] is None:
+                cache.store_file(cache_keys[target], result['file_name'])
+            results[target] = result
+
+    return {'import_time': import_time, 'targets': {target: results[target] for target in targets}}
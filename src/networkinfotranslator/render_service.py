@@ -0,0 +1,451 @@
+import argparse
+import bisect
+import json
+import multiprocessing
+import queue
+import signal
+import threading
+import time
+import traceback
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from .imports.sbml_readers import create_sbml_importer, get_sbml_reader, default_sbml_reader
+from .exports.output_cache import get_output_cache
+
+# the content types of the responses by the format the models are rendered to
+render_formats = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "pdf": "application/pdf",
+    "svg": "image/svg+xml",
+    "network_editor": "application/json",
+    "cytoscapejs": "application/json",
+}
+
+# the exporters the models are rendered with by format, which are part of the keys of the cached renderings
+render_exporters = {
+    "network_editor": "NetworkInfoExportToNetworkEditor",
+    "cytoscapejs": "NetworkInfoExportToCytoscapeJs",
+}
+
+# the upper bounds, in seconds, of the buckets of the latency histograms
+latency_bucket_bounds = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf")]
+
+
+class ServiceBusyError(Exception):
+    pass
+
+
+class RenderError(Exception):
+    """raised with the traceback of the error raised in the worker process while rendering a model"""
+    pass
+
+
+class LatencyHistogram:
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(latency_bucket_bounds)
+        self.count = 0
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, latency):
+        with self.lock:
+            self.bucket_counts[bisect.bisect_left(latency_bucket_bounds, latency)] += 1
+            self.count += 1
+            self.sum += latency
+
+    def get_quantile(self, quantile):
+        # the upper bound of the bucket the quantile falls in
+        rank = quantile * self.count
+        cumulative_count = 0
+        for bucket_bound, bucket_count in zip(latency_bucket_bounds, self.bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank:
+                return bucket_bound
+
+        return latency_bucket_bounds[-1]
+
+    def to_dict(self):
+        with self.lock:
+            buckets = {}
+            cumulative_count = 0
+            for bucket_bound, bucket_count in zip(latency_bucket_bounds, self.bucket_counts):
+                cumulative_count += bucket_count
+                buckets[str(bucket_bound)] = cumulative_count
+            return {'count': self.count, 'sum': self.sum, 'buckets': buckets,
+                    'p50': self.get_quantile(0.5), 'p90': self.get_quantile(0.9), 'p99': self.get_quantile(0.99)}
+
+
+def warm_up_worker(sbml_reader):
+    # loads the backends and the default typeface once per worker process, so that the first request it serves does
+    # not pay for them
+    # an interrupt stops the service, which terminates the workers itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    get_sbml_reader(sbml_reader)
+    from .imports import import_network_editor
+    from .exports import export_figure_skia, export_network_editor, export_cytoscapejs
+    export_figure_skia.get_typeface("sans-serif", "normal", "normal")
+
+
+def render_model(model, file_format, sbml_reader=None, import_options=None):
+    """
+    Imports a model, given as the content of an SBML or a network editor JSON file, and renders it to the format.
+
+    Returns the content of the rendered file and the times its import ("import_time") and export ("export_time")
+    took in seconds.
+    """
+    start = time.perf_counter()
+    if model.lstrip()[:1] == "{":
+        from .imports.import_network_editor import NetworkInfoImportFromNetworkEditor
+        graph_info = NetworkInfoImportFromNetworkEditor()
+        graph_info.extract_info(json.loads(model))
+    else:
+        graph_info = create_sbml_importer(sbml_reader, **(import_options or {}))
+        graph_info.extract_info(model)
+    import_time = time.perf_counter() - start
+    if file_format == "network_editor":
+        from .exports.export_network_editor import NetworkInfoExportToNetworkEditor
+        exporter = NetworkInfoExportToNetworkEditor()
+        exporter.extract_graph_info(graph_info)
+        content = json.dumps(exporter.export()).encode("utf8")
+    elif file_format == "cytoscapejs":
+        from .exports.export_cytoscapejs import NetworkInfoExportToCytoscapeJs
+        exporter = NetworkInfoExportToCytoscapeJs()
+        exporter.extract_graph_info(graph_info)
+        content = json.dumps(exporter.export_as_dict()).encode("utf8")
+    else:
+        from .exports.export_figure_skia import NetworkInfoExportToSkia
+        exporter = NetworkInfoExportToSkia()
+        exporter.extract_graph_info(graph_info)
+        content = exporter.export_as_bytes(file_format)
+
+    return content, {'import_time': import_time, 'export_time': time.perf_counter() - start - import_time}
+
+
+def run_render_worker(connection, sbml_reader, import_options):
+    # renders the models sent by the service one at a time, until it is sent None
+    warm_up_worker(sbml_reader)
+    while True:
+        task = connection.recv()
+        if task is None:
+            return
+        try:
+            connection.send((True, render_model(*task, sbml_reader, import_options)))
+        except Exception:
+            connection.send((False, traceback.format_exc()))
+
+
+class RenderWorker:
+
+    def __init__(self, sbml_reader, import_options):
+        self.connection, worker_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=run_render_worker,
+                                               args=(worker_connection, sbml_reader, import_options), daemon=True)
+        self.process.start()
+        worker_connection.close()
+
+    def render(self, model, file_format, timeout=None):
+        """
+        Returns the content of the model rendered to the format and the times its import and export took, raising a
+        multiprocessing.TimeoutError if it is not rendered within timeout seconds, after which the worker is to be
+        killed, or a RenderError with the error raised while rendering it.
+        """
+        self.connection.send((model, file_format))
+        if not self.connection.poll(timeout):
+            raise multiprocessing.TimeoutError()
+        try:
+            rendered, result = self.connection.recv()
+        except EOFError:
+            self.process.join()
+            # a worker killed by the system running out of memory exits with the code -9 (SIGKILL)
+            raise RenderError("The worker process exited with code {}".format(self.process.exitcode))
+        if not rendered:
+            raise RenderError(result)
+
+        return result
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except OSError:
+            pass
+        self.process.join(5)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class RenderService:
+    """
+    Renders models on a pool of worker processes started, and warmed up, along with the service.
+
+    A request is given up on once it has waited for a worker and been rendered for timeout seconds. A worker still
+    rendering it is then killed, and a new one started in its place, as a model may hang a native backend beyond the
+    reach of an exception, so that the workers of the pool stay available to the requests admitted.
+
+    At most max_queue_length requests are admitted at a time, the ones rendered and the ones waiting for a worker,
+    and the others are rejected with a ServiceBusyError right away rather than queued without bound, so that a client
+    can back off or go to another instance.
+
+    With a cache, an OutputCache or the name of its directory, the renderings are cached by the content of the model,
+    and a hit is returned from the cache by the service itself, without being queued for a worker.
+    """
+
+    def __init__(self, number_of_workers=None, max_queue_length=None, sbml_reader=None, timeout=None, cache=None,
+                 **import_options):
+        self.number_of_workers = number_of_workers or multiprocessing.cpu_count()
+        self.max_queue_length = max_queue_length or 4 * self.number_of_workers
+        self.sbml_reader = sbml_reader
+        self.timeout = timeout
+        self.import_options = import_options
+        self.cache = get_output_cache(cache)
+        self.workers = [RenderWorker(sbml_reader, import_options) for worker_index in range(self.number_of_workers)]
+        self.idle_workers = queue.Queue()
+        for worker in self.workers:
+            self.idle_workers.put(worker)
+        self.workers_lock = threading.Lock()
+        self.closed = False
+        self.admitted_requests = threading.BoundedSemaphore(self.max_queue_length)
+        self.number_of_admitted_requests = 0
+        self.number_of_rejected_requests = 0
+        self.number_of_failed_requests = 0
+        self.number_of_timed_out_requests = 0
+        self.number_of_replaced_workers = 0
+        self.number_of_cache_hits = 0
+        self.number_of_cache_misses = 0
+        self.counts_lock = threading.Lock()
+        self.latency_histograms = {file_format: LatencyHistogram() for file_format in render_formats}
+        self.queue_histogram = LatencyHistogram()
+
+    def render(self, model, file_format="png"):
+        """
+        Returns the content of the model rendered to the format, raising a ServiceBusyError if the queue is full,
+        a multiprocessing.TimeoutError if the rendering took longer than the timeout of the service, or a RenderError
+        with the traceback of the error raised while rendering it.
+        """
+        if file_format not in render_formats:
+            raise ValueError("Unknown format \"{}\", expected one of {}".format(file_format, list(render_formats.keys())))
+        start = time.perf_counter()
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_output_key(
+                model.encode("utf8"), render_exporters.get(file_format, "NetworkInfoExportToSkia"),
+                dict(self.import_options, sbml_reader=self.sbml_reader or default_sbml_reader),
+                {'render_format': file_format})
+            content = self.cache.load(cache_key)
+            with self.counts_lock:
+                if content is not None:
+                    self.number_of_cache_hits += 1
+                else:
+                    self.number_of_cache_misses += 1
+            if content is not None:
+                self.latency_histograms[file_format].observe(time.perf_counter() - start)
+                return content
+        if not self.admitted_requests.acquire(blocking=False):
+            with self.counts_lock:
+                self.number_of_rejected_requests += 1
+            raise ServiceBusyError("The queue of the service is full ({} requests)".format(self.max_queue_length))
+        try:
+            with self.counts_lock:
+                self.number_of_admitted_requests += 1
+            content, times = self.render_on_worker(model, file_format, start)
+        except multiprocessing.TimeoutError:
+            with self.counts_lock:
+                self.number_of_timed_out_requests += 1
+            raise
+        except Exception:
+            with self.counts_lock:
+                self.number_of_failed_requests += 1
+            raise
+        finally:
+            with self.counts_lock:
+                self.number_of_admitted_requests -= 1
+            self.admitted_requests.release()
+        latency = time.perf_counter() - start
+        self.latency_histograms[file_format].observe(latency)
+        self.queue_histogram.observe(max(0.0, latency - times['import_time'] - times['export_time']))
+        if cache_key is not None:
+            self.cache.store(cache_key, content)
+
+        return content
+
+    def render_on_worker(self, model, file_format, start):
+        try:
+            worker = self.idle_workers.get(timeout=self.get_remaining_time(start))
+        except queue.Empty:
+            raise multiprocessing.TimeoutError()
+        try:
+            return worker.render(model, file_format, self.get_remaining_time(start))
+        except RenderError:
+            # raised by the worker, unless it exited
+            if not worker.is_alive():
+                worker = self.replace_worker(worker)
+            raise
+        except (multiprocessing.TimeoutError, OSError):
+            # the worker may still be rendering the model
+            worker = self.replace_worker(worker)
+            raise
+        finally:
+            self.idle_workers.put(worker)
+
+    def get_remaining_time(self, start):
+        if self.timeout is None:
+            return None
+
+        return max(0.0, self.timeout - (time.perf_counter() - start))
+
+    def replace_worker(self, worker):
+        worker.kill()
+        with self.workers_lock:
+            if self.closed:
+                return worker
+            new_worker = RenderWorker(self.sbml_reader, self.import_options)
+            self.workers[self.workers.index(worker)] = new_worker
+        with self.counts_lock:
+            self.number_of_replaced_workers += 1
+
+        return new_worker
+
+    def get_metrics(self):
+        with self.counts_lock:
+            metrics = {'number_of_workers': self.number_of_workers, 'max_queue_length': self.max_queue_length,
+                       'admitted_requests': self.number_of_admitted_requests,
+                       'rejected_requests': self.number_of_rejected_requests,
+                       'failed_requests': self.number_of_failed_requests,
+                       'timed_out_requests': self.number_of_timed_out_requests,
+                       'replaced_workers': self.number_of_replaced_workers}
+            if self.cache is not None:
+                metrics['cache'] = {'hits': self.number_of_cache_hits, 'misses': self.number_of_cache_misses}
+        metrics['latency'] = {file_format: histogram.to_dict()
+                              for file_format, histogram in self.latency_histograms.items() if histogram.count}
+        # the time the requests spent waiting for a worker and being sent to it and back
+        metrics['queue'] = self.queue_histogram.to_dict()
+
+        return metrics
+
+    def close(self):
+        with self.workers_lock:
+            self.closed = True
+            workers = list(self.workers)
+        for worker in workers:
+            worker.kill()
+
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves POST /render?format=<format> with the content of an SBML or a network editor JSON file as body,
+    GET /metrics and GET /health.
+    """
+
+    max_body_size = 64 * 1024 * 1024
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/health":
+            self.send_json(200, {'status': "ok"})
+        elif path == "/metrics":
+            self.send_json(200, self.server.render_service.get_metrics())
+        else:
+            self.send_json(404, {'error': "Unknown path \"{}\"".format(path)})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != "/render":
+            self.send_json(404, {'error': "Unknown path \"{}\"".format(url.path)})
+            return
+        file_format = parse_qs(url.query).get("format", ["png"])[0]
+        if file_format not in render_formats:
+            self.send_json(400, {'error': "Unknown format \"{}\", expected one of {}".format(
+                file_format, list(render_formats.keys()))})
+            return
+        body_size = int(self.headers.get("Content-Length", 0))
+        if body_size > self.max_body_size:
+            self.send_json(413, {'error': "The model is larger than {} bytes".format(self.max_body_size)})
+            return
+        model = self.rfile.read(body_size).decode("utf8")
+        try:
+            content = self.server.render_service.render(model, file_format)
+        except ServiceBusyError as error:
+            self.send_json(503, {'error': str(error)}, {'Retry-After': "1"})
+        except multiprocessing.TimeoutError:
+            self.send_json(504, {'error': "Rendering the model timed out"})
+        except Exception:
+            self.send_json(422, {'error': traceback.format_exc()})
+        else:
+            self.send_content(200, render_formats[file_format], content)
+
+    def send_json(self, status, content, headers=None):
+        self.send_content(status, "application/json", json.dumps(content).encode("utf8"), headers)
+
+    def send_content(self, status, content_type, content, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class RenderServer(ThreadingHTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, address, render_service, quiet=False):
+        super().__init__(address, RenderRequestHandler)
+        self.render_service = render_service
+        self.quiet = quiet
+
+
+def serve(host="127.0.0.1", port=8000, number_of_workers=None, max_queue_length=None, sbml_reader=None,
+          timeout=None, quiet=False, cache_dir=None, cache_max_size=256 * 1024 * 1024):
+    render_service = RenderService(number_of_workers, max_queue_length, sbml_reader, timeout,
+                                   get_output_cache(cache_dir, cache_max_size))
+    server = RenderServer((host, port), render_service, quiet)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        render_service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="networkinfotranslator-service",
+        description="Serves the rendering of SBML and network editor JSON models over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes (default: number of cores)")
+    parser.add_argument("--max-queue-length", type=int, default=None,
+                        help="number of requests admitted at a time, beyond which they are rejected with a 503 "
+                             "(default: 4 per worker)")
+    parser.add_argument("--timeout", type=float, default=None, help="seconds after which a request is given up on")
+    parser.add_argument("--sbml-reader", default=None, help="library to read the SBML models with")
+    parser.add_argument("--cache-dir", default=None,
+                        help="directory to cache the renderings in, served without rendering the models again")
+    parser.add_argument("--cache-max-size", type=int, default=256,
+                        help="size in MB beyond which the least recently used renderings are removed from the cache "
+                             "(default: 256)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not log the requests")
+    arguments = parser.parse_args(argv)
+    serve(arguments.host, arguments.port, arguments.workers, arguments.max_queue_length, arguments.sbml_reader,
+          arguments.timeout, arguments.quiet, arguments.cache_dir, arguments.cache_max_size * 1024 * 1024)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import bisect
+import functools
+import itertools
+from matplotlib import font_manager
+try:
+    from matplotlib.ft2font import LoadFlags
+    LOAD_NO_HINTING = LoadFlags.NO_HINTING
+except ImportError:
+    # matplotlib < 3.10
+    from matplotlib.ft2font import LOAD_NO_HINTING
+
+
+@functools.lru_cache(maxsize=256)
+def get_font_file(font_family):
+    return font_manager.findfont(font_manager.FontProperties(family=[font_family]))
+
+
+@functools.lru_cache(maxsize=65536)
+def get_character_advance(character, font_family, font_size):
+    """returns the advance width, in points, of the glyph of a character in the font"""
+    font = font_manager.get_font(get_font_file(font_family))
+    font.set_size(font_size, 72)
+
+    return font.load_char(ord(character), flags=LOAD_NO_HINTING).linearHoriAdvance / 65536
+
+
+def measure_text_width(plain_text, font_family, font_size):
+    return sum(get_character_advance(character, font_family, font_size) for character in plain_text)
+
+
+def truncate_text_to_width(plain_text, font_family, font_size, width, ellipsis="."):
+    """
+    Returns the text if it fits in the width, or else its longest prefix that fits in the width followed by the
+    ellipsis.
+
+    The advance of each glyph is measured once per font and size, as the labels of a model share a small set of
+    characters, and the cut point is binary searched among the widths of the prefixes of the text.
+    """
+    prefix_widths = list(itertools.accumulate(get_character_advance(character, font_family, font_size)
+                                              for character in plain_text))
+    if not prefix_widths or prefix_widths[-1] <= width:
+        return plain_text
+    available_width = width - measure_text_width(ellipsis, font_family, font_size)
+
+    return plain_text[:bisect.bisect_right(prefix_widths, available_width)] + ellipsis
@@ -0,0 +1,229 @@
+import functools
+import json
+import threading
+import time
+
+
+class Tracer:
+    """
+    The interface of the tracers, told when each stage of the import and export of a model starts and ends.
+
+    start_span is given the name of the stage and a dict of attributes (like the number of entities it handles), and
+    returns a handle passed back to end_span along with the attributes known once the stage is done. This default
+    tracer ignores them, and the stages skip calling it while enabled is False.
+    """
+
+    enabled = False
+
+    def start_span(self, name, attributes):
+        return None
+
+    def end_span(self, span, attributes):
+        pass
+
+
+tracer = Tracer()
+
+
+def get_tracer():
+    return tracer
+
+
+def set_tracer(new_tracer):
+    """sets the tracer told about the stages of all the imports and exports, and returns the previous one"""
+    global tracer
+    previous_tracer = tracer
+    tracer = new_tracer if new_tracer is not None else Tracer()
+
+    return previous_tracer
+
+
+class span:
+    """traces the block it is used as a context manager around as a stage of the name"""
+
+    __slots__ = ("name", "attributes", "tracer", "handle")
+
+    def __init__(self, name, attributes=None):
+        self.name = name
+        self.attributes = attributes
+        self.tracer = None
+        self.handle = None
+
+    def __enter__(self):
+        if tracer.enabled:
+            self.tracer = tracer
+            self.handle = tracer.start_span(self.name, self.attributes or {})
+        return self
+
+    def __exit__(self, exception_type, exception, exception_traceback):
+        if self.tracer is not None:
+            self.tracer.end_span(self.handle, {'error': exception_type.__name__} if exception_type else {})
+            self.tracer = None
+            self.handle = None
+
+
+def traced(name, get_attributes=None):
+    """
+    Decorates a method to trace each of its calls as a stage of the name, with the attributes get_attributes returns
+    for the object once the call is done.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def traced_method(self, *args, **kwargs):
+            if not tracer.enabled:
+                return method(self, *args, **kwargs)
+            current_tracer = tracer
+            handle = current_tracer.start_span(name, {'class': type(self).__name__})
+            attributes = {}
+            try:
+                return method(self, *args, **kwargs)
+            except BaseException as error:
+                attributes['error'] = type(error).__name__
+                raise
+            finally:
+                if get_attributes is not None:
+                    attributes.update(get_attributes(self))
+                current_tracer.end_span(handle, attributes)
+
+        return traced_method
+
+    return decorator
+
+
+def count_entities(graph_info):
+    if graph_info is None:
+        return {}
+
+    return {'compartments': len(graph_info.compartments), 'species': len(graph_info.species),
+            'reactions': len(graph_info.reactions),
+            'additional_graphical_objects': len(graph_info.additional_graphical_objects)}
+
+
+def count_exported_entities(exporter):
+    return count_entities(exporter.graph_info)
+
+
+class Span:
+
+    __slots__ = ("name", "parent", "attributes", "start", "duration", "children_duration")
+
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.parent = parent
+        self.attributes = dict(attributes)
+        self.start = time.perf_counter()
+        self.duration = None
+        self.children_duration = 0.0
+
+    def get_path(self):
+        if self.parent is None:
+            return self.name
+
+        return self.parent.get_path() + "/" + self.name
+
+
+class MergedSpan:
+
+    __slots__ = ("span",)
+
+    def __init__(self, merged_into_span):
+        self.span = merged_into_span
+
+
+class StageCollector(Tracer):
+    """
+    Collects the spans of the stages, nested in the ones running when they started on the same thread, to break the
+    time down per stage.
+
+    A span starting within one of the same name, as with a traced method calling the one it overrides, is merged
+    into it.
+    """
+
+    enabled = True
+    # the attributes reported as the maximum over the spans of a stage rather than as their sum
+    maximum_attributes = set()
+
+    def __init__(self):
+        self.spans = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def get_active_spans(self):
+        if not hasattr(self.local, "active_spans"):
+            self.local.active_spans = []
+
+        return self.local.active_spans
+
+    def start_span(self, name, attributes):
+        active_spans = self.get_active_spans()
+        parent = active_spans[-1] if active_spans else None
+        if parent is not None and parent.name == name:
+            return MergedSpan(parent)
+        started_span = Span(name, parent, attributes)
+        active_spans.append(started_span)
+
+        return started_span
+
+    def end_span(self, span, attributes):
+        if isinstance(span, MergedSpan):
+            span.span.attributes.update(attributes)
+            return
+        active_spans = self.get_active_spans()
+        if span in active_spans:
+            del active_spans[active_spans.index(span):]
+        span.duration = time.perf_counter() - span.start
+        span.attributes.update(attributes)
+        if span.parent is not None:
+            span.parent.children_duration += span.duration
+        with self.lock:
+            self.spans.append(span)
+
+    def clear(self):
+        with self.lock:
+            self.spans = []
+
+    def get_breakdown(self):
+        """
+        Returns, by the path of the stages (the names of the spans from the outermost one, joined by "/"), the number
+        of spans ("count"), their total time ("time") and the part of it not spent in nested stages ("self_time") in
+        seconds, and the sum of their numeric attributes, like the entity counts, or their maximum for the
+        maximum_attributes. The other attributes, but the class, are the ones of the last span.
+        """
+        with self.lock:
+            spans = list(self.spans)
+        breakdown = {}
+        # the stages are listed in the order they first started in, so that each one follows the stage it is nested in
+        start_times = {}
+        for collected_span in spans:
+            path = collected_span.get_path()
+            start_times[path] = min(start_times.get(path, collected_span.start), collected_span.start)
+            stage = breakdown.setdefault(path, {'count': 0, 'time': 0.0, 'self_time': 0.0})
+            stage['count'] += 1
+            stage['time'] += collected_span.duration
+            stage['self_time'] += collected_span.duration - collected_span.children_duration
+            for attribute_name, attribute_value in collected_span.attributes.items():
+                if not isinstance(attribute_value, (int, float)) or isinstance(attribute_value, bool):
+                    if attribute_name != 'class':
+                        stage[attribute_name] = attribute_value
+                elif attribute_name in self.maximum_attributes:
+                    stage[attribute_name] = max(stage.get(attribute_name, attribute_value), attribute_value)
+                else:
+                    stage[attribute_name] = stage.get(attribute_name, 0) + attribute_value
+
+        return {path: breakdown[path] for path in sorted(breakdown, key=start_times.get)}
+
+    def format_breakdown(self):
+        lines = ["{:60s} {:>6s} {:>10s} {:>10s}".format("stage", "count", "time (s)", "self (s)")]
+        for path, stage in self.get_breakdown().items():
+            lines.append("{:60s} {:6d} {:10.4f} {:10.4f}".format(
+                "  " * path.count("/") + path.rsplit("/", 1)[-1], stage['count'], stage['time'],
+                stage['self_time']))
+
+        return "\n".join(lines)
+
+    def dump(self, file_name=None):
+        """writes the breakdown as JSON to the file, or returns it as a JSON string if no file name is given"""
+        if file_name is None:
+            return json.dumps(self.get_breakdown(), indent=1)
+        with open(file_name, 'w', encoding='utf8') as breakdown_file:
+            json.dump(self.get_breakdown(), breakdown_file, indent=1)